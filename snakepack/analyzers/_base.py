@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Union
+from collections import OrderedDict
+from typing import Union, Optional, Dict, Mapping, Callable, TypeVar, Any
 
 from snakepack.assets import Asset, AssetGroup
 
+T = TypeVar('T')
+
 
 class Analyzer(ABC):
     class Analysis(ABC):
-        pass
+        @property
+        def memo_tables(self) -> Mapping[str, MemoTable]:
+            # memo tables belong to the analysis, they're freed along with it
+            return self.__dict__.setdefault('_memo_tables', {})
+
+        def get_memo_table(self, name: str, maxsize: Optional[int] = None) -> MemoTable:
+            memo_tables = self.__dict__.setdefault('_memo_tables', {})
+
+            if name not in memo_tables:
+                memo_tables[name] = MemoTable(maxsize=maxsize)
+
+            return memo_tables[name]
+
+        def clear_memo_tables(self):
+            for memo_table in self.memo_tables.values():
+                memo_table.clear()
 
 
 class PostLoadingAnalyzer(Analyzer, ABC):
@@ -26,4 +45,69 @@ class SubjectAnalyzer(Analyzer, ABC):
         raise NotImplementedError
 
     class Analysis(ABC):
-        pass
\ No newline at end of file
+        pass
+
+
+class MemoTable:
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: Dict[Any, Any] = OrderedDict() if maxsize is not None else {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get_or_compute(self, key: Any, compute: Callable[[], T]) -> T:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            value = compute()
+            self._entries[key] = value
+
+            if self._maxsize is not None and len(self._entries) > self._maxsize:
+                # bounded tables evict their least recently used entry
+                self._entries.popitem(last=False)
+
+            return value
+
+        self._hits += 1
+
+        if self._maxsize is not None:
+            self._entries.move_to_end(key)
+
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+def memoize(method: Optional[Callable[..., T]] = None, *, maxsize: Optional[int] = None):
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self: Analyzer.Analysis, *args, **kwargs) -> T:
+            key = (args, tuple(sorted(kwargs.items()))) if len(kwargs) > 0 else args
+
+            return self.get_memo_table(name, maxsize).get_or_compute(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    if method is None:
+        return decorator
+
+    return decorator(method)
@@ -1,34 +1,142 @@
-import functools
+from __future__ import annotations
+
+import ast
 import sys
+from collections import Counter
 from pathlib import Path
 from site import getsitepackages
-from typing import Union, Iterable, Mapping, Optional
+from typing import Union, Iterable, Mapping, Optional, FrozenSet, Sequence, Dict, Set, List, Any, Tuple
 
-from libcst import VisitorMetadataProvider, Import, ImportFrom, Module, MetadataWrapper, CSTNode, ImportStar, Name, \
-    Attribute
-from modulegraph.find_modules import find_modules, parse_mf_results
-from modulegraph.modulegraph import ModuleGraph, Package, Node, Extension, SourceModule
-from stdlib_list import stdlib_list
+from libcst import VisitorMetadataProvider, Import, ImportFrom, Module, MetadataWrapper, CSTNode
+from libcst.metadata import ProviderT
 
 from snakepack.analyzers import Analyzer
-from snakepack.analyzers._base import SubjectAnalyzer, PostLoadingAnalyzer
+from snakepack.analyzers._base import SubjectAnalyzer, PostLoadingAnalyzer, memoize
 from snakepack.analyzers.python import PythonModuleCstAnalyzer
 from snakepack.assets import Asset, AssetGroup, FileContentSource
 from snakepack.assets.python import PythonPackage, PythonApplication, PythonModule, PythonModuleCst
 from snakepack.config.types import FullyQualifiedPythonName
 
 
+_DYNAMIC_NAMESPACE_NAMES = frozenset({'globals', 'vars', 'exec', 'eval', '__dict__', 'setattr'})
+
+# fields holding the identifiers that are Name nodes in the concrete syntax tree
+_IDENTIFIER_FIELDS = {
+    ast.Name: 'id',
+    ast.Attribute: 'attr',
+    ast.FunctionDef: 'name',
+    ast.AsyncFunctionDef: 'name',
+    ast.ClassDef: 'name',
+    ast.arg: 'arg',
+    ast.keyword: 'arg',
+    ast.ExceptHandler: 'name',
+    ast.Global: 'names',
+    ast.Nonlocal: 'names'
+}
+
+if sys.version_info >= (3, 10):
+    _IDENTIFIER_FIELDS.update({
+        ast.MatchAs: 'name',
+        ast.MatchStar: 'name',
+        ast.MatchMapping: 'rest',
+        ast.MatchClass: 'kwd_attrs'
+    })
+
+# nodes that may contain statements, import statements can't be nested in any other nodes
+_STATEMENT_BLOCK_TYPES = (ast.mod, ast.stmt, ast.excepthandler)
+
+if sys.version_info >= (3, 10):
+    _STATEMENT_BLOCK_TYPES += (ast.match_case,)
+
+_EMPTY_MODULE = Module(body=[])
+
+ImportStmt = Union[ast.Import, ast.ImportFrom]
+
+
+class ImportGraph:
+    def __init__(self):
+        self._nodes: Dict[str, ImportGraph.Node] = {}
+        self._imported_nodes: Dict[ImportGraph.Node, List[ImportGraph.Node]] = {}
+        self._referrers: Dict[ImportGraph.Node, List[ImportGraph.Node]] = {}
+
+    @property
+    def nodes(self) -> Iterable[ImportGraph.Node]:
+        return self._nodes.values()
+
+    def get_node(self, identifier: str) -> Optional[ImportGraph.Node]:
+        return self._nodes.get(identifier)
+
+    def add_node(self, node: ImportGraph.Node) -> ImportGraph.Node:
+        self._nodes[node.identifier] = node
+        self._imported_nodes[node] = []
+        self._referrers[node] = []
+
+        return node
+
+    def add_edge(self, importing_node: ImportGraph.Node, imported_node: ImportGraph.Node):
+        if importing_node is imported_node or imported_node in self._imported_nodes[importing_node]:
+            return
+
+        self._imported_nodes[importing_node].append(imported_node)
+        self._referrers[imported_node].append(importing_node)
+
+    def get_imported_nodes(self, node: ImportGraph.Node) -> Iterable[ImportGraph.Node]:
+        return self._imported_nodes[node]
+
+    def get_referrers(self, node: ImportGraph.Node) -> Iterable[ImportGraph.Node]:
+        return self._referrers[node]
+
+    class Node:
+        def __init__(self, identifier: str, filename: Optional[str] = None):
+            self._identifier = identifier
+            self._filename = filename
+
+        @property
+        def identifier(self) -> str:
+            return self._identifier
+
+        @property
+        def filename(self) -> Optional[str]:
+            return self._filename
+
+        def __repr__(self) -> str:
+            return f'{type(self).__name__}({self._identifier!r}, {self._filename!r})'
+
+    class SourceModule(Node):
+        pass
+
+    class Package(SourceModule):
+        pass
+
+    class Extension(Node):
+        pass
+
+
 class ImportGraphAnalyzer(PostLoadingAnalyzer):
-    def __init__(self, module_graph: Optional[ModuleGraph] = None, node_map: Optional[Mapping[PythonModule, Node]] = None):
+    def __init__(
+            self,
+            module_graph: Optional[ImportGraph] = None,
+            node_map: Optional[Mapping[PythonModule, ImportGraph.Node]] = None
+    ):
         self._module_graph = module_graph
-        self._modules_metadata = None
+        self._import_stmts = None
         self._node_map = node_map
 
     def analyse_assets(self, asset_group: AssetGroup) -> Analyzer.Analysis:
-        self._modules_metadata = {
-            asset: asset.content.metadata_wrapper.resolve_many(self.CST_PROVIDERS)
+        # modules that aren't transformed aren't parsed, their imports are unknown to the analysis
+        modules = [
+            asset
             for asset in asset_group.deep_assets
-            if isinstance(asset, PythonModule)
+            if isinstance(asset, PythonModule) and not asset.pass_through
+        ]
+        # the facts are computed from the modules' abstract syntax trees, which are much cheaper to parse
+        self._import_stmts = {
+            module: _get_module_import_stmts(module)
+            for module in modules
+        }
+        self._exported_names = {
+            module: _get_module_exported_names(module)
+            for module in modules
         }
         self._asset_group = asset_group
 
@@ -38,16 +146,18 @@ class ImportGraphAnalyzer(PostLoadingAnalyzer):
         return self.Analysis(
             module_graph=self._module_graph,
             node_map=self._node_map,
-            import_metadata=self._modules_metadata
+            import_stmts=self._import_stmts,
+            exported_names=self._exported_names
         )
 
     class Analysis(Analyzer.Analysis):
         def __init__(
                 self,
-                import_metadata: Mapping[PythonModule, Mapping[CSTNode, Iterable[Union[Import, ImportFrom]]]],
-                module_graph: Optional[ModuleGraph] = None,
-                node_map: Optional[Mapping[PythonModule, Node]] = None,
-
+                import_metadata: Optional[Mapping[PythonModule, Mapping[CSTNode, Iterable[Union[Import, ImportFrom]]]]] = None,
+                module_graph: Optional[ImportGraph] = None,
+                node_map: Optional[Mapping[PythonModule, ImportGraph.Node]] = None,
+                exported_names: Optional[Mapping[PythonModule, Optional[FrozenSet[str]]]] = None,
+                import_stmts: Optional[Mapping[PythonModule, Sequence[ImportStmt]]] = None
         ):
             self._module_graph = module_graph
             self._node_map = node_map
@@ -59,130 +169,226 @@ class ImportGraphAnalyzer(PostLoadingAnalyzer):
                     value: key for key, value in node_map.items()
                 }
 
-            self._import_metadata = import_metadata
+            if import_stmts is None:
+                # only the import statements are kept, the metadata is keyed on the module's tree which can then be freed
+                import_stmts = {
+                    module: _get_import_stmts(metadata)
+                    for module, metadata in import_metadata.items()
+                }
+
+            self._import_stmts = dict(import_stmts)
+            self._exported_names = dict(exported_names) if exported_names is not None else {}
+            self._modules_by_name = {
+                _get_package_or_module_name(module.name): module
+                for module in self._import_stmts
+            }
+            self._resolving_star_imports: Set[str] = set()
 
         @property
         def import_graph_known(self) -> bool:
             return self._module_graph is not None
 
-        @functools.lru_cache()
+        @memoize
         def get_importing_modules(self, module: PythonModule, identifier: Optional[str] = None) -> Iterable[PythonModule]:
             assert self.import_graph_known
 
-            importing_nodes = self._module_graph.getReferers(self._node_map[module])
-            importing_modules = []
+            importers = self._get_importers(module)
 
-            for importing_node in importing_nodes:
-                if importing_node is None:
-                    continue
+            if identifier is None:
+                return list(importers.keys())
 
-                if isinstance(importing_node, Extension):
-                    importing_modules.append(importing_node)
-                    continue
+            # unknown imports and imports of the whole module are assumed to import the identifier
+            return [
+                importing_module
+                for importing_module, imported_identifiers in importers.items()
+                if imported_identifiers is None or identifier in imported_identifiers or '*' in imported_identifiers
+            ]
 
-                if importing_node not in self._inverted_node_map:
-                    # this is the case with the entry point module (Script <> SourceModule), match on filename instead
-                    for map_key in self._inverted_node_map:
-                        if map_key.filename == importing_node.filename:
-                            importing_modules.append(self._inverted_node_map[map_key])
-                            break
+        def get_identifiers_imported_from(
+                self,
+                importing_module: PythonModule,
+                module: PythonModule
+        ) -> Optional[FrozenSet[str]]:
+            identifiers_by_module = self._get_identifiers_imported_by(importing_module)
 
-                    continue
+            if identifiers_by_module is None:
+                return None
 
-                importing_modules.append(self._inverted_node_map[importing_node])
+            return identifiers_by_module.get(_get_package_or_module_name(module.name), frozenset())
 
-            importing_modules = [
-                    self._inverted_node_map[importing_node] if not isinstance(importing_node, Extension) else importing_node
-                    for importing_node in importing_nodes if importing_node is not None
-                ]
+        def identifier_imported_in_module(self, identifier: str, module: PythonModule) -> bool:
+            imported_identifiers = self._get_imported_identifiers(module)
 
-            if identifier is None:
-                return importing_modules
+            # unknown imports and star imports of unknown modules are assumed to import the identifier
+            return imported_identifiers is None or identifier in imported_identifiers or '*' in imported_identifiers
+
+        def get_imported_modules(self, module: PythonModule) -> Iterable[PythonModule]:
+            assert self.import_graph_known
+
+            return self._get_imported_modules_index().get(module, [])
+
+        def get_imported_module_names(self, module: PythonModule) -> Optional[FrozenSet[str]]:
+            import_stmts = self._get_import_stmts(module)
+
+            if import_stmts is None:
+                return None
+
+            return frozenset(_get_imported_module_names(module.name, import_stmts))
+
+        def update_module(self, module: PythonModule):
+            # module content was reloaded, resolve its imports again
+            self._import_stmts[module] = _get_module_import_stmts(module)
+            self._exported_names[module] = _get_module_exported_names(module)
+            self._modules_by_name[_get_package_or_module_name(module.name)] = module
+            self.clear_memo_tables()
+
+        def snapshot(self, modules: Optional[Iterable[PythonModule]] = None) -> ImportGraphAnalyzer.SnapshotAnalysis:
+            if modules is None:
+                modules = self._import_stmts.keys()
+
+            importers = {}
+            imported_identifiers = {}
+
+            for module in modules:
+                if self.import_graph_known:
+                    importers[module.name] = {
+                        (
+                            importing_module.name
+                            if not isinstance(importing_module, ImportGraph.Extension)
+                            else importing_module.identifier
+                        ): module_identifiers
+                        for importing_module, module_identifiers in self._get_importers(module).items()
+                    }
+
+                imported_identifiers[module.name] = self._get_imported_identifiers(module)
 
-            modules_importing_identifier = []
+            return ImportGraphAnalyzer.SnapshotAnalysis(
+                import_graph_known=self.import_graph_known,
+                importers=importers,
+                imported_identifiers=imported_identifiers
+            )
 
-            for importing_module in importing_modules:
-                if isinstance(importing_module, Extension):
-                    # cannot analyze C extensions, assume identifier is imported
-                    modules_importing_identifier.append(importing_module)
+        def _get_import_stmts(self, module: PythonModule) -> Optional[Sequence[ImportStmt]]:
+            return self._import_stmts.get(module)
+
+        @memoize
+        def _get_importers(self, module: PythonModule) -> Mapping[Any, Optional[FrozenSet[str]]]:
+            importers = {}
+
+            for importing_node in self._module_graph.get_referrers(self._node_map[module]):
+                if isinstance(importing_node, ImportGraph.Extension):
+                    # cannot analyze C extensions, assume all identifiers are imported
+                    importers[importing_node] = None
                     continue
 
-                if importing_module.content.cst not in self._import_metadata[importing_module]:
-                    # assume imported
-                    modules_importing_identifier.append(importing_module)
+                if importing_node not in self._inverted_node_map:
+                    # module isn't part of the loaded assets
                     continue
 
-                import_stmts = self._import_metadata[importing_module][ImportGraphAnalyzer.ImportProvider][importing_module.content.cst]
-                identifier_imported = False
+                importing_module = self._inverted_node_map[importing_node]
+                importers[importing_module] = self.get_identifiers_imported_from(importing_module, module)
+
+            return importers
 
-                for import_stmt in import_stmts:
-                    if isinstance(import_stmt, Import):
-                        for imported_name in import_stmt.names:
-                            name = imported_name.name.value if isinstance(imported_name.name, Name) else imported_name.name.attr.value
+        @memoize
+        def _get_imported_modules_index(self) -> Mapping[PythonModule, List[PythonModule]]:
+            imported_modules = {}
 
-                            if module.name == name:
-                                identifier_imported = True
-                                break
+            for imported_module in self._import_stmts:
+                for importing_module in self.get_importing_modules(imported_module):
+                    if importing_module is not imported_module:
+                        imported_modules.setdefault(importing_module, []).append(imported_module)
 
-                        if identifier_imported:
-                            break
-                    elif isinstance(import_stmt, ImportFrom):
-                        target_module = '.'.join(importing_module.name.split('.')[-1])
+            return imported_modules
 
-                        for relative_dot in import_stmt.relative:
-                            target_module = '.'.join(importing_module.name.split('.')[-1])
+        @memoize
+        def _get_identifiers_imported_by(self, importing_module: PythonModule) -> Optional[Mapping[str, FrozenSet[str]]]:
+            import_stmts = self._get_import_stmts(importing_module)
 
-                        target_module = f'{target_module}.{import_stmt.module}'
+            if import_stmts is None:
+                return None
 
-                        if target_module != module.name:
-                            continue
+            return _get_identifiers_imported_by_module(importing_module.name, import_stmts)
 
-                        if isinstance(import_stmt.names, ImportStar):
-                            identifier_imported = True
-                            break
+        @memoize
+        def _get_imported_identifiers(self, module: PythonModule) -> Optional[FrozenSet[str]]:
+            import_stmts = self._get_import_stmts(module)
 
-                        for imported_name in import_stmt.names:
-                            name = imported_name.value if isinstance(imported_name, Name) else imported_name.attr.value
+            if import_stmts is None:
+                return None
 
-                            if name == identifier:
-                                identifier_imported = True
-                                break
+            imported_identifiers = set()
 
-                        if identifier_imported:
-                            break
+            for import_stmt in import_stmts:
+                if _is_star_import(import_stmt):
+                    # expand star imports to the names the imported module exports
+                    exported_names = self._get_star_exported_names(_resolve_import_from(module.name, import_stmt))
+                    imported_identifiers.update(exported_names if exported_names is not None else {'*'})
+                else:
+                    imported_identifiers.update(_get_identifiers_imported_in([import_stmt]))
 
-                    if identifier_imported:
-                        break
+            return frozenset(imported_identifiers)
 
-                if identifier_imported:
-                    modules_importing_identifier.append(importing_module)
+        @memoize
+        def _get_star_exported_names(self, module_name: str) -> Optional[FrozenSet[str]]:
+            module = self._modules_by_name.get(module_name)
+            exported_names = self._exported_names.get(module) if module is not None else None
 
-            return modules_importing_identifier
+            if exported_names is None or module_name in self._resolving_star_imports:
+                # cyclic star imports are resolved as unknown
+                return None
 
-        @functools.lru_cache()
-        def identifier_imported_in_module(self, identifier: str, module: PythonModule) -> bool:
-            if module.content.cst not in self._import_metadata[module][ImportGraphAnalyzer.ImportProvider]:
-                # assume imported
-                return True
+            exported_names = set(exported_names)
+            self._resolving_star_imports.add(module_name)
 
-            import_stmts = self._import_metadata[module][ImportGraphAnalyzer.ImportProvider][module.content.cst]
+            try:
+                for import_stmt in self._get_import_stmts(module):
+                    if _is_star_import(import_stmt):
+                        # names imported with a star import are exported again
+                        star_names = self._get_star_exported_names(_resolve_import_from(module.name, import_stmt))
 
-            for import_stmt in import_stmts:
-                if isinstance(import_stmt, ImportFrom):
-                    if isinstance(import_stmt.names, ImportStar):
-                        if not self.import_graph_known:
-                            # import graph not known and star import -- assume identifier imported
-                            return True
+                        if star_names is None:
+                            return None
+
+                        exported_names.update(star_names)
+            finally:
+                self._resolving_star_imports.discard(module_name)
 
-                        return True  # TODO
-                    else:
-                        for imported_name in import_stmt.names:
-                            name = imported_name.name.value if isinstance(imported_name.name, Name) else imported_name.name.attr.value
+            return frozenset(exported_names)
 
-                            if name == identifier:
-                                return True
+    class SnapshotAnalysis(Analyzer.Analysis):
+        def __init__(
+                self,
+                import_graph_known: bool,
+                importers: Mapping[str, Mapping[str, Optional[FrozenSet[str]]]],
+                imported_identifiers: Mapping[str, Optional[FrozenSet[str]]]
+        ):
+            self._import_graph_known = import_graph_known
+            self._importers = importers
+            self._imported_identifiers = imported_identifiers
+
+        @property
+        def import_graph_known(self) -> bool:
+            return self._import_graph_known
+
+        def get_importing_modules(self, module: PythonModule, identifier: Optional[str] = None) -> Iterable[str]:
+            assert self.import_graph_known
 
-            return False
+            importers = self._importers[module.name]
+
+            if identifier is None:
+                return list(importers.keys())
+
+            return [
+                importing_module
+                for importing_module, imported_identifiers in importers.items()
+                if imported_identifiers is None or identifier in imported_identifiers or '*' in imported_identifiers
+            ]
+
+        def identifier_imported_in_module(self, identifier: str, module: PythonModule) -> bool:
+            imported_identifiers = self._imported_identifiers.get(module.name)
+
+            return imported_identifiers is None or identifier in imported_identifiers or '*' in imported_identifiers
 
     class ImportProvider(VisitorMetadataProvider[Iterable[Union[Import, ImportFrom]]]):
         def __init__(self, *args, **kwargs):
@@ -205,4 +411,206 @@ class ImportGraphAnalyzer(PostLoadingAnalyzer):
         ImportProvider
     }
 
-    __config_name__ = 'import_graph'
\ No newline at end of file
+    __config_name__ = 'import_graph'
+
+
+def _get_import_stmts(metadata: Mapping[ProviderT, Mapping[CSTNode, Any]]) -> Sequence[ImportStmt]:
+    # metadata is keyed on the module's original CST, which transformers may have replaced since
+    import_stmts = next(iter(metadata[ImportGraphAnalyzer.ImportProvider].values()), [])
+
+    # import statements parsed on their own only use syntax any interpreter supports
+    return [
+        ast.parse(_EMPTY_MODULE.code_for_node(import_stmt).strip()).body[0]
+        for import_stmt in import_stmts
+    ]
+
+
+def _get_module_import_stmts(module: PythonModule) -> Sequence[ImportStmt]:
+    try:
+        return _find_import_stmts(module.content.ast)
+    except SyntaxError:
+        # the module uses syntax the running interpreter doesn't support, resolve its imports from the CST
+        return _get_import_stmts(module.content.metadata_wrapper.resolve_many(ImportGraphAnalyzer.CST_PROVIDERS))
+
+
+def _get_module_exported_names(module: PythonModule) -> Optional[FrozenSet[str]]:
+    try:
+        return _get_exported_names(module.content.ast)
+    except SyntaxError:
+        return None
+
+
+def _find_import_stmts(module: ast.Module) -> Sequence[ImportStmt]:
+    import_stmts = []
+    nodes = [module]
+
+    # depth-first, so the import statements are in the order they appear in the module
+    while nodes:
+        node = nodes.pop()
+
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            import_stmts.append(node)
+        else:
+            nodes.extend(reversed([
+                child
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, _STATEMENT_BLOCK_TYPES)
+            ]))
+
+    return import_stmts
+
+
+def _is_star_import(import_stmt: ImportStmt) -> bool:
+    return isinstance(import_stmt, ast.ImportFrom) and import_stmt.names[0].name == '*'
+
+
+def _get_identifiers_imported_by_module(
+        importing_module_name: str,
+        import_stmts: Iterable[ImportStmt]
+) -> Mapping[str, FrozenSet[str]]:
+    identifiers = {}
+
+    for import_stmt in import_stmts:
+        if isinstance(import_stmt, ast.Import):
+            for imported_name in import_stmt.names:
+                name_path = imported_name.name.split('.')
+
+                for index in range(len(name_path)):
+                    # module and its packages imported as a whole, all their identifiers are accessible
+                    identifiers.setdefault('.'.join(name_path[:index + 1]), set()).add('*')
+        elif isinstance(import_stmt, ast.ImportFrom):
+            target_module = _resolve_import_from(importing_module_name, import_stmt)
+
+            if _is_star_import(import_stmt):
+                identifiers.setdefault(target_module, set()).add('*')
+                continue
+
+            for imported_name in import_stmt.names:
+                name = imported_name.name
+                identifiers.setdefault(target_module, set()).add(name)
+                # name may be a submodule imported as a whole, all its identifiers are accessible
+                identifiers.setdefault(f'{target_module}.{name}', set()).add('*')
+
+    return {
+        module_name: frozenset(module_identifiers)
+        for module_name, module_identifiers in identifiers.items()
+    }
+
+
+def _get_exported_names(module: ast.Module) -> Optional[FrozenSet[str]]:
+    # all names in the module are a superset of the names it binds globally, names that may be bound
+    # dynamically or listed in a non-literal __all__ make the exported names unknown
+    names = _count_names(module)
+
+    if not _DYNAMIC_NAMESPACE_NAMES.isdisjoint(names):
+        return None
+
+    if '__all__' in names:
+        if names['__all__'] != 1:
+            return None
+
+        return _get_all_names(module)
+
+    return frozenset(name for name in names if not name.startswith('_'))
+
+
+def _get_all_names(module: ast.Module) -> Optional[FrozenSet[str]]:
+    for statement in module.body:
+        if (
+                not isinstance(statement, ast.Assign)
+                or len(statement.targets) != 1
+                or not isinstance(statement.targets[0], ast.Name)
+                or statement.targets[0].id != '__all__'
+        ):
+            continue
+
+        if not isinstance(statement.value, (ast.List, ast.Tuple)):
+            return None
+
+        names = set()
+
+        for element in statement.value.elts:
+            if not isinstance(element, ast.Constant) or not isinstance(element.value, str):
+                return None
+
+            names.add(element.value)
+
+        return frozenset(names)
+
+    return None
+
+
+def _count_names(module: ast.Module) -> Counter:
+    names = Counter()
+
+    for node in ast.walk(module):
+        if isinstance(node, ast.alias):
+            if node.name != '*':
+                names.update(node.name.split('.'))
+
+            if node.asname is not None:
+                names[node.asname] += 1
+        elif isinstance(node, ast.ImportFrom):
+            if node.module is not None:
+                names.update(node.module.split('.'))
+        elif type(node) in _IDENTIFIER_FIELDS:
+            identifiers = getattr(node, _IDENTIFIER_FIELDS[type(node)])
+
+            if isinstance(identifiers, str):
+                names[identifiers] += 1
+            elif identifiers is not None:
+                names.update(identifiers)
+
+    return names
+
+
+def _get_package_or_module_name(module_name: str) -> str:
+    if module_name.endswith('.__init__'):
+        return module_name[:-len('.__init__')]
+
+    return module_name
+
+
+def _resolve_import_from(importing_module_name: str, import_stmt: ast.ImportFrom) -> str:
+    return _resolve_relative_module_name(importing_module_name, level=import_stmt.level or 0, module_name=import_stmt.module)
+
+
+def _resolve_relative_module_name(importing_module_name: str, level: int, module_name: Optional[str]) -> str:
+    if level == 0:
+        return module_name
+
+    # relative import, resolve against the package containing the importing module
+    package_path = importing_module_name.split('.')[:-1]
+    package_path = package_path[:len(package_path) - (level - 1)]
+
+    if module_name is not None:
+        package_path.append(module_name)
+
+    return '.'.join(package_path)
+
+
+def _get_imported_module_names(importing_module_name: str, import_stmts: Iterable[ImportStmt]) -> Iterable[str]:
+    for import_stmt in import_stmts:
+        if isinstance(import_stmt, ast.Import):
+            for imported_name in import_stmt.names:
+                yield imported_name.name
+        elif isinstance(import_stmt, ast.ImportFrom):
+            target_module = _resolve_import_from(importing_module_name, import_stmt)
+            yield target_module
+
+            if not _is_star_import(import_stmt):
+                for imported_name in import_stmt.names:
+                    # imported name may be a submodule
+                    yield f'{target_module}.{imported_name.name}'
+
+
+def _scan_imported_module_names(importing_module_name: str, source: bytes) -> Iterable[str]:
+    # same names as for a loaded module, without keeping its syntax tree around
+    return _get_imported_module_names(importing_module_name, _find_import_stmts(ast.parse(source)))
+
+
+def _get_identifiers_imported_in(import_stmts: Iterable[ImportStmt]) -> Iterable[str]:
+    for import_stmt in import_stmts:
+        if isinstance(import_stmt, ast.ImportFrom):
+            for imported_name in import_stmt.names:
+                yield imported_name.name
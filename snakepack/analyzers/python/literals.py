@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import functools
-from typing import Union, Optional, Tuple, Dict, Iterable, Sequence, List, Set
+from typing import Union, Optional, Tuple, Dict, Iterable, Sequence, List, Set, Mapping
 
 from boltons.iterutils import first, flatten
 from libcst import MetadataWrapper, Assign, AnnAssign, SimpleString, VisitorMetadataProvider, AugAssign, Name, \
-    BaseExpression, ConcatenatedString, CSTNode
+    BaseExpression, ConcatenatedString, CSTNode, Module
 from libcst.metadata import ScopeProvider, ExpressionContextProvider, ParentNodeProvider, Scope, GlobalScope
 
 from snakepack.analyzers import Analyzer
+from snakepack.analyzers._base import memoize
 from snakepack.analyzers.python import PythonModuleCstAnalyzer
 from snakepack.assets import Asset, AssetGroup
 from snakepack.assets.python import PythonModule, PythonModuleCst
@@ -23,47 +23,64 @@ class LiteralDuplicationAnalyzer(PythonModuleCstAnalyzer):
             raise NotImplementedError
 
     class Analysis(PythonModuleCstAnalyzer.Analysis):
-        @functools.lru_cache()
+        @memoize
         def get_occurrences(self, literal_node: SimpleString) -> Optional[int]:
             if literal_node not in self._metadata[LiteralDuplicationAnalyzer._LiteralDuplicationCountProvider]:
                 return None
 
             return self._metadata[LiteralDuplicationAnalyzer._LiteralDuplicationCountProvider][literal_node]
 
-        @functools.lru_cache()
+        @memoize
         def is_part_of_concatenated_string(self, literal_node: SimpleString) -> bool:
             return isinstance(self._metadata[ParentNodeProvider][literal_node], ConcatenatedString)
 
-        @functools.lru_cache()
         def get_preceding_assignments(
                 self,
                 literal_node: SimpleString,
                 scope: Scope
         ) -> Dict[str, Sequence[Union[Assign, AnnAssign, AugAssign]]]:
+            return self._get_preceding_assignments_in_scope(literal_node.value, scope)
+
+        @memoize
+        def _get_preceding_assignments_in_scope(
+                self,
+                literal_value: str,
+                scope: Scope
+        ) -> Optional[Dict[str, Sequence[Union[Assign, AnnAssign, AugAssign]]]]:
+            assignments = self._get_assignments_by_literal_value().get(literal_value)
+
+            if assignments is None:
+                return None
+
+            return {
+                key: value
+                for key, value in assignments.items()
+                if key in scope
+            }
+
+        @memoize
+        def _get_assignments_by_literal_value(self) -> Mapping[str, Mapping[str, Sequence[Union[Assign, AnnAssign, AugAssign]]]]:
+            # all literals with the same value share their assignments
+            assignments_by_literal_value = {}
+
             for literal, assignments in self._metadata[LiteralDuplicationAnalyzer._LiteralAssignmentProvider].items():
-                if literal_node.value == literal.value:
-                    return {
-                        key: value
-                        for key, value in assignments.items()
-                        if key in scope
-                    }
+                assignments_by_literal_value.setdefault(literal.value, assignments)
 
-            return None
+            return assignments_by_literal_value
 
-    class _LiteralDuplicationCountProvider(VisitorMetadataProvider[int]):
+    class _LiteralDuplicationCountProvider(VisitorMetadataProvider[List[SimpleString]]):
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
-            self._literal_counts: Dict[str, Tuple[int, List[SimpleString]]] = {}
+            self._literal_occurrences: Dict[str, List[SimpleString]] = {}
 
         def visit_SimpleString(self, node: SimpleString) -> Optional[bool]:
-            if node.value not in self._literal_counts:
-                self._literal_counts[node.value] = (0, [])
-
-            self._literal_counts[node.value] = (self._literal_counts[node.value][0] + 1, self._literal_counts[node.value][1])
-            self._literal_counts[node.value][1].append(node)
+            self._literal_occurrences.setdefault(node.value, []).append(node)
 
-            for duplicated_node in self._literal_counts[node.value][1]:
-                self.set_metadata(duplicated_node, self._literal_counts[node.value][1])
+        def leave_Module(self, original_node: Module) -> None:
+            # all occurrences are known once the whole module is visited
+            for occurrences in self._literal_occurrences.values():
+                for node in occurrences:
+                    self.set_metadata(node, occurrences)
 
     class _LiteralAssignmentProvider(
         VisitorMetadataProvider[
@@ -78,6 +95,7 @@ class LiteralDuplicationAnalyzer(PythonModuleCstAnalyzer):
             super().__init__(*args, **kwargs)
             self._literal_assignments: Dict[str, Dict[str, List[Union[Assign, AnnAssign, AugAssign]]]] = {}
             self._literals_referenced: Set[str] = set()
+            self._assigned_literals: Dict[str, Set[str]] = {}
 
         def visit_SimpleString(self, node: SimpleString) -> Optional[bool]:
             self._literals_referenced.add(node.value)
@@ -109,22 +127,24 @@ class LiteralDuplicationAnalyzer(PythonModuleCstAnalyzer):
             if literal.value not in self._literal_assignments:
                 self._literal_assignments[literal.value] = {}
 
-            if name not in self._literal_assignments[literal.value]:
+            if name.value not in self._literal_assignments[literal.value]:
                 self._literal_assignments[literal.value][name.value] = []
 
             self._literal_assignments[literal.value][name.value].append(node)
+            self._assigned_literals.setdefault(name.value, set()).add(literal.value)
             self.set_metadata(literal, self._literal_assignments[literal.value])
 
         def _invalidate_previous_assignments(self, name: Name, value: BaseExpression, node: Union[Assign, AnnAssign, AugAssign]):
             # invalidate literal assignments if their identifier is assigned to again
-            invalidate = False
-
-            for literal_value, assignments in self._literal_assignments.items():
-                if name.value in assignments:
-                    if (isinstance(node, AugAssign) or (isinstance(node, (Assign, AnnAssign)) and
-                            (not isinstance(value, SimpleString) or value.value != literal_value))):
-                        # invalidate because re-assignment to identifier with another value
-                        del self._literal_assignments[literal_value][name.value]
+            if not isinstance(name, Name):
+                return
+
+            for literal_value in list(self._assigned_literals.get(name.value, ())):
+                if (isinstance(node, AugAssign) or (isinstance(node, (Assign, AnnAssign)) and
+                        (not isinstance(value, SimpleString) or value.value != literal_value))):
+                    # invalidate because re-assignment to identifier with another value
+                    del self._literal_assignments[literal_value][name.value]
+                    self._assigned_literals[name.value].discard(literal_value)
 
     CST_PROVIDERS = {
         ParentNodeProvider,
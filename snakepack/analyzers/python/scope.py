@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import functools
-from typing import Union, List, Iterable, Optional
+from typing import Union, List, Iterable, Optional, Dict
 
 from libcst import MetadataWrapper, CSTNode, Name, Attribute, ClassDef, FunctionDef, Param, Annotation, Arg, \
     VisitorMetadataProvider, Global, Nonlocal, Call, Module
 from libcst.metadata import ScopeProvider, ExpressionContextProvider, Scope, ParentNodeProvider, ClassScope, \
     ComprehensionScope, FunctionScope, GlobalScope
+from libcst.helpers import get_full_name_for_node
 
 from snakepack.analyzers import Analyzer
+from snakepack.analyzers._base import memoize
 from snakepack.analyzers.python import PythonModuleCstAnalyzer
 from snakepack.assets import Asset, AssetGroup
 from snakepack.assets.python import PythonModule, PythonModuleCst
@@ -26,7 +27,7 @@ class ScopeAnalyzer(PythonModuleCstAnalyzer):
             raise NotImplementedError
 
     class Analysis(PythonModuleCstAnalyzer.Analysis):
-        @functools.lru_cache()
+        @memoize
         def get_fully_qualified_names(
                 self, module: PythonModule, node: Union[Name, Attribute, ClassDef, FunctionDef]
         ) -> Iterable[FullyQualifiedPythonName]:
@@ -39,28 +40,23 @@ class ScopeAnalyzer(PythonModuleCstAnalyzer):
                 )
             )
 
-        @functools.lru_cache()
+        @memoize
         def is_attribute(self, node: Name) -> bool:
             return (
                     isinstance(self._metadata[ParentNodeProvider][node], Attribute)
                     or isinstance(self.get_scope_for_node(node), ClassScope)
             )
 
-        @functools.lru_cache()
         def get_scope_for_node(self, node: CSTNode) -> Scope:
-            current_node = node
+            return self._metadata[ScopeAnalyzer._ScopeTableProvider][node].scope
 
-            while True:
-                if current_node in self._metadata[ScopeProvider]:
-                    return self._metadata[ScopeProvider][current_node]
+        def get_scope_facts_for_node(self, node: CSTNode) -> ScopeAnalyzer.ScopeFacts:
+            return self._metadata[ScopeAnalyzer._ScopeTableProvider][node]
 
-                current_node = self._metadata[ParentNodeProvider][current_node]
-
-        @functools.lru_cache()
         def is_in_local_scope(self, node: CSTNode) -> bool:
-            scope = self.get_scope_for_node(node)
+            scope_facts = self._metadata[ScopeAnalyzer._ScopeTableProvider][node]
 
-            if not isinstance(scope, (FunctionScope)):
+            if not scope_facts.is_local:
                 # global and class scope are never considered local scope
                 return False
 
@@ -68,74 +64,115 @@ class ScopeAnalyzer(PythonModuleCstAnalyzer):
                 # function parameter names are not considered local scope (they are part of the API to the parent scope)
                 return False
 
-            for assignment in scope.assignments[node]:
-                # identifiers that refer to parameters that are considered non-local scope are also non-local
-                if isinstance(assignment.node, Param):
-                    return False
+            name = get_full_name_for_node(node)
+
+            if name in scope_facts.global_names:
+                # identifiers declared global are bound in the module scope
+                return False
 
-            return True
+            # identifiers that refer to parameters that are considered non-local scope are also non-local
+            return name not in scope_facts.parameter_names
 
-        @functools.lru_cache()
+        @memoize
         def is_type_annotation(self, node: CSTNode) -> bool:
             return isinstance(self._metadata[ParentNodeProvider][node], Annotation)
 
-        @functools.lru_cache()
+        @memoize
         def is_keyword_arg(self, node: CSTNode) -> bool:
             parent = self._metadata[ParentNodeProvider][node]
             return isinstance(parent, Arg) and parent.keyword is node
 
-        @functools.lru_cache()
         def uses_globals_builtin(self, module: Module) -> bool:
-            return self._metadata[ScopeAnalyzer._GlobalsLocalsProvider][module]['uses_globals_builtin']
+            return any(scope_facts.uses_globals_builtin for scope_facts in self._get_all_scope_facts())
 
-        @functools.lru_cache()
         def uses_locals_builtin(self, module: Module) -> bool:
-            return self._metadata[ScopeAnalyzer._GlobalsLocalsProvider][module]['uses_locals_builtin']
+            return any(scope_facts.uses_locals_builtin for scope_facts in self._get_all_scope_facts())
 
-        @functools.lru_cache()
         def uses_global_stmt(self, module: Module) -> bool:
-            return self._metadata[ScopeAnalyzer._GlobalsLocalsProvider][module]['uses_global_stmt']
+            return any(scope_facts.uses_global_stmt for scope_facts in self._get_all_scope_facts())
 
-        @functools.lru_cache()
         def uses_nonlocal_stmt(self, module: Module) -> bool:
-            return self._metadata[ScopeAnalyzer._GlobalsLocalsProvider][module]['uses_nonlocal_stmt']
+            return any(scope_facts.uses_nonlocal_stmt for scope_facts in self._get_all_scope_facts())
 
-        @functools.lru_cache()
+        @memoize
         def get_all_scopes(self) -> Iterable[Scope]:
-            return set(self._metadata[ScopeProvider].values())
+            return set(scope_facts.scope for scope_facts in self._get_all_scope_facts())
+
+        @memoize
+        def _get_all_scope_facts(self) -> Iterable[ScopeAnalyzer.ScopeFacts]:
+            return set(self._metadata[ScopeAnalyzer._ScopeTableProvider].values())
+
+    class ScopeFacts:
+        __slots__ = (
+            'scope',
+            'is_local',
+            'parameter_names',
+            'global_names',
+            'uses_global_stmt',
+            'uses_nonlocal_stmt',
+            'uses_globals_builtin',
+            'uses_locals_builtin'
+        )
+
+        def __init__(self, scope: Scope):
+            self.scope = scope
+            self.is_local = isinstance(scope, FunctionScope)
+            self.parameter_names = frozenset(
+                assignment.name
+                for assignment in scope.assignments
+                if isinstance(assignment.node, Param)
+            )
+            self.global_names = set()
+            self.uses_global_stmt = False
+            self.uses_nonlocal_stmt = False
+            self.uses_globals_builtin = False
+            self.uses_locals_builtin = False
+
+    class _ScopeTableProvider(VisitorMetadataProvider[ScopeFacts]):
+        METADATA_DEPENDENCIES = (ScopeProvider,)
 
-    class _GlobalsLocalsProvider(VisitorMetadataProvider):
         def __init__(self, *args, **kwargs):
-            self._uses_global_stmt = False
-            self._uses_nonlocal_stmt = False
-            self._uses_globals_builtin = False
-            self._uses_locals_builtin = False
             super().__init__(*args, **kwargs)
+            self._scope_facts: Dict[Scope, ScopeAnalyzer.ScopeFacts] = {}
+            self._stack: List[ScopeAnalyzer.ScopeFacts] = []
+
+        def on_visit(self, node: CSTNode) -> bool:
+            # nodes without a scope of their own are in the scope of their closest ancestor
+            scope = self.get_metadata(ScopeProvider, node, None)
+
+            if scope is None:
+                scope_facts = self._stack[-1]
+            elif scope in self._scope_facts:
+                scope_facts = self._scope_facts[scope]
+            else:
+                scope_facts = self._scope_facts[scope] = ScopeAnalyzer.ScopeFacts(scope)
+
+            self._stack.append(scope_facts)
+            self.set_metadata(node, scope_facts)
+
+            return super().on_visit(node)
+
+        def on_leave(self, original_node: CSTNode) -> None:
+            super().on_leave(original_node)
+            self._stack.pop()
 
         def visit_Global(self, node: Global) -> Optional[bool]:
-            self._uses_global_stmt = True
+            self._stack[-1].uses_global_stmt = True
+            self._stack[-1].global_names.update(name_item.name.value for name_item in node.names)
 
         def visit_Nonlocal(self, node: Nonlocal) -> Optional[bool]:
-            self._uses_nonlocal_stmt = True
+            self._stack[-1].uses_nonlocal_stmt = True
 
         def visit_Call(self, node: Call) -> Optional[bool]:
             if isinstance(node.func, Name) and node.func.value == 'globals':
-                self._uses_globals_builtin = True
+                self._stack[-1].uses_globals_builtin = True
             elif isinstance(node.func, Name) and node.func.value == 'locals':
-                self._uses_locals_builtin = True
-
-        def visit_Module(self, node: Module) -> Optional[bool]:
-            self.set_metadata(node, {
-                'uses_global_stmt': self._uses_global_stmt,
-                'uses_nonlocal_stmt': self._uses_nonlocal_stmt,
-                'uses_globals_builtin': self._uses_globals_builtin,
-                'uses_locals_builtin': self._uses_locals_builtin
-            })
+                self._stack[-1].uses_locals_builtin = True
 
     CST_PROVIDERS = {
         ScopeProvider,
         ParentNodeProvider,
-        _GlobalsLocalsProvider
+        _ScopeTableProvider
     }
 
     __config_name__ = 'scope'
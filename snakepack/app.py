@@ -9,8 +9,12 @@ from snakepack.bundlers.generic import FileBundler
 from snakepack.compiler import Compiler, SynchronousExecutor, ConcurrentExecutor
 from snakepack.config._base import register_components
 from snakepack.config.formats import parse_yaml_config
+from snakepack.config.model import ExecutorConfig
 from snakepack.loaders.python import ImportGraphLoader
 from snakepack.packagers.generic import DirectoryPackager
+from snakepack.report import BuildReport
+from snakepack.trace import Trace
+from snakepack.watch import create_file_watcher
 from snakepack.transformers.python.remove_comments import RemoveCommentsTransformer
 
 DEFAULT_CONFIG_FILE = 'snakepack.yml'
@@ -18,12 +22,49 @@ DEFAULT_CONFIG_FILE = 'snakepack.yml'
 register_components()
 
 
+def _parse_executor_options(ctx, param, values):
+    executor_options = {}
+
+    for value in values:
+        phase, _, backend = value.partition('=')
+        backend, _, workers = backend.partition(':')
+
+        if phase not in ExecutorConfig.__fields__:
+            raise click.BadParameter(f"Unknown phase '{phase}'")
+
+        executor_options[phase] = {'backend': backend, 'workers': workers or None}
+
+    try:
+        return ExecutorConfig(**executor_options).dict(exclude_unset=True)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
 @click.command()
 @click.argument('base_dir', required=False, default=Path('.').resolve(), type=click.Path(exists=True, file_okay=False, resolve_path=True))
 @click.option('-c', '--config-file', required=False, type=click.Path(exists=True, dir_okay=False, resolve_path=True))
 @click.option('-p', '--parallel', required=False, default=False, is_flag=True)
 @click.option('-v', '--verbose', required=False, count=True)
-def snakepack(base_dir, config_file=None, parallel=False, verbose=0):
+@click.option('--cache-dir', required=False, type=click.Path(file_okay=False, resolve_path=True))
+@click.option('--report', required=False, type=click.Path(dir_okay=False, resolve_path=True))
+@click.option('--trace', required=False, type=click.Path(dir_okay=False, resolve_path=True))
+@click.option('-w', '--watch', required=False, default=False, is_flag=True)
+@click.option('--max-memory', required=False, type=click.IntRange(min=1))
+@click.option('-s', '--stream', required=False, default=False, is_flag=True)
+@click.option('-e', '--executor', required=False, multiple=True, callback=_parse_executor_options, metavar='PHASE=BACKEND[:WORKERS]')
+def snakepack(
+        base_dir,
+        config_file=None,
+        parallel=False,
+        verbose=0,
+        cache_dir=None,
+        report=None,
+        trace=None,
+        watch=False,
+        max_memory=None,
+        stream=False,
+        executor=None
+):
     if config_file is None:
         config_file = Path(base_dir) / DEFAULT_CONFIG_FILE
 
@@ -31,17 +72,43 @@ def snakepack(base_dir, config_file=None, parallel=False, verbose=0):
         config_yaml = f.read()
 
     config = parse_yaml_config(config_yaml)
+
+    if cache_dir is not None:
+        config.cache_path = Path(cache_dir)
+
+    if max_memory is not None:
+        config.max_memory = max_memory
+
+    if stream:
+        config.stream = True
+
+    if executor:
+        config.executor = ExecutorConfig(**{**config.executor.dict(), **executor})
+
     logger = _create_logger(verbose)
-    sync_executor = SynchronousExecutor(logger=logger)
+    build_trace = Trace() if trace is not None else None
 
     if parallel:
-        executor = ConcurrentExecutor(logger=logger, sync_executor=sync_executor)
+        default_executor = ConcurrentExecutor(logger=logger, trace=build_trace)
     else:
-        executor = sync_executor
+        default_executor = SynchronousExecutor(logger=logger, trace=build_trace)
 
-    compiler = Compiler(config=config, executor=executor)
+    build_report = BuildReport() if report is not None else None
+    compiler = Compiler(config=config, executor=default_executor, report=build_report)
     compiler.run()
 
+    if build_report is not None:
+        build_report.write(Path(report))
+
+    if build_trace is not None:
+        build_trace.write(Path(trace))
+
+    if watch:
+        try:
+            compiler.watch(create_file_watcher())
+        except KeyboardInterrupt:
+            pass
+
 
 def _create_logger(verbosity):
     stdout_handler = StreamHandler(sys.stdout)
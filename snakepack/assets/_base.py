@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
 from abc import abstractmethod, ABC
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TypeVar, Protocol, Optional, Union, Generic, Type, Any, Iterable
+from threading import RLock
+from typing import TypeVar, Protocol, Optional, Union, Generic, Type, Any, Iterable, Dict, Iterator
 
 from snakepack.config.options import Selectable
 
@@ -42,6 +46,17 @@ class Asset(Generic[T], Selectable, ABC):
 
     @content.setter
     def content(self, content: AssetContent[Asset[T]]):
+        if AssetContentCache.budget is not None:
+            if isinstance(self._content, AssetContentCache):
+                AssetContentCache.budget.release(self._content)
+
+            if not isinstance(content, AssetContentCache):
+                # keep the content in a cache, so that it can be evicted when memory runs out
+                content = AssetContentCache(
+                    content_or_source=content,
+                    source_size=self._content.source_size if isinstance(self._content, AssetContentCache) else None
+                )
+
         self._content = content
 
     @property
@@ -95,6 +110,8 @@ U = TypeVar('U', bound=Asset)
 
 
 class AssetContent(Generic[U], ABC):
+    EVICTABLE = False
+
     def to_string(self) -> StringAssetContent:
         return StringAssetContent(str(self))
 
@@ -187,17 +204,24 @@ class FileContentSource(AssetContentSource):
 
 
 class AssetContentCache:
+    budget: Optional[ContentMemoryBudget] = None
+
     def __init__(
             self,
             content_or_source: Union[AssetContentSource, AssetContent],
-            default_content_type: Optional[Type[AssetContent]] = None
+            default_content_type: Optional[Type[AssetContent]] = None,
+            source_size: Optional[int] = None
     ):
+        self._evicted_content_type = None
+        self._source_size = source_size
+
         if isinstance(content_or_source, AssetContentSource):
             self._content_source = content_or_source
             self._cached_content = None
         else:
             self._cached_content = content_or_source
             self._content_source = None
+            self._track_memory()
 
     def __getstate__(self):
         return vars(self)
@@ -218,12 +242,130 @@ class AssetContentCache:
         return self
 
     def __str__(self) -> str:
+        if self._evicted_content_type is not None:
+            # no need to parse the evicted content again, it's already kept as a string
+            return str(self._cached_content)
+
         self._ensure_content_loaded()
         return str(self._cached_content)
 
+    def __bytes__(self) -> bytes:
+        self._ensure_content_loaded()
+        return bytes(self._cached_content)
+
+    @property
+    def content(self) -> AssetContent:
+        self._ensure_content_loaded()
+        return self._cached_content
+
+    @property
+    def source_size(self) -> Optional[int]:
+        return self._source_size
+
+    @property
+    def evicted(self) -> bool:
+        return self._evicted_content_type is not None
+
+    @staticmethod
+    @contextmanager
+    def pinned(content: AssetContent) -> Iterator[None]:
+        budget = AssetContentCache.budget
+
+        if budget is None or not isinstance(content, AssetContentCache):
+            yield
+            return
+
+        budget.pin(content)
+
+        try:
+            yield
+        finally:
+            budget.unpin(content)
+
+    def evict(self):
+        # replace the content by its string form, which takes a fraction of the memory of e.g. a syntax tree
+        string_content = str(self._cached_content)
+        self._evicted_content_type = type(self._cached_content)
+        self._cached_content = StringAssetContent(string_content)
+        self._source_size = len(string_content)
+
     def _ensure_content_loaded(self):
         if self._cached_content is None:
             self._cached_content = self._content_source.load()
+        elif self._evicted_content_type is not None:
+            self._cached_content = self._evicted_content_type.from_string(str(self._cached_content))
+            self._evicted_content_type = None
+        elif AssetContentCache.budget is None:
+            return
+
+        self._track_memory()
+
+    def _track_memory(self):
+        if AssetContentCache.budget is None or not self._cached_content.EVICTABLE:
+            return
+
+        if self._source_size is None:
+            if isinstance(self._content_source, FileContentSource):
+                self._source_size = os.path.getsize(self._content_source.path)
+            else:
+                self._source_size = len(str(self._cached_content))
+
+        AssetContentCache.budget.touch(self, self._source_size)
+
+
+class ContentMemoryBudget:
+    # syntax trees along with their resolved metadata take about 100 bytes per byte of source code
+    BYTES_PER_SOURCE_BYTE = 100
+
+    def __init__(self, max_memory: int):
+        self._max_memory = max_memory
+        self._memory = 0
+        self._resident_caches: OrderedDict[AssetContentCache, int] = OrderedDict()
+        self._pinned_caches: Dict[AssetContentCache, int] = {}
+        # contents may be used by several threads at once, e.g. when transforming on a thread pool
+        self._lock = RLock()
+
+    @property
+    def max_memory(self) -> int:
+        return self._max_memory
+
+    @property
+    def memory(self) -> int:
+        return self._memory
+
+    def touch(self, cache: AssetContentCache, source_size: int):
+        with self._lock:
+            self.release(cache)
+            memory = source_size * self.BYTES_PER_SOURCE_BYTE
+            self._resident_caches[cache] = memory
+            self._memory += memory
+
+            for evicted_cache in list(self._resident_caches):
+                if self._memory <= self._max_memory:
+                    break
+
+                if evicted_cache is cache or evicted_cache in self._pinned_caches:
+                    # the content that was used least recently is evicted first, never the content that is being used
+                    continue
+
+                self._memory -= self._resident_caches.pop(evicted_cache)
+                evicted_cache.evict()
+
+    def release(self, cache: AssetContentCache):
+        with self._lock:
+            if cache in self._resident_caches:
+                self._memory -= self._resident_caches.pop(cache)
+
+    def pin(self, cache: AssetContentCache):
+        with self._lock:
+            self._pinned_caches[cache] = self._pinned_caches.get(cache, 0) + 1
+
+    def unpin(self, cache: AssetContentCache):
+        with self._lock:
+            if self._pinned_caches[cache] == 1:
+                del self._pinned_caches[cache]
+            else:
+                self._pinned_caches[cache] -= 1
 
 
 AssetContent.register(AssetContentCache)
\ No newline at end of file
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import ast
+from enum import Enum, unique
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from boltons.iterutils import first, flatten
 from libcst import Module, parse_module, MetadataWrapper
@@ -21,19 +23,40 @@ Python = AssetType.create('Python')
 
 
 class PythonModule(Asset[Python]):
-    def __init__(self, name: str, *args, **kwargs):
+    def __init__(
+            self,
+            name: str,
+            *args,
+            origin: Optional[PythonModule.Origin] = None,
+            pass_through: bool = False,
+            **kwargs
+    ):
         target_path = Path(f"{name.replace('.', '/')}.py")
         super().__init__(name, target_path, *args, **kwargs)
+        self._origin = origin
+        self._pass_through = pass_through
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def origin(self) -> Optional[PythonModule.Origin]:
+        return self._origin
+
+    @property
+    def pass_through(self) -> bool:
+        return self._pass_through
+
     def matches(self, selector: Selector) -> bool:
         if not isinstance(selector, FullyQualifiedPythonName):
             return False
 
-        return not selector.has_module_path or selector.has_ident_path or self._name.startswith('.'.join(selector.module_path))
+        return (
+                not selector.has_module_path
+                or selector.has_ident_path
+                or FullyQualifiedPythonName.match_module_path(selector.module_path, self._name.split('.'))
+        )
 
     @classmethod
     def from_string(cls, name: str, content: str, **kwargs) -> Asset[T]:
@@ -48,25 +71,62 @@ class PythonModule(Asset[Python]):
             **kwargs
         )
 
+    @unique
+    class Origin(Enum):
+        APPLICATION = 'application'
+        THIRD_PARTY = 'third_party'
+        STDLIB = 'stdlib'
+
 
 class PythonModuleCst(AssetContent[PythonModule]):
-    def __init__(self, cst: Module):
-        self._wrapper = MetadataWrapper(module=cst)
+    EVICTABLE = True
+
+    def __init__(self, cst: Optional[Module] = None, copy: bool = True, source: Optional[str] = None):
+        # metadata is keyed on the tree's nodes, a tree that may share nodes with other trees is copied first
+        self._cst = cst.deep_clone() if copy and cst is not None else cst
+        self._source = source
+        self._ast = None
+        self._wrapper = None
+
+    def __getstate__(self):
+        # the syntax tree is a cache of the source that is cheaper to parse again than to transfer
+        state = vars(self).copy()
+        state['_ast'] = None
+        return state
 
     def __str__(self):
-        return self._wrapper.module.code
+        if self._cst is None:
+            return self._source
+
+        return self._cst.code
 
     @property
     def cst(self) -> Module:
-        return self._wrapper.module
+        if self._cst is None:
+            # the concrete syntax tree is only parsed once a transformer or analyzer needs its nodes
+            self._cst = parse_module(self._source)
+            self._source = None
+
+        return self._cst
 
     @property
-    def metadata_wrapper(self):
+    def ast(self) -> ast.Module:
+        if self._ast is None:
+            self._ast = ast.parse(str(self))
+
+        return self._ast
+
+    @property
+    def metadata_wrapper(self) -> MetadataWrapper:
+        if self._wrapper is None:
+            # the tree is owned by this content, so the wrapper doesn't need to copy it
+            self._wrapper = MetadataWrapper(module=self.cst, unsafe_skip_copy=True)
+
         return self._wrapper
 
     @classmethod
     def from_string(cls, string_content) -> AssetContent:
-        return PythonModuleCst(cst=parse_module(str(string_content)))
+        return PythonModuleCst(source=str(string_content))
 
 
 class PythonPackage(AssetGroup[Python]):
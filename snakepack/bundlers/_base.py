@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence, Optional
+from typing import Iterable, Sequence, Optional, Collection, List
 
 from snakepack.assets import Asset, AssetGroup
+from snakepack.assets.python import PythonModule
 from snakepack.config.options import ConfigurableComponent
+from snakepack.config.types import SelectorIndex
 from snakepack.loaders import Loader
 from snakepack.transformers import Transformer
 
@@ -16,6 +18,11 @@ class Bundle:
         self._loader = loader
         self._asset_group: Optional[AssetGroup] = None
         self._transformers = transformers
+        self._excluding_transformers = SelectorIndex()
+
+        for transformer in transformers:
+            for selector in transformer.options.excludes:
+                self._excluding_transformers.add(selector, transformer)
 
     @property
     def name(self) -> str:
@@ -38,7 +45,23 @@ class Bundle:
         return self._transformers
 
     def load(self):
-        self._asset_group = self._loader.load()
+        self._asset_group = self._loader.load(pass_through=self.passes_through)
+
+    def get_transformers(self, asset: Asset) -> List[Transformer]:
+        if isinstance(asset, PythonModule):
+            excluding_transformers = self._excluding_transformers.match(asset.name)
+        else:
+            excluding_transformers = {
+                transformer
+                for transformer in self._transformers
+                if any(asset.matches(selector) for selector in transformer.options.excludes)
+            }
+
+        return [transformer for transformer in self._transformers if transformer not in excluding_transformers]
+
+    def passes_through(self, asset: Asset) -> bool:
+        # assets excluded by all transformers are bundled from their source as is
+        return len(self.get_transformers(asset)) == 0
 
     def bundle(self, *args, **kwargs):
         return self._bundler.bundle(self, *args, **kwargs)
@@ -46,5 +69,5 @@ class Bundle:
 
 class Bundler(ConfigurableComponent, ABC):
     @abstractmethod
-    def bundle(self, bundle: Bundle, package):
+    def bundle(self, bundle: Bundle, package, assets: Optional[Collection[Asset]] = None):
         raise NotImplementedError
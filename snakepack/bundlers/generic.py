@@ -1,23 +1,33 @@
 from pathlib import Path
+from typing import Optional, Collection
 
-from snakepack.assets._base import BinaryAssetContent
+from snakepack.assets import Asset
+from snakepack.assets._base import BinaryAssetContent, AssetContentCache
 from snakepack.bundlers import Bundler, Bundle
 from snakepack.config.options import Options
 from snakepack.packagers import Package
 
 
 class FileBundler(Bundler):
-    def bundle(self, bundle: Bundle, package: Package):
-        for asset in bundle.asset_group.deep_assets:
+    def bundle(self, bundle: Bundle, package: Package, assets: Optional[Collection[Asset]] = None):
+        if assets is None:
+            assets = bundle.asset_group.deep_assets
+
+        for asset in assets:
             output_path = package.target_path / Path(self._options.output_path.format(asset_target_path=str(asset.target_path)))
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if isinstance(asset.content, BinaryAssetContent):
+            content = asset.content
+
+            if isinstance(content, AssetContentCache):
+                content = content.content
+
+            if isinstance(content, BinaryAssetContent):
                 with open(output_path, 'wb+') as f:
-                    f.write(bytes(asset.content))
+                    f.write(bytes(content))
             else:
                 with open(output_path, 'w+') as f:
-                    f.write(str(asset.content))
+                    f.write(str(content))
 
     class Options(Options):
         output_path: str = '{asset_target_path}'
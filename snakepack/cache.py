@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union, Mapping, Any, Dict
+
+
+class BuildCache:
+    def __init__(self, path: Path):
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def create_key(*parts: Union[str, bytes]) -> str:
+        key_hash = hashlib.sha256()
+
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode('utf-8')
+
+            # hash each part separately so that part boundaries can't shift between keys
+            key_hash.update(hashlib.sha256(part).digest())
+
+        return key_hash.hexdigest()
+
+    def load(self, key: str) -> Optional[str]:
+        try:
+            with open(self._get_entry_path(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, content: str):
+        self._write(self._get_entry_path(key), content)
+
+    def load_import_graph(self, key: str) -> Optional[Mapping[str, Any]]:
+        try:
+            with open(self._get_import_graph_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def store_import_graph(self, key: str, import_graph: Mapping[str, Any]):
+        self._write(self._get_import_graph_path(key), json.dumps(import_graph))
+
+    def load_task_costs(self) -> Dict[str, float]:
+        try:
+            with open(self._path / 'task_costs.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def store_task_costs(self, task_costs: Mapping[str, float]):
+        self._write(self._path / 'task_costs.json', json.dumps(task_costs))
+
+    def _write(self, path: Path, content: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        # atomic replace, concurrent builds never observe partially written entries
+        os.replace(temp_path, path)
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self._path / 'modules' / key[:2] / key[2:]
+
+    def _get_import_graph_path(self, key: str) -> Path:
+        return self._path / 'import_graphs' / f'{key}.json'
@@ -1,43 +1,197 @@
 from __future__ import annotations
 
 import os
+import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, Executor as BaseExecutor
+from contextlib import nullcontext
 from functools import partial
 from logging import Logger
-from typing import Optional, Dict, Iterable, List, Callable, TypeVar, Type
+from multiprocessing import get_context
+from queue import Queue
+from threading import Thread
+from pathlib import Path
+from typing import Optional, Dict, Iterable, List, Callable, TypeVar, Type, ContextManager, Tuple, Set, Iterator, Union
 
-from loky import get_reusable_executor
+from loky import get_reusable_executor, cpu_count, set_loky_pickler
 
+import snakepack
 from snakepack.analyzers import Analyzer
 from snakepack.analyzers.python import PythonModuleCstAnalyzer
 from snakepack.analyzers.python._base import BatchPythonModuleCstAnalyzer
 from snakepack.analyzers.python.imports import ImportGraphAnalyzer
-from snakepack.assets import AssetContentSource, Asset
+from snakepack.assets import AssetContentSource, Asset, FileContentSource, StringAssetContent
+from snakepack.assets._base import AssetContentCache, ContentMemoryBudget
 from snakepack.assets.python import PythonModuleCst, PythonModule
 from snakepack.bundlers import Bundle
+from snakepack.cache import BuildCache
 from snakepack.config.options import ComponentConfig
-from snakepack.config.model import SnakepackConfig, PackageConfig, BundleConfig
+from snakepack.config.types import ExecutorBackend
+from snakepack.config.model import SnakepackConfig, PackageConfig, BundleConfig, GlobalOptions, ExecutorOptions
 from snakepack.loaders import Loader
 from snakepack.packagers import Package
+from snakepack.report import BuildReport
+from snakepack.trace import Trace
+from snakepack.watch import FileWatcher
 from snakepack.transformers import Transformer
 from snakepack.transformers.python._base import BatchablePythonModuleTransformer, BatchPythonModuleTransformer
 
 
 class Compiler:
-    def __init__(self, config: SnakepackConfig, executor: Executor):
+    NUM_REPORTED_SLOWEST = 10
+    STREAM_QUEUE_SIZE = 16
+    ESTIMATED_SECONDS_PER_BYTE = 0.00002
+
+    _forked_assets: Optional[List[Tuple[PythonModule, List[BatchPythonModuleTransformer], Analyzer.Analysis]]] = None
+
+    def __init__(self, config: SnakepackConfig, executor: Executor, report: Optional[BuildReport] = None):
         self._config = config
         self._packages: List[Package] = []
         self._loaders: Dict[Bundle, Loader] = {}
         self._executor = executor
+        self._load_executor = self._create_phase_executor(config.executor.load)
+        self._transform_executor = self._create_phase_executor(config.executor.transform)
+        self._package_executor = self._create_phase_executor(config.executor.package)
+        self._cache = BuildCache(path=config.cache_path) if config.cache_path is not None else None
+        self._source_hashes: Dict[Asset, str] = {}
+        self._report = report
+        self._task_costs: Dict[str, float] = self._cache.load_task_costs() if self._cache is not None else {}
+
+        if config.max_memory is not None:
+            # module contents beyond the budget are evicted to source code and parsed again when needed
+            AssetContentCache.budget = ContentMemoryBudget(max_memory=config.max_memory * 1024 * 1024)
+        else:
+            AssetContentCache.budget = None
+
+    @property
+    def report(self) -> Optional[BuildReport]:
+        return self._report
 
     def run(self):
-        self._load_packages()
-        self._load_assets()
-        self._transform_assets()
-        self._package_assets()
+        with Compiler._measure(self._report, BuildReport.PHASES, 'load_packages'):
+            self._load_packages()
+
+        if self._config.stream:
+            self._stream_assets()
+        else:
+            with Compiler._measure(self._report, BuildReport.PHASES, 'load_assets'):
+                self._load_assets()
+
+            with Compiler._measure(self._report, BuildReport.PHASES, 'transform_assets'):
+                self._transform_assets()
+
+            with Compiler._measure(self._report, BuildReport.PHASES, 'package_assets'):
+                self._package_assets()
+
+        if self._report is not None:
+            for loader in self._loaders.values():
+                import_analysis = getattr(loader, 'analysis', None)
+
+                if import_analysis is not None:
+                    Compiler._record_memo_tables(self._report, ImportGraphAnalyzer, import_analysis)
+
+            self._log_report()
+
+    def watch(self, watcher: FileWatcher):
+        try:
+            while True:
+                watcher.watch(self._get_source_paths())
+                self._executor.logger.info("# Watching source files for changes ---")
+                changed_paths = watcher.wait()
+                self.recompile(changed_paths)
+        finally:
+            watcher.close()
+
+    def recompile(self, changed_paths: Iterable[Path]):
+        changed_paths = {Path(path).resolve() for path in changed_paths}
+
+        for package in self._packages:
+            for bundle in package.bundles.values():
+                changed_assets = {
+                    asset
+                    for asset in bundle.asset_group.deep_assets
+                    if isinstance(asset.source, FileContentSource) and Path(asset.source.path).resolve() in changed_paths
+                }
+
+                if len(changed_assets) == 0:
+                    continue
+
+                for asset in changed_assets:
+                    self._executor.logger.info(f"... Source of asset '{asset.name}' changed")
+                    self._source_hashes.pop(asset, None)
+
+                affected_assets = self._reload_assets(bundle, changed_assets)
+
+                if affected_assets is None:
+                    self._executor.logger.info(f"# Import graph of bundle '{bundle.name}' changed, reloading bundle ---")
+                    self._source_hashes = {}
+                    bundle.load()
+                    self._transform_bundle(package, bundle)
+                    bundle.bundle(package=package)
+                else:
+                    self._transform_bundle(package, bundle, assets=affected_assets)
+                    bundle.bundle(package=package, assets=affected_assets)
+
+    def _reload_assets(self, bundle: Bundle, changed_assets: Set[Asset]) -> Optional[Set[Asset]]:
+        import_analysis = self._loaders[bundle].analysis
+        import_graph_required = any(
+            ImportGraphAnalyzer in transformer.REQUIRED_ANALYZERS
+            for transformer in bundle.transformers
+        )
+        affected_assets = set(changed_assets)
+
+        for asset in changed_assets:
+            if not Path(asset.source.path).exists():
+                return None
+
+            asset.content = AssetContentCache(content_or_source=asset.source)
+
+            if not isinstance(asset, PythonModule) or import_analysis is None:
+                continue
+
+            if asset.pass_through:
+                if import_analysis.import_graph_known:
+                    # imports of modules that aren't parsed aren't known, scan the import graph again
+                    return None
+
+                continue
+
+            imported_module_names = import_analysis.get_imported_module_names(asset)
+            import_analysis.update_module(asset)
+
+            if import_analysis.import_graph_known:
+                if import_analysis.get_imported_module_names(asset) != imported_module_names:
+                    # modules were added to or removed from the import graph
+                    return None
+
+                if import_graph_required:
+                    # identifiers imported from these modules may have changed, which affects their renaming
+                    affected_assets.update(import_analysis.get_imported_modules(asset))
+
+        for asset in affected_assets - changed_assets:
+            # transform unchanged modules again from their source
+            self._executor.logger.info(f"... Asset '{asset.name}' affected by changed imports")
+            asset.content = AssetContentCache(content_or_source=asset.source)
+            import_analysis.update_module(asset)
+
+        return affected_assets
+
+    def _get_source_paths(self) -> Set[Path]:
+        return {
+            Path(asset.source.path)
+            for package in self._packages
+            for bundle in package.bundles.values()
+            for asset in bundle.asset_group.deep_assets
+            if isinstance(asset.source, FileContentSource)
+        }
+
+    def _create_phase_executor(self, options: Optional[ExecutorOptions]) -> Executor:
+        if options is None:
+            return self._executor
+
+        return Executor.create(options, logger=self._executor.logger, trace=self._executor.trace)
 
     def _load_packages(self):
         self._executor.logger.debug("# Initialising components ---")
@@ -70,7 +224,9 @@ class Compiler:
             start_msg="# Loading assets into the compiler ---",
             complete_msg='',
             fail_msg="! Failed to load assets into the compiler - exiting",
-            nested_tasks=nested_tasks
+            nested_tasks=nested_tasks,
+            # loaders modify the bundles, which worker processes can't do
+            parallel=not self._load_executor.out_of_process
         )
 
         for package in self._packages:
@@ -83,63 +239,164 @@ class Compiler:
                 )
                 nested_tasks.append(bundle_task)
 
-        list(self._executor.execute(tasks=[task], parallel=False))
+        list(self._load_executor.execute(tasks=[task], parallel=False))
 
     def _transform_assets(self):
         for package in self._packages:
             for bundle in package.bundles.values():
-                self._executor.logger.info(f"# Running transformers for package '{package.name}' & bundle '{bundle.name}' ---")
-                sync_tasks = []
-                parallel_tasks = []
-
-                for asset in bundle.asset_group.deep_assets:
-                    if not isinstance(asset, PythonModule):
-                        continue
-
-                    transformers = [
-                        transformer
-                        for transformer in bundle.transformers
-                        if not any(map(lambda x: asset.matches(x), transformer.options.excludes))
-                    ]
-
-                    batchable_transformers = [t for t in transformers if
-                                              isinstance(t, BatchablePythonModuleTransformer)]
-                    nonbatchable_transformers = [t for t in transformers if
-                                                 not isinstance(t, BatchablePythonModuleTransformer)]
-                    batch_transformer = BatchPythonModuleTransformer(
-                        batchable_transformers,
-                        global_options=self._config
-                    )
-
-                    parallel_tasks.append(
-                        Task(
-                            start_msg=f"... Running simple transformers on asset '{asset.name}'",
-                            complete_msg='',
-                            fail_msg=f"! Failed to execute simple transformers on asset '{asset.name}'{'- exiting' if self._config.ignore_errors else ''}",
-                            callable=partial(
-                                Compiler._transform_asset_parallel,
-                                asset=asset,
-                                transformers=[batch_transformer]
-                            )
-                        )
-                    )
-
-                    sync_tasks.append(
-                        Task(
-                            start_msg=f"... Running complex transformers on asset '{asset.name}'",
-                            complete_msg='',
-                            fail_msg=f"! Failed to execute complex transformers on asset '{asset.name}'{'- exiting' if self._config.ignore_errors else ''}",
-                            callable=partial(
-                                Compiler._transform_asset,
-                                asset=asset,
-                                transformers=nonbatchable_transformers,
-                                import_analysis=self._loaders[bundle].analysis
-                            )
-                        )
-                    )
-
-                list(self._executor.execute(sync_tasks, parallel=False, ignore_errors=self._config.ignore_errors))
-                list(self._executor.execute(parallel_tasks, parallel=True, ignore_errors=self._config.ignore_errors))
+                self._transform_bundle(package, bundle)
+
+    def _stream_assets(self):
+        self._executor.logger.info("# Streaming assets through the compiler ---")
+
+        with _AssetWriter(max_pending=Compiler.STREAM_QUEUE_SIZE) as writer:
+            for package in self._packages:
+                for bundle in package.bundles.values():
+                    # the loader of a bundle may need the whole program to discover its modules and import graph
+                    with Compiler._measure(self._report, BuildReport.PHASES, 'load_assets'):
+                        self._executor.logger.info(f"... Loading assets for bundle '{bundle.name}'")
+                        bundle.load()
+
+                    with Compiler._measure(self._report, BuildReport.PHASES, 'stream_assets'):
+                        transformed_assets = set()
+
+                        for asset in bundle.asset_group.deep_assets:
+                            if isinstance(asset, PythonModule) and not asset.pass_through:
+                                transformed_assets.add(asset)
+                            else:
+                                # assets that aren't transformed are written while the modules are transformed
+                                writer.write(package, bundle, asset)
+
+                        for asset in self._transform_bundle_assets(package, bundle, assets=transformed_assets):
+                            # only the output is kept, the tree of the module is no longer needed
+                            asset.content = StringAssetContent(str(asset.content))
+                            writer.write(package, bundle, asset)
+
+    def _transform_bundle(self, package: Package, bundle: Bundle, assets: Optional[Set[Asset]] = None):
+        for _ in self._transform_bundle_assets(package, bundle, assets):
+            pass
+
+    def _transform_bundle_assets(
+            self,
+            package: Package,
+            bundle: Bundle,
+            assets: Optional[Set[Asset]] = None
+    ) -> Iterator[Asset]:
+        self._executor.logger.info(f"# Running transformers for package '{package.name}' & bundle '{bundle.name}' ---")
+        tasks = []
+        transformed_assets = []
+        forked_assets = []
+        bundle_passes = Compiler._plan_passes(bundle.transformers, global_options=self._config)
+        self._executor.logger.info(f"... Transformers planned into {len(bundle_passes)} CST passes per module")
+
+        for index, bundle_pass in enumerate(bundle_passes):
+            transformer_names = ', '.join(transformer.__config_name__ for transformer in bundle_pass.transformers)
+            self._executor.logger.debug(f"... Pass {index + 1}: {transformer_names}")
+
+        for asset in bundle.asset_group.deep_assets:
+            if (
+                    not isinstance(asset, PythonModule)
+                    or asset.pass_through
+                    or (assets is not None and asset not in assets)
+            ):
+                continue
+
+            transformers = bundle.get_transformers(asset)
+            cache_key = None
+
+            if self._cache is not None:
+                cache_key = self._create_cache_key(asset, transformers, self._loaders[bundle].analysis)
+                cached_content = self._cache.load(cache_key)
+
+                if cached_content is not None:
+                    self._executor.logger.debug(f"... Using cached transformation result for asset '{asset.name}'")
+                    asset.content = StringAssetContent(cached_content)
+                    yield asset
+                    continue
+
+            transformed_assets.append((asset, cache_key))
+
+            passes = Compiler._plan_passes(transformers, global_options=self._config)
+
+            if self._transform_executor.forks_workers:
+                # forked workers inherit the loaded assets, only the index of the asset is sent to them
+                cost = self._estimate_cost(asset, self._get_source_size(asset))
+                callable = partial(
+                    Compiler._transform_forked_asset,
+                    index=len(forked_assets),
+                    reported=self._report is not None
+                )
+                forked_assets.append((asset, passes, self._loaders[bundle].analysis))
+            elif self._transform_executor.out_of_process:
+                # worker processes can't modify the asset tree, send them the source along with a snapshot of
+                # the import graph facts for this module and install their output
+                source = str(asset.content)
+                cost = self._estimate_cost(asset, len(source))
+                callable = partial(
+                    Compiler._transform_source if self._report is None else Compiler._transform_source_reported,
+                    name=asset.name,
+                    source=source,
+                    transformers=passes,
+                    import_analysis=self._loaders[bundle].analysis.snapshot(modules=[asset])
+                )
+            else:
+                cost = Task.DEFAULT_COST
+                callable = partial(
+                    Compiler._transform_asset,
+                    asset=asset,
+                    transformers=passes,
+                    import_analysis=self._loaders[bundle].analysis,
+                    report=self._report
+                )
+
+            tasks.append(
+                Task(
+                    start_msg=f"... Running transformers on asset '{asset.name}' ({len(passes)} passes)",
+                    complete_msg='',
+                    fail_msg=f"! Failed to execute transformers on asset '{asset.name}'{'- exiting' if self._config.ignore_errors else ''}",
+                    callable=callable,
+                    cost=cost
+                )
+            )
+
+        if len(forked_assets) > 0:
+            # workers are forked on the first task, after the assets they transform have been registered
+            Compiler._forked_assets = forked_assets
+
+        try:
+            # results are collected as they complete, so they can be handled while later assets are still transformed
+            results = self._transform_executor.execute(tasks, parallel=True, ignore_errors=self._config.ignore_errors)
+
+            for (asset, cache_key), result in zip(transformed_assets, results):
+                if result is None:
+                    # don't install or cache output of failed transformations
+                    yield asset
+                    continue
+
+                if self._transform_executor.out_of_process:
+                    if self._report is not None:
+                        # measurements of worker processes are returned along with their output
+                        content, worker_report = result.result
+                        self._report.merge(worker_report)
+                    else:
+                        content = result.result
+
+                    asset.content = StringAssetContent(content)
+                    self._task_costs[asset.name] = result.end_time - result.start_time
+
+                if self._cache is not None:
+                    self._cache.store(cache_key, str(asset.content))
+
+                yield asset
+        finally:
+            if len(forked_assets) > 0:
+                # the workers hold a copy of the assets of this bundle, the next bundle needs new workers
+                Compiler._forked_assets = None
+                self._transform_executor.stop_workers()
+
+        if self._cache is not None and self._transform_executor.out_of_process:
+            # the timings of this build are used to schedule the next one
+            self._cache.store_task_costs(self._task_costs)
 
     def _package_assets(self):
         nested_tasks = []
@@ -147,7 +404,8 @@ class Compiler:
             start_msg="# Packaging assets ---",
             complete_msg='',
             fail_msg="! Failed to package assets - exiting",
-            nested_tasks=nested_tasks
+            nested_tasks=nested_tasks,
+            parallel=not self._package_executor.out_of_process
         )
 
         for package in self._packages:
@@ -159,7 +417,105 @@ class Compiler:
             )
             nested_tasks.append(package_task)
 
-        list(self._executor.execute(tasks=[task], parallel=False))
+        list(self._package_executor.execute(tasks=[task], parallel=False))
+
+    def _log_report(self):
+        for scope in (BuildReport.MODULES, BuildReport.TRANSFORMERS):
+            self._executor.logger.info(f"# Slowest {scope} ---")
+
+            for name, measurement in self._report.get_slowest(scope, Compiler.NUM_REPORTED_SLOWEST):
+                self._executor.logger.info(
+                    f"... {name}: {measurement.wall_time:.3f}s wall, {measurement.cpu_time:.3f}s CPU, "
+                    f"{measurement.peak_memory / 1024 / 1024:.1f} MiB peak memory"
+                )
+
+        self._executor.logger.debug(f"# Analysis memo tables ---")
+
+        for name, statistics in self._report.memo_tables.items():
+            self._executor.logger.debug(
+                f"... {name}: {statistics.hits} hits, {statistics.misses} misses ({statistics.hit_rate:.0%} hit rate)"
+            )
+
+    def _create_cache_key(
+            self,
+            asset: PythonModule,
+            transformers: List[Transformer],
+            import_analysis: Optional[ImportGraphAnalyzer.Analysis]
+    ) -> str:
+        key_parts = [
+            snakepack.__version__,
+            self._config.target_version.value,
+            self._get_source_hash(asset)
+        ]
+
+        for transformer in transformers:
+            key_parts.append(transformer.__config_name__)
+            key_parts.append(transformer.options.json(sort_keys=True))
+
+        if (
+                import_analysis is not None
+                and import_analysis.import_graph_known
+                and any(ImportGraphAnalyzer in transformer.REQUIRED_ANALYZERS for transformer in transformers)
+        ):
+            # whole-program transformations also depend on the modules importing this module
+            importing_modules = sorted(
+                (
+                    importing_module
+                    for importing_module in import_analysis.get_importing_modules(asset)
+                    if isinstance(importing_module, PythonModule)
+                ),
+                key=lambda x: x.name
+            )
+
+            for importing_module in importing_modules:
+                key_parts.append(importing_module.name)
+                key_parts.append(self._get_source_hash(importing_module))
+
+        return BuildCache.create_key(*key_parts)
+
+    def _estimate_cost(self, asset: Asset, source_size: int) -> float:
+        if asset.name in self._task_costs:
+            return self._task_costs[asset.name]
+
+        return source_size * Compiler.ESTIMATED_SECONDS_PER_BYTE
+
+    def _get_source_size(self, asset: Asset) -> int:
+        if isinstance(asset.source, FileContentSource):
+            return os.path.getsize(asset.source.path)
+
+        return len(str(asset.content))
+
+    def _get_source_hash(self, asset: Asset) -> str:
+        if asset not in self._source_hashes:
+            if isinstance(asset.source, FileContentSource):
+                with open(asset.source.path, 'rb') as f:
+                    source = f.read()
+            else:
+                source = str(asset.content)
+
+            self._source_hashes[asset] = BuildCache.create_key(source)
+
+        return self._source_hashes[asset]
+
+    @staticmethod
+    def _plan_passes(
+            transformers: Iterable[Transformer],
+            global_options: GlobalOptions
+    ) -> List[BatchPythonModuleTransformer]:
+        # analysis-driven transformers run before the simple ones, as they need the most intact trees
+        ordered_transformers = [
+            *(transformer for transformer in transformers if not isinstance(transformer, BatchablePythonModuleTransformer)),
+            *(transformer for transformer in transformers if isinstance(transformer, BatchablePythonModuleTransformer))
+        ]
+
+        return BatchPythonModuleTransformer.plan_passes(ordered_transformers, global_options=global_options)
+
+    @staticmethod
+    def _measure(report: Optional[BuildReport], scope: str, name: str) -> ContextManager:
+        if report is None:
+            return nullcontext()
+
+        return report.measure(scope, name)
 
     @staticmethod
     def _run_analysis(analyzer_class, import_analysis, subject) -> Analyzer.Analysis:
@@ -169,49 +525,152 @@ class Compiler:
         return import_analysis
 
     @staticmethod
-    def _transform_asset(asset, transformers, import_analysis):
-        for transformer in transformers:
-            batchable_analyzers = []
-            analyzers = []
-            import_analysis_required = False
-
-            for analyzer in transformer.REQUIRED_ANALYZERS:
-                if analyzer is ImportGraphAnalyzer:
-                    import_analysis_required = True
-                elif issubclass(analyzer, PythonModuleCstAnalyzer):
-                    batchable_analyzers.append(analyzer())
-                else:
-                    analyzers.append(analyzer)
+    def _transform_asset(asset, transformers, import_analysis, report=None):
+        with Compiler._measure(report, BuildReport.MODULES, asset.name):
+            for transformer in transformers:
+                # another thread may not evict the content while it's being analyzed and transformed
+                with AssetContentCache.pinned(asset.content):
+                    Compiler._apply_transformer(asset, transformer, import_analysis, report)
 
-            analyses = {
-                analyzer: analyzer().analyse_subject(asset)
-                for analyzer in analyzers
-            }
-
-            if len(batchable_analyzers) > 0:
-                batch_analyzer = BatchPythonModuleCstAnalyzer(batchable_analyzers)
+    @staticmethod
+    def _apply_transformer(asset, transformer, import_analysis, report=None):
+        batchable_analyzers = []
+        analyzers = []
+        import_analysis_required = False
+
+        for analyzer in transformer.REQUIRED_ANALYZERS:
+            if analyzer is ImportGraphAnalyzer:
+                import_analysis_required = True
+            elif issubclass(analyzer, PythonModuleCstAnalyzer):
+                batchable_analyzers.append(analyzer())
+            else:
+                analyzers.append(analyzer)
+
+        analyses = {}
+
+        for analyzer in analyzers:
+            with Compiler._measure(report, BuildReport.ANALYZERS, analyzer.__name__):
+                analyses[analyzer] = analyzer().analyse_subject(asset)
+
+        if len(batchable_analyzers) > 0:
+            batch_analyzer = BatchPythonModuleCstAnalyzer(batchable_analyzers)
+            analyzer_names = '+'.join(type(analyzer).__name__ for analyzer in batchable_analyzers)
+
+            with Compiler._measure(report, BuildReport.ANALYZERS, analyzer_names):
                 batch_analyses = batch_analyzer.analyse_subject(asset)
-                analyses = {**analyses, **batch_analyses}
 
-            if import_analysis_required:
-                analyses[ImportGraphAnalyzer] = import_analysis
+            analyses = {**analyses, **batch_analyses}
 
-            try:
+        if import_analysis_required:
+            analyses[ImportGraphAnalyzer] = import_analysis
+
+        try:
+            with Compiler._measure(report, BuildReport.TRANSFORMERS, Compiler._get_transformer_name(transformer)):
                 transformer.transform(analyses=analyses, subject=asset)
-            except Exception as e:
-                traceback.print_exc()
-                raise e
+        except Exception as e:
+            traceback.print_exc()
+            raise e
+
+        if report is not None:
+            for analyzer, analysis in analyses.items():
+                if analyzer is not ImportGraphAnalyzer:
+                    # the import analysis outlives this module, its memo tables are recorded once per build
+                    Compiler._record_memo_tables(report, analyzer, analysis)
 
     @staticmethod
-    def _transform_asset_parallel(asset, transformers):
-        for transformer in transformers:
-            transformer.transform(analyses={}, subject=asset)
+    def _record_memo_tables(report: BuildReport, analyzer: Type[Analyzer], analysis: Analyzer.Analysis):
+        for name, memo_table in analysis.memo_tables.items():
+            report.record_memo_table(
+                f'{analyzer.__name__}.{name}',
+                BuildReport.MemoTableStatistics(hits=memo_table.hits, misses=memo_table.misses)
+            )
+
+    @staticmethod
+    def _get_transformer_name(transformer: Transformer) -> str:
+        if isinstance(transformer, BatchPythonModuleTransformer):
+            # transformers fused into a single pass can't be measured separately
+            return '+'.join(transformer.__config_name__ for transformer in transformer.transformers)
+
+        return transformer.__config_name__
+
+    @staticmethod
+    def _transform_source(name, source, transformers, import_analysis=None, report=None) -> str:
+        asset = PythonModule(name=name, content=PythonModuleCst.from_string(source), source=None)
+        Compiler._transform_asset(asset, transformers, import_analysis, report)
+
+        return str(asset.content)
+
+    @staticmethod
+    def _transform_forked_asset(index: int, reported: bool = False) -> Union[str, Tuple[str, BuildReport]]:
+        asset, transformers, import_analysis = Compiler._forked_assets[index]
+        report = BuildReport() if reported else None
+        Compiler._transform_asset(asset, transformers, import_analysis, report)
+        content = str(asset.content)
+
+        if reported:
+            return content, report
+
+        return content
+
+    @staticmethod
+    def _transform_source_reported(name, source, transformers, import_analysis=None) -> Tuple[str, BuildReport]:
+        report = BuildReport()
+        content = Compiler._transform_source(name, source, transformers, import_analysis, report)
+
+        return content, report
+
+
+class _AssetWriter:
+    def __init__(self, max_pending: int):
+        # the queue is bounded, so the compiler doesn't run ahead of the writer with transformed assets
+        self._queue: Queue = Queue(maxsize=max_pending)
+        self._thread = Thread(target=self._run, daemon=True)
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> _AssetWriter:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._queue.put(None)
+        self._thread.join()
+
+        if exc_val is None:
+            self._raise_error()
+
+    def write(self, package: Package, bundle: Bundle, asset: Asset):
+        self._raise_error()
+        self._queue.put((package, bundle, asset))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+
+            if item is None:
+                return
+
+            if self._error is not None:
+                # drain the queue, so that the compiler isn't blocked
+                continue
+
+            package, bundle, asset = item
+
+            try:
+                bundle.bundle(package=package, assets=[asset])
+            except BaseException as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
 
 
 T = TypeVar('T')
 
 
 class Task:
+    DEFAULT_COST = 1.0
+
     def __init__(
             self,
             start_msg: str,
@@ -219,12 +678,19 @@ class Task:
             fail_msg: str,
             callable: Optional[Callable[..., T]] = None,
             nested_tasks: Optional[List[Task]] = None,
+            cost: float = DEFAULT_COST,
+            parallel: bool = False
     ):
         self._start_msg = start_msg
         self._complete_msg = complete_msg
         self._fail_msg = fail_msg
         self._callable = callable
+        self._cost = cost
+        self._parallel = parallel
         self._result = None
+        self._start_time = None
+        self._end_time = None
+        self._pid = None
 
         if nested_tasks is None:
             nested_tasks = []
@@ -243,6 +709,14 @@ class Task:
     def fail_msg(self) -> str:
         return self._fail_msg
 
+    @property
+    def cost(self) -> float:
+        return self._cost
+
+    @property
+    def parallel(self) -> bool:
+        return self._parallel
+
     @property
     def result(self):
         return self._result
@@ -251,33 +725,105 @@ class Task:
     def nested_tasks(self) -> List[Task]:
         return self._nested_tasks
 
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._start_time
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return self._end_time
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._pid
+
     def run(self) -> Task:
-        self._result = self._callable()
+        # wall clock time is comparable between the compiler and its worker processes
+        self._pid = os.getpid()
+        self._start_time = time.time()
+
+        try:
+            self._result = self._callable()
+        finally:
+            self._end_time = time.time()
+
         return self
 
+    @staticmethod
+    def run_chunk(tasks: List[Task]) -> List[Union[Task, Exception]]:
+        results = []
+
+        for task in tasks:
+            try:
+                results.append(task.run())
+            except Exception as e:
+                # a failing task doesn't fail the other tasks of its chunk
+                results.append(e)
+
+        return results
+
 
 class Executor(ABC):
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, trace: Optional[Trace] = None):
         self._logger = logger
+        self._trace = trace
 
     @property
     def logger(self) -> Logger:
         return self._logger
 
+    @property
+    def trace(self) -> Optional[Trace]:
+        return self._trace
+
+    @property
+    def out_of_process(self) -> bool:
+        return False
+
+    @property
+    def forks_workers(self) -> bool:
+        return False
+
+    def stop_workers(self):
+        pass
+
     @abstractmethod
     def execute(self, tasks: Iterable[Task], parallel: bool, ignore_errors: bool = False) -> Iterable[Task]:
         raise NotImplemented
 
+    @staticmethod
+    def create(options: ExecutorOptions, logger: Logger, trace: Optional[Trace] = None) -> Executor:
+        if options.backend is ExecutorBackend.SYNCHRONOUS:
+            return SynchronousExecutor(logger=logger, trace=trace)
+
+        return ConcurrentExecutor(logger=logger, trace=trace, backend=options.backend, workers=options.workers)
+
     def _execute_task(self, task: Task, ignore_errors: bool):
         self._logger.info(task.start_msg)
 
         if len(task.nested_tasks) > 0:
-            return list(self.execute(task.nested_tasks, parallel=False, ignore_errors=ignore_errors))
+            start_time = time.time()
+
+            try:
+                return list(self.execute(task.nested_tasks, parallel=task.parallel, ignore_errors=ignore_errors))
+            finally:
+                self._trace_span(task, start_time, time.time(), os.getpid())
 
+        return self._complete_task(task, task.run, ignore_errors)
+
+    def _complete_task(self, task: Task, run: Callable[[], Task], ignore_errors: bool):
         try:
-            result = task.run()
+            result = run()
+
+            if result.start_time is not None:
+                self._trace_span(task, result.start_time, result.end_time, result.pid)
+
             return result
         except Exception as e:
+            if task.start_time is not None:
+                # task failed in this process
+                self._trace_span(task, task.start_time, task.end_time, task.pid)
+
             self._logger.error(task.fail_msg, exc_info=None)
 
             if not ignore_errors:
@@ -286,6 +832,17 @@ class Executor(ABC):
 
             return None
 
+    def _trace_span(self, task: Task, start_time: float, end_time: float, pid: int):
+        if self._trace is None:
+            return
+
+        self._trace.add_span(
+            name=task.start_msg.lstrip('#.! '),
+            start_time=start_time,
+            end_time=end_time,
+            pid=pid
+        )
+
 
 class SynchronousExecutor(Executor):
     def execute(self, tasks: Iterable[Task], parallel: bool = False, ignore_errors: bool = False) -> Iterable[Task]:
@@ -296,17 +853,109 @@ class SynchronousExecutor(Executor):
 
 
 class ConcurrentExecutor(Executor):
-    def __init__(self, sync_executor: SynchronousExecutor, *args, **kwargs):
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(
+            self,
+            *args,
+            backend: ExecutorBackend = ExecutorBackend.LOKY,
+            workers: Optional[int] = None,
+            **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self._sync_executor = sync_executor
-        os.environ['LOKY_PICKLER'] = 'cloudpickle'
-        self._executor = get_reusable_executor()
+        self._backend = backend
+        self._num_workers = workers if workers is not None else cpu_count()
+        self._executor = None
+
+    @property
+    def backend(self) -> ExecutorBackend:
+        return self._backend
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    @property
+    def out_of_process(self) -> bool:
+        return not self._backend.in_process
+
+    @property
+    def forks_workers(self) -> bool:
+        return self._backend is ExecutorBackend.FORK
+
+    def stop_workers(self):
+        if self._executor is not None and self._backend is not ExecutorBackend.LOKY:
+            self._executor.shutdown()
+            self._executor = None
 
     def execute(self, tasks: Iterable[Task], parallel: bool = False, ignore_errors: bool = False) -> Iterable[Task]:
         if parallel:
-            return self._executor.map(
-                lambda x: x.run(),
-                tasks
+            tasks = list(tasks)
+            runs = [None] * len(tasks)
+
+            for chunk in ConcurrentExecutor._plan_chunks(tasks, self._num_workers * ConcurrentExecutor.CHUNKS_PER_WORKER):
+                future = self._get_executor().submit(Task.run_chunk, [tasks[index] for index in chunk])
+
+                for position, index in enumerate(chunk):
+                    runs[index] = partial(ConcurrentExecutor._get_chunk_result, future, position)
+
+            return map(
+                lambda x: self._collect_task(*x, ignore_errors=ignore_errors),
+                zip(tasks, runs)
             )
 
-        return self._sync_executor.execute(tasks, ignore_errors=ignore_errors)
\ No newline at end of file
+        return map(
+            lambda x: self._execute_task(x, ignore_errors=ignore_errors),
+            tasks
+        )
+
+    def _get_executor(self) -> BaseExecutor:
+        if self._executor is None:
+            # workers are started on first use, forked workers then start from the loaded compiler state
+            if self._backend is ExecutorBackend.LOKY:
+                set_loky_pickler('cloudpickle')
+                self._executor = get_reusable_executor(max_workers=self._num_workers)
+            elif self._backend is ExecutorBackend.FORK:
+                self._executor = ProcessPoolExecutor(max_workers=self._num_workers, mp_context=get_context('fork'))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._num_workers)
+
+        return self._executor
+
+    def _collect_task(self, task: Task, run: Callable[[], Task], ignore_errors: bool):
+        self._logger.info(task.start_msg)
+
+        return self._complete_task(task, run, ignore_errors)
+
+    @staticmethod
+    def _plan_chunks(tasks: List[Task], num_chunks: int) -> List[List[int]]:
+        # the most expensive tasks are submitted first, so that they don't end up in the tail of the build, while
+        # cheap tasks are grouped into chunks of similar cost to save on submission overhead
+        ordered_indexes = sorted(range(len(tasks)), key=lambda index: tasks[index].cost, reverse=True)
+        chunk_cost = sum(task.cost for task in tasks) / num_chunks
+        chunks = []
+        chunk = []
+        cost = 0
+
+        for index in ordered_indexes:
+            chunk.append(index)
+            cost += tasks[index].cost
+
+            if cost >= chunk_cost:
+                chunks.append(chunk)
+                chunk = []
+                cost = 0
+
+        if len(chunk) > 0:
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def _get_chunk_result(future: Future, position: int) -> Task:
+        result = future.result()[position]
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
\ No newline at end of file
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Mapping, Union, TypeVar, Generic, Iterable, Sequence
+from typing import Mapping, Union, TypeVar, Generic, Iterable, Sequence, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt, validator
 
 from snakepack.bundlers import Bundler, Bundle
 from snakepack.config.options import ComponentConfig
-from snakepack.config.types import PythonVersion
+from snakepack.config.types import PythonVersion, ExecutorBackend
 from snakepack.loaders import Loader
 from snakepack.packagers import Packager, Package
 from snakepack.transformers import Transformer
@@ -18,6 +18,9 @@ class GlobalOptions(BaseModel):
     target_base_path: Path = Path('dist/')
     target_version: PythonVersion = PythonVersion.current()
     ignore_errors: bool = True
+    cache_path: Optional[Path] = None
+    max_memory: Optional[int] = None
+    stream: bool = False
 
 
 class BundleConfig(BaseModel):
@@ -31,5 +34,23 @@ class PackageConfig(BaseModel):
     bundles: Mapping[str, BundleConfig] = {}
 
 
+class ExecutorOptions(BaseModel):
+    backend: ExecutorBackend = ExecutorBackend.SYNCHRONOUS
+    workers: Optional[PositiveInt] = None
+
+
+class ExecutorConfig(BaseModel):
+    load: Optional[ExecutorOptions] = None
+    transform: Optional[ExecutorOptions] = None
+    package: Optional[ExecutorOptions] = None
+
+    @validator('load', 'package', allow_reuse=True)
+    def validate_in_process(cls, value):
+        # loading and packaging modify the asset tree of the compiler
+        assert value is None or value.backend.in_process, 'Only the synchronous and thread backends are supported'
+        return value
+
+
 class SnakepackConfig(GlobalOptions):
     packages: Mapping[str, PackageConfig] = {}
+    executor: ExecutorConfig = ExecutorConfig()
@@ -4,7 +4,8 @@ import re
 import sys
 from abc import ABC
 from enum import Enum, unique
-from typing import Sequence, Optional, Match, Union
+from fnmatch import translate
+from typing import Sequence, Optional, Match, Union, Generic, TypeVar, Dict, List, Set, Pattern, Tuple
 
 
 class Selector(ABC, str):
@@ -39,8 +40,20 @@ class PythonVersion(Enum):
         return PythonVersion(f'{sys.version_info[0]}.{sys.version_info[1]}')
 
 
+@unique
+class ExecutorBackend(Enum):
+    SYNCHRONOUS = 'synchronous'
+    THREAD = 'thread'
+    FORK = 'fork'
+    LOKY = 'loky'
+
+    @property
+    def in_process(self) -> bool:
+        return self in {ExecutorBackend.SYNCHRONOUS, ExecutorBackend.THREAD}
+
+
 class FullyQualifiedPythonName(Selector):
-    _MODULE_NAME_REGEX = r'([a-zA-Z0-9_]+)(\.[a-zA-Z0-9_]+)*'
+    _MODULE_NAME_REGEX = r'([a-zA-Z0-9_*]+)(\.[a-zA-Z0-9_*]+)*'
     _IDENTIFIER_NAME_REGEX = r'([a-zA-Z_][a-zA-Z0-9_]*)(\.[a-zA-Z_][a-zA-Z0-9_]*)*'
 
     REGEX = re.compile(
@@ -96,3 +109,90 @@ class FullyQualifiedPythonName(Selector):
     @classmethod
     def validate(cls, value):
         return cls(value)
+
+    @staticmethod
+    def match_module_path(selector_path: Sequence[str], module_path: Sequence[str]) -> bool:
+        # a module path selects itself and all modules below it, '*' matches any characters within a segment
+        return len(selector_path) <= len(module_path) and all(
+            _compile_segment(selector_segment).fullmatch(module_segment) is not None
+            for selector_segment, module_segment in zip(selector_path, module_path)
+        )
+
+
+V = TypeVar('V')
+
+
+class SelectorIndex(Generic[V]):
+    def __init__(self):
+        self._root = SelectorIndex._Node()
+
+    def add(self, selector: Selector, value: V):
+        if not isinstance(selector, FullyQualifiedPythonName):
+            # other selectors never select modules
+            return
+
+        node = self._root
+
+        if not selector.has_ident_path:
+            # identifier selectors apply to every module, as they may select identifiers within it
+            for segment in selector._module_path:
+                node = node.get_child(segment)
+
+        node.values.add(value)
+
+    def match(self, module_name: str) -> Set[V]:
+        matched_values = set(self._root.values)
+        nodes = [self._root]
+
+        for segment in module_name.split('.'):
+            nodes = [child for node in nodes for child in node.get_matching_children(segment)]
+
+            if len(nodes) == 0:
+                break
+
+            for node in nodes:
+                matched_values.update(node.values)
+
+        return matched_values
+
+    class _Node:
+        def __init__(self):
+            self._children: Dict[str, SelectorIndex._Node] = {}
+            self._pattern_children: List[Tuple[Pattern, SelectorIndex._Node]] = []
+            self.values = set()
+
+        def get_child(self, segment: str) -> SelectorIndex._Node:
+            if '*' not in segment:
+                if segment not in self._children:
+                    self._children[segment] = SelectorIndex._Node()
+
+                return self._children[segment]
+
+            pattern = _compile_segment(segment)
+
+            for child_pattern, child in self._pattern_children:
+                if child_pattern == pattern:
+                    return child
+
+            child = SelectorIndex._Node()
+            self._pattern_children.append((pattern, child))
+
+            return child
+
+        def get_matching_children(self, segment: str) -> List[SelectorIndex._Node]:
+            children = [child for pattern, child in self._pattern_children if pattern.fullmatch(segment) is not None]
+
+            if segment in self._children:
+                children.append(self._children[segment])
+
+            return children
+
+
+_segment_patterns: Dict[str, Pattern] = {}
+
+
+def _compile_segment(segment: str) -> Pattern:
+    if segment not in _segment_patterns:
+        _segment_patterns[segment] = re.compile(translate(segment))
+
+    return _segment_patterns[segment]
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Mapping, Iterable
+from typing import Mapping, Iterable, Optional, Callable
 
-from snakepack.assets import AssetGroup
+from snakepack.assets import AssetGroup, Asset
 from snakepack.config.options import ConfigurableComponent
 
 
 class Loader(ConfigurableComponent, ABC):
     @abstractmethod
-    def load(self) -> AssetGroup:
+    def load(self, pass_through: Optional[Callable[[Asset], bool]] = None) -> AssetGroup:
         raise NotImplementedError
\ No newline at end of file
@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Sequence
+from typing import Sequence, Optional, Callable
 
-from snakepack.assets import AssetGroup
+from snakepack.assets import AssetGroup, Asset
 from snakepack.assets._base import GenericAssetGroup, FileContentSource
 from snakepack.assets.generic import StaticFile
 from snakepack.config.options import Options
@@ -9,7 +9,7 @@ from snakepack.loaders import Loader
 
 
 class StaticFileLoader(Loader):
-    def load(self) -> GenericAssetGroup:
+    def load(self, pass_through: Optional[Callable[[Asset], bool]] = None) -> GenericAssetGroup:
         assets = []
 
         for path in self._options.paths:
@@ -1,30 +1,39 @@
-import functools
+from __future__ import annotations
+
+import os
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from fnmatch import fnmatch
 from functools import reduce
-from importlib.machinery import all_suffixes
+from importlib.machinery import all_suffixes, PathFinder, SourceFileLoader, ExtensionFileLoader
 from importlib.resources import is_resource
 from operator import getitem
 
-from pathlib import Path
-from site import getsitepackages
-from typing import List, Iterable, Optional
+from pathlib import Path, PurePosixPath
+from site import getsitepackages, getusersitepackages
+from typing import List, Iterable, Optional, Sequence, Dict, Deque, Tuple, Mapping, Any, Union, Callable
 
-from modulegraph.find_modules import find_modules, parse_mf_results
-from modulegraph.modulegraph import ModuleGraph, Package, Node
 from stdlib_list import stdlib_list
 
-from snakepack.analyzers.python.imports import ImportGraphAnalyzer
+import snakepack
+from snakepack.analyzers.python.imports import ImportGraphAnalyzer, ImportGraph, _get_imported_module_names, \
+    _scan_imported_module_names, _get_import_stmts, _get_module_import_stmts
+from snakepack.assets import Asset
 from snakepack.assets._base import FileContentSource
 from snakepack.assets.generic import StaticFile
 from snakepack.assets.python import PythonModule, PythonApplication, PythonPackage, PythonModuleCst
+from snakepack.cache import BuildCache
 from snakepack.config.options import Options
 from snakepack.config.types import FullyQualifiedPythonName
 from snakepack.loaders import Loader
 
 
-_STDLIB_PATHS = [Path(path) for path in set(sys.path) - set(getsitepackages())]
-_STDLIB_MODULES = {}
+_SOURCE_SUFFIX = '.py'
+_PYTHON_SUFFIXES = tuple(all_suffixes())
+_INIT_FILE_NAME = '__init__.py'
+_SITE_PATHS = {*getsitepackages(), getusersitepackages()}
+_STDLIB_PATHS = set(sys.path) - _SITE_PATHS
 
 
 class ImportGraphLoader(Loader):
@@ -36,62 +45,85 @@ class ImportGraphLoader(Loader):
     def analysis(self) -> ImportGraphAnalyzer.Analysis:
         return self._analysis
 
-    def load(self) -> PythonApplication:
-        entry_point_path = self.global_options.source_base_path / self._options.entry_point
-        module_graph = find_modules((str(entry_point_path),), includes=self._options.includes)
-        python_modules, c_extensions = parse_mf_results(module_graph)
-
-        entry_point = None
-        modules = []
-
-        pkg_dict = {}
-        node_map = {}
+    def load(self, pass_through: Optional[Callable[[Asset], bool]] = None) -> PythonApplication:
+        entry_point_path = (self.global_options.source_base_path / self._options.entry_point).resolve()
+        search_path = [str(entry_point_path.parent), *sys.path]
+        cache = None
+        cache_key = None
+        cached_state = None
+
+        if self.global_options.cache_path is not None:
+            # the import graph of the previous run is revalidated against the files' current stats
+            cache = BuildCache(path=self.global_options.cache_path)
+            cache_key = BuildCache.create_key(
+                snakepack.__version__,
+                str(self._options.target_version),
+                str(self._options.exclude_stdlib),
+                str(entry_point_path),
+                *self._options.includes,
+                *search_path
+            )
+            cached_state = cache.load_import_graph(cache_key)
+
+        scanner = _ImportScanner(
+            search_path=search_path,
+            python_version=self._options.target_version,
+            exclude_stdlib=self._options.exclude_stdlib,
+            cached_state=cached_state,
+            pass_through=pass_through
+        )
+        entry_point = scanner.scan_script(entry_point_path, name=self._get_entry_point_name(entry_point_path))
 
-        for python_module in python_modules:
-            if not self._is_stdlib(
-                    module_name=python_module.identifier,
-                    file_path=Path(python_module.filename),
-                    python_version=self._options.target_version
-            ):
-                module = self._create_python_dep(python_module, entry_point_path)
-                module_path_segments = module.name.split('.')
-                pkg_name = '.'.join(module_path_segments[:-1])
-                module_name = module_path_segments[-1]
+        for include in self._options.includes:
+            scanner.scan_module('.'.join(include.module_path))
 
-                if module.source.path == str(entry_point_path.resolve()):
-                    entry_point = module
+        if cache is not None:
+            cache.store_import_graph(cache_key, scanner.state)
 
-                if len(pkg_name) > 0:
-                    # module is in a package
-                    pkg_path = Path(module.source.path).parent
+        modules = []
+        pkg_dict = {}
 
-                    if not (pkg_name, pkg_path) in pkg_dict:
-                        pkg_dict[(pkg_name, pkg_path)] = []
+        for module in scanner.node_map:
+            module_path_segments = module.name.split('.')
+            pkg_name = '.'.join(module_path_segments[:-1])
 
-                    pkg_dict[(pkg_name, pkg_path)].append(module)
-                else:
-                    # module is not in a package
-                    modules.append(module)
+            if len(pkg_name) > 0:
+                # module is in a package
+                pkg_path = Path(module.source.path).parent
 
-                node_map[module] = python_module
+                if not (pkg_name, pkg_path) in pkg_dict:
+                    pkg_dict[(pkg_name, pkg_path)] = []
 
-        assert entry_point is not None, 'Didn\t encounter entry point module in import graph'
+                pkg_dict[(pkg_name, pkg_path)].append(module)
+            else:
+                # module is not in a package
+                modules.append(module)
 
         pkg_obj_dict = {}
+        pkg_paths = {str(pkg_path) for _, pkg_path in pkg_dict}
+
+        with _DirectoryScanner() as directory_scanner:
+            for pkg_name_and_path, pkg_modules in pkg_dict.items():
+                pkg_name, pkg_path = pkg_name_and_path
+                data_files = []
+
+                if self._options.load_data_files:
+                    # subpackages that aren't imported keep their data files in the package that contains them
+                    data_files = _load_data_files(
+                        directory_scanner,
+                        pkg_name=pkg_name,
+                        directory=directory_scanner.scan(pkg_path),
+                        skip=lambda subdirectory: subdirectory.path in pkg_paths,
+                        includes=self._options.data_file_includes,
+                        excludes=self._options.data_file_excludes
+                    )
 
-        for pkg_name_and_path, pkg_modules in pkg_dict.items():
-            pkg_name, pkg_path = pkg_name_and_path
-            data_files = []
-
-            if self._options.load_data_files:
-                data_files = self._get_data_files(pkg_path, pkg_path)
-
-            pkg_obj_dict[pkg_name] = PythonPackage(
-                full_name=pkg_name,
-                modules=pkg_modules,
-                subpackages=[],
-                data_files=data_files
-            )
+                pkg_obj_dict[pkg_name] = PythonPackage(
+                    full_name=pkg_name,
+                    modules=pkg_modules,
+                    subpackages=[],
+                    data_files=data_files
+                )
 
         for pkg_name, pkg_obj in pkg_obj_dict.items():
             parent_pkg_name = '.'.join(pkg_obj.full_name.split('.')[:-1])
@@ -113,73 +145,25 @@ class ImportGraphLoader(Loader):
         )
 
         analyzer = ImportGraphAnalyzer(
-            module_graph=module_graph,
-            node_map=node_map
+            module_graph=scanner.import_graph,
+            node_map=scanner.node_map
         )
 
         self._analysis = analyzer.analyse_assets(application)
 
         return application
 
-    def _get_data_files(self, root_path, path) -> Iterable[Path]:
-        files = set()
-
-        for sub_path in path.iterdir():
-            if sub_path.is_file() and _is_data_file(sub_path):
-                static_file_path = sub_path.relative_to(root_path.parent)
-                static_file = StaticFile.from_source(
-                    name=static_file_path,
-                    target_path=static_file_path,
-                    source=FileContentSource(
-                        path=sub_path,
-                        binary=True
-                    )
-                )
-                files.add(static_file)
-            elif sub_path.is_dir() and _is_data_file_dir(sub_path):
-                files.update(self._get_data_files(root_path, sub_path))
-
-        return files
-
     @staticmethod
-    def _create_python_dep(dependency: Node, entry_path: Path) -> PythonModule:
-        if isinstance(dependency, Package):
-            asset = PythonModule.from_source(
-                name=dependency.identifier + '.__init__',
-                source=FileContentSource(dependency.filename, default_content_type=PythonModuleCst)
-            )
-        else:
-            if str(entry_path.resolve()) == dependency.identifier:
-                name = entry_path.stem
+    def _get_entry_point_name(entry_point_path: Path) -> str:
+        name = entry_point_path.stem
 
-                for parent in entry_path.parents:
-                    init_file = parent / '__init__.py'
+        for parent in entry_point_path.parents:
+            init_file = parent / '__init__.py'
 
-                    if init_file.exists():
-                        name = parent.stem + '.' + name
-            else:
-                name = dependency.identifier
-
-            asset = PythonModule.from_source(
-                name=name,
-                source=FileContentSource(dependency.filename, default_content_type=PythonModuleCst)
-            )
+            if init_file.exists():
+                name = parent.stem + '.' + name
 
-        return asset
-
-    @staticmethod
-    @functools.lru_cache()
-    def _is_stdlib(module_name: str, file_path: Path, python_version) -> bool:
-        global _STDLIB_MODULES
-
-        if python_version not in _STDLIB_MODULES:
-            _STDLIB_MODULES[python_version] = set(stdlib_list(str(python_version)))
-            _STDLIB_MODULES[python_version].add('sitecustomize')
-
-        return (
-                any(map(lambda x: x in file_path.parents, _STDLIB_PATHS))
-                and module_name in _STDLIB_MODULES[python_version]
-        )
+        return name
 
     class Options(Options):
         entry_point: Path
@@ -187,6 +171,8 @@ class ImportGraphLoader(Loader):
         target_version: str = '3.9'
         includes: List[FullyQualifiedPythonName] = []
         load_data_files: bool = True
+        data_file_includes: List[str] = []
+        data_file_excludes: List[str] = []
 
     __config_name__ = 'import_graph'
 
@@ -196,7 +182,7 @@ class PackageLoader(Loader):
         super().__init__(*args, **kwargs)
         self._analysis = None
 
-    def load(self) -> PythonPackage:
+    def load(self, pass_through: Optional[Callable[[Asset], bool]] = None) -> PythonPackage:
         pkg_name = self._options.pkg_name.module_path[0]
         pkg_path = self._global_options.source_base_path
 
@@ -205,7 +191,9 @@ class PackageLoader(Loader):
 
         pkg_path = pkg_path / pkg_name
 
-        python_pkg = self._load_package(pkg_name, pkg_path)
+        with _DirectoryScanner() as scanner:
+            python_pkg = self._load_package(scanner, pkg_name, pkg_path, pass_through)
+
         analyzer = ImportGraphAnalyzer()
         self._analysis = analyzer.analyse_assets(python_pkg)
 
@@ -215,56 +203,531 @@ class PackageLoader(Loader):
     def analysis(self) -> ImportGraphAnalyzer.Analysis:
         return self._analysis
 
-    def _load_package(self, pkg_name, pkg_path: Path):
-        subpackages = []
-        modules = []
+    def _load_package(
+            self,
+            scanner: _DirectoryScanner,
+            pkg_name: str,
+            pkg_path: Path,
+            pass_through: Optional[Callable[[Asset], bool]]
+    ) -> PythonPackage:
+        directory = scanner.scan(pkg_path)
+        subpackages = [
+            self._load_package(scanner, f'{pkg_name}.{subdirectory.name}', Path(subdirectory.path), pass_through)
+            for subdirectory in scanner.get_subdirectories(directory)
+            if subdirectory.is_package
+        ]
+        modules = [
+            _load_module(
+                name=f'{pkg_name}.{file_name[:-len(_SOURCE_SUFFIX)]}',
+                path=Path(directory.path) / file_name,
+                origin=PythonModule.Origin.APPLICATION,
+                pass_through=pass_through
+            )
+            for file_name in directory.files
+            if file_name.endswith(_SOURCE_SUFFIX)
+        ]
         data_files = []
-        package = PythonPackage(full_name=pkg_name, subpackages=subpackages, modules=modules, data_files=data_files)
-
-        for path in pkg_path.iterdir():
-            full_name = f'{pkg_name}.{path.stem}'
-
-            if path.is_dir() and (path / '__init__.py').is_file() and _is_data_file_dir(path):
-                # subpackage
-                subpackages.append(self._load_package(full_name, path))
-            elif path.suffix == '.py':
-                # module
-                modules.append(
-                    PythonModule.from_source(
-                        name=full_name,
-                        source=FileContentSource(path=path, default_content_type=PythonModuleCst)
-                    )
-                )
-            elif self._options.load_data_files and _is_data_file(path):
-                static_file_path = Path(f"{package.full_name.replace('.', '/')}/{path.name}")
-                data_files.append(
-                    StaticFile.from_source(
-                        name=str(static_file_path),
-                        target_path=static_file_path,
-                        source=FileContentSource(
-                            path=path,
-                            binary=True
-                        )
-                    )
-                )
 
-        return package
+        if self._options.load_data_files:
+            # data files in subpackages belong to the subpackage
+            data_files = _load_data_files(
+                scanner,
+                pkg_name=pkg_name,
+                directory=directory,
+                skip=lambda subdirectory: subdirectory.is_package,
+                includes=self._options.data_file_includes,
+                excludes=self._options.data_file_excludes
+            )
+
+        return PythonPackage(full_name=pkg_name, subpackages=subpackages, modules=modules, data_files=data_files)
 
     class Options(Options):
         pkg_name: FullyQualifiedPythonName
         pkg_base_path: Optional[Path] = None
         target_version: str = '3.9'
         load_data_files: bool = True
+        data_file_includes: List[str] = []
+        data_file_excludes: List[str] = []
 
     __config_name__ = 'package'
 
 
-def _is_data_file(path: Path) -> bool:
-    return path.is_file() and not any(path.name.endswith(sfx) for sfx in all_suffixes())
+class _ImportScanner:
+    _SOURCE_MODULE = 'module'
+    _PACKAGE = 'package'
+    _NAMESPACE_PACKAGE = 'namespace'
+    _EXTENSION = 'extension'
+
+    def __init__(
+            self,
+            search_path: Sequence[str],
+            python_version: str,
+            exclude_stdlib: bool = True,
+            cached_state: Optional[Mapping[str, Any]] = None,
+            pass_through: Optional[Callable[[Asset], bool]] = None
+    ):
+        self._search_path = search_path
+        self._stdlib_index = _StdlibIndex.for_version(python_version)
+        self._exclude_stdlib = exclude_stdlib
+        self._pass_through = pass_through
+        self._import_graph = ImportGraph()
+        self._node_map: Dict[PythonModule, ImportGraph.Node] = {}
+        self._nodes_by_name: Dict[str, Optional[ImportGraph.Node]] = {}
+        self._nodes_by_path: Dict[str, ImportGraph.Node] = {}
+        self._search_locations: Dict[str, Sequence[str]] = {}
+        self._scan_queue: Deque[Tuple[PythonModule, ImportGraph.Node]] = deque()
+        self._search_path_stats = {path: _stat(path) for path in search_path}
+        self._resolved_names: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._unresolved_names: Dict[str, Dict[str, Optional[List[int]]]] = {}
+        self._imported_names: Dict[str, Dict[str, Any]] = {}
+        self._directory_stats: Dict[str, Optional[List[int]]] = {}
+
+        if cached_state is not None and cached_state['search_path'] == self._search_path_stats:
+            self._cached_resolved_names = cached_state['resolved_names']
+            self._cached_unresolved_names = cached_state.get('unresolved_names', {})
+        else:
+            # modules may have been added to or removed from the search path, resolve all names again
+            self._cached_resolved_names = {}
+            self._cached_unresolved_names = {}
+
+        self._cached_imported_names = cached_state['imported_names'] if cached_state is not None else {}
+
+    @property
+    def import_graph(self) -> ImportGraph:
+        return self._import_graph
+
+    @property
+    def node_map(self) -> Dict[PythonModule, ImportGraph.Node]:
+        return self._node_map
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {
+            'search_path': self._search_path_stats,
+            'resolved_names': self._resolved_names,
+            'unresolved_names': self._unresolved_names,
+            'imported_names': self._imported_names
+        }
+
+    def scan_script(self, path: Path, name: str) -> PythonModule:
+        node = self._import_graph.add_node(ImportGraph.SourceModule(identifier=name, filename=str(path)))
+        module = self._add_module(name, node, origin=PythonModule.Origin.APPLICATION)
+        self._scan()
+
+        return module
+
+    def scan_module(self, name: str):
+        self._import_module(name, importing_node=None)
+        self._scan()
+
+    def _scan(self):
+        while len(self._scan_queue) > 0:
+            module, node = self._scan_queue.popleft()
+            stat = _stat(node.filename)
+            cached_imported_names = self._cached_imported_names.get(node.filename)
+
+            if cached_imported_names is not None and cached_imported_names['stat'] == stat:
+                # module is unchanged since the previous run, it doesn't need to be parsed to find its imports
+                imported_names = cached_imported_names['names']
+            else:
+                imported_names = self._get_imported_names(module)
+
+            self._imported_names[node.filename] = {
+                'stat': stat,
+                'names': imported_names
+            }
+
+            for imported_name in imported_names:
+                if len(imported_name) == 0 or imported_name.startswith('.'):
+                    # relative import beyond the top-level package
+                    continue
+
+                # imported name is either a (sub)module or an identifier in a module
+                self._import_module(imported_name, node)
+
+    def _import_module(self, name: str, importing_node: Optional[ImportGraph.Node]) -> Optional[ImportGraph.Node]:
+        name_segments = name.split('.')
+        node = None
+
+        for index in range(len(name_segments)):
+            # importing a submodule imports all of its parent packages
+            node = self._load_module('.'.join(name_segments[:index + 1]))
+
+            if node is None:
+                return None
+
+            if importing_node is not None:
+                self._import_graph.add_edge(importing_node, node)
+
+        return node
+
+    def _load_module(self, name: str) -> Optional[ImportGraph.Node]:
+        if name in self._nodes_by_name:
+            return self._nodes_by_name[name]
+
+        self._nodes_by_name[name] = None
+        resolved_name = self._cached_resolved_names.get(name, False)
+        parent_stats = self._get_parent_search_locations_stats(name)
+
+        if resolved_name is None and self._cached_unresolved_names.get(name) != parent_stats:
+            # a submodule may have been added to the parent package since the name couldn't be resolved
+            resolved_name = False
+
+        if resolved_name is False or (
+                resolved_name is not None
+                and resolved_name['filename'] is not None
+                and not os.path.exists(resolved_name['filename'])
+        ):
+            # name wasn't resolved before or the module it was resolved to has been removed
+            resolved_name = self._resolve_name(name)
+
+        self._resolved_names[name] = resolved_name
+
+        if resolved_name is None:
+            self._unresolved_names[name] = parent_stats
+            return None
+
+        kind = resolved_name['kind']
+        filename = resolved_name['filename']
+
+        if resolved_name['search_locations'] is not None:
+            self._search_locations[name] = resolved_name['search_locations']
+
+        if kind == self._NAMESPACE_PACKAGE:
+            # namespace package, its submodules can be imported but it has no module of its own
+            node = self._import_graph.add_node(ImportGraph.Package(identifier=name))
+        elif filename in self._nodes_by_path:
+            # module was already loaded under another name, e.g. the entry point
+            node = self._nodes_by_path[filename]
+        elif kind == self._PACKAGE:
+            node = self._import_graph.add_node(ImportGraph.Package(identifier=name, filename=filename))
+            self._add_module(f'{name}.__init__', node, PythonModule.Origin(resolved_name['origin']))
+        elif kind == self._SOURCE_MODULE:
+            node = self._import_graph.add_node(ImportGraph.SourceModule(identifier=name, filename=filename))
+            self._add_module(name, node, PythonModule.Origin(resolved_name['origin']))
+        else:
+            node = self._import_graph.add_node(ImportGraph.Extension(identifier=name, filename=filename))
+
+        self._nodes_by_name[name] = node
+
+        return node
+
+    def _get_parent_search_locations_stats(self, name: str) -> Dict[str, Optional[List[int]]]:
+        # top-level names are found in the search path, whose stats are checked for all cached names at once
+        parent_name, _, _ = name.rpartition('.')
+        stats = {}
+
+        for path in self._search_locations.get(parent_name, ()):
+            if path not in self._directory_stats:
+                self._directory_stats[path] = _stat(path)
+
+            stats[path] = self._directory_stats[path]
+
+        return stats
+
+    def _resolve_name(self, name: str) -> Optional[Dict[str, Any]]:
+        parent_name, _, _ = name.rpartition('.')
+
+        if len(parent_name) > 0:
+            search_path = self._search_locations.get(parent_name)
+
+            if search_path is None:
+                # parent isn't a package, name refers to an identifier
+                return None
+        elif name in sys.builtin_module_names:
+            return None
+        else:
+            search_path = self._search_path
+
+        try:
+            spec = PathFinder.find_spec(name, search_path)
+        except (ImportError, ValueError):
+            spec = None
 
+        if spec is None:
+            return None
+
+        search_locations = None
+
+        if spec.submodule_search_locations is not None:
+            search_locations = list(spec.submodule_search_locations)
+
+        if spec.origin is None or not spec.has_location:
+            kind = self._NAMESPACE_PACKAGE
+        elif self._exclude_stdlib and self._stdlib_index.is_stdlib(name, spec.origin):
+            return None
+        elif isinstance(spec.loader, SourceFileLoader):
+            kind = self._PACKAGE if search_locations is not None else self._SOURCE_MODULE
+        elif isinstance(spec.loader, ExtensionFileLoader):
+            kind = self._EXTENSION
+        else:
+            return None
+
+        filename = None
+        origin = None
+
+        if kind != self._NAMESPACE_PACKAGE:
+            filename = spec.origin
+            origin = self._get_origin(name, filename).value
+
+        return {
+            'kind': kind,
+            'filename': filename,
+            'origin': origin,
+            'search_locations': search_locations
+        }
+
+    def _get_origin(self, name: str, filename: str) -> PythonModule.Origin:
+        if self._stdlib_index.is_stdlib(name, filename):
+            return PythonModule.Origin.STDLIB
+        elif _SITE_PATH_TRIE.contains(filename):
+            return PythonModule.Origin.THIRD_PARTY
+
+        return PythonModule.Origin.APPLICATION
+
+    def _get_imported_names(self, module: PythonModule) -> List[str]:
+        if module.pass_through:
+            try:
+                return list(_scan_imported_module_names(module.name, bytes(module.content)))
+            except SyntaxError:
+                # the module uses syntax the running interpreter doesn't support
+                import_stmts = _get_import_stmts(
+                    PythonModuleCst.from_string(str(module.content)).metadata_wrapper.resolve_many(
+                        ImportGraphAnalyzer.CST_PROVIDERS
+                    )
+                )
+        else:
+            # the module's syntax tree is parsed once, the import graph analysis resolves its imports from the same tree
+            import_stmts = _get_module_import_stmts(module)
+
+        return list(_get_imported_module_names(module.name, import_stmts))
+
+    def _add_module(self, name: str, node: ImportGraph.Node, origin: PythonModule.Origin) -> PythonModule:
+        module = _load_module(name=name, path=node.filename, origin=origin, pass_through=self._pass_through)
+        self._nodes_by_path[node.filename] = node
+        self._node_map[module] = node
+        self._scan_queue.append((module, node))
+
+        return module
+
+
+class _PathTrie:
+    _TERMINAL = None
+
+    def __init__(self, paths: Iterable[str]):
+        self._root = {}
+        self._dirs: Dict[str, bool] = {}
+
+        for path in paths:
+            node = self._root
+
+            for part in os.path.normpath(path).split(os.sep):
+                node = node.setdefault(part, {})
+
+            node[self._TERMINAL] = True
+
+    def contains(self, path: str) -> bool:
+        # modules are mostly looked up from a few directories, classify each directory only once
+        dir_path = os.path.dirname(path)
+        contained = self._dirs.get(dir_path)
+
+        if contained is None:
+            contained = self._dirs[dir_path] = self._contains_dir(dir_path)
+
+        return contained
+
+    def _contains_dir(self, dir_path: str) -> bool:
+        node = self._root
+
+        for part in dir_path.split(os.sep):
+            node = node.get(part)
+
+            if node is None:
+                return False
+            elif self._TERMINAL in node:
+                return True
+
+        return False
+
+
+class _StdlibIndex:
+    _indexes: Dict[str, _StdlibIndex] = {}
+
+    def __init__(self, python_version: str):
+        self._module_names = {*stdlib_list(str(python_version)), 'sitecustomize'}
+        self._path_trie = _PathTrie(_STDLIB_PATHS)
+
+    @classmethod
+    def for_version(cls, python_version: str) -> _StdlibIndex:
+        python_version = str(python_version)
+
+        if python_version not in cls._indexes:
+            cls._indexes[python_version] = cls(python_version)
+
+        return cls._indexes[python_version]
+
+    def is_stdlib(self, module_name: str, filename: str) -> bool:
+        return module_name.partition('.')[0] in self._module_names and self._path_trie.contains(filename)
+
+
+_SITE_PATH_TRIE = _PathTrie(_SITE_PATHS)
+
+
+def _stat(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class _DirectoryScanner:
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._thread_pool = None
+        self._directories: Dict[str, _DirectoryScanner.Directory] = {}
+
+    def __enter__(self) -> _DirectoryScanner:
+        self._thread_pool = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._thread_pool.shutdown()
+
+    def scan(self, path: Union[str, Path]) -> _DirectoryScanner.Directory:
+        path = os.fspath(path)
+
+        if path not in self._directories:
+            # directories are listed concurrently, as listing a directory mostly waits on the file system
+            pending = {self._thread_pool.submit(self._scan_directory, path)}
+
+            while len(pending) > 0:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    directory = future.result()
+                    self._directories[directory.path] = directory
+                    pending.update(
+                        self._thread_pool.submit(self._scan_directory, subdirectory_path)
+                        for subdirectory_path in directory.subdirectory_paths
+                        if subdirectory_path not in self._directories
+                    )
+
+        return self._directories[path]
+
+    def get_subdirectories(self, directory: _DirectoryScanner.Directory) -> List[_DirectoryScanner.Directory]:
+        return [self.scan(subdirectory_path) for subdirectory_path in directory.subdirectory_paths]
+
+    @staticmethod
+    def _scan_directory(path: str) -> _DirectoryScanner.Directory:
+        files = []
+        subdirectories = []
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # the entry's type is known from listing the directory, no stat call is needed
+                if entry.is_dir():
+                    if entry.name != '__pycache__':
+                        subdirectories.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+
+        return _DirectoryScanner.Directory(path=path, files=sorted(files), subdirectories=sorted(subdirectories))
+
+    class Directory:
+        def __init__(self, path: str, files: Sequence[str], subdirectories: Sequence[str]):
+            self._path = path
+            self._files = files
+            self._subdirectories = subdirectories
+
+        @property
+        def path(self) -> str:
+            return self._path
+
+        @property
+        def name(self) -> str:
+            return os.path.basename(self._path)
+
+        @property
+        def files(self) -> Sequence[str]:
+            return self._files
+
+        @property
+        def subdirectory_paths(self) -> List[str]:
+            return [os.path.join(self._path, name) for name in self._subdirectories]
+
+        @property
+        def is_package(self) -> bool:
+            return _INIT_FILE_NAME in self._files
+
+
+def _load_module(
+        name: str,
+        path: Union[str, Path],
+        origin: PythonModule.Origin,
+        pass_through: Optional[Callable[[Asset], bool]]
+) -> PythonModule:
+    module = PythonModule.from_source(
+        name=name,
+        source=FileContentSource(path, default_content_type=PythonModuleCst),
+        origin=origin
+    )
+
+    if pass_through is not None and pass_through(module):
+        # module isn't transformed, its source is bundled as is instead of being parsed
+        module = PythonModule.from_source(
+            name=name,
+            source=FileContentSource(path, binary=True),
+            origin=origin,
+            pass_through=True
+        )
+
+    return module
+
+
+def _load_data_files(
+        scanner: _DirectoryScanner,
+        pkg_name: str,
+        directory: _DirectoryScanner.Directory,
+        skip: Callable[[_DirectoryScanner.Directory], bool],
+        includes: Sequence[str],
+        excludes: Sequence[str]
+) -> List[StaticFile]:
+    data_files = []
+    pkg_target_path = PurePosixPath(*pkg_name.split('.'))
+    directories = [(directory, pkg_target_path)]
+
+    while len(directories) > 0:
+        directory, target_path = directories.pop()
+
+        for file_name in directory.files:
+            static_file_path = target_path / file_name
+
+            if (
+                    not file_name.endswith(_PYTHON_SUFFIXES)
+                    and (len(includes) == 0 or any(fnmatch(str(static_file_path), glob) for glob in includes))
+                    and not any(fnmatch(str(static_file_path), glob) for glob in excludes)
+            ):
+                data_files.append(
+                    StaticFile.from_source(
+                        name=str(static_file_path),
+                        target_path=Path(static_file_path),
+                        source=FileContentSource(
+                            path=Path(directory.path) / file_name,
+                            binary=True
+                        )
+                    )
+                )
+
+        directories.extend(
+            (subdirectory, target_path / subdirectory.name)
+            for subdirectory in scanner.get_subdirectories(directory)
+            if not skip(subdirectory)
+        )
 
-def _is_data_file_dir(path: Path):
-    return path.is_dir() and path.name != '__pycache__'
+    return data_files
 
 
 __all__ = [
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Tuple, Iterator, Optional
+
+
+class BuildReport:
+    PHASES = 'phases'
+    TRANSFORMERS = 'transformers'
+    ANALYZERS = 'analyzers'
+    MODULES = 'modules'
+    MEMO_TABLES = 'memo_tables'
+
+    def __init__(self):
+        self._measurements: Dict[str, Dict[str, BuildReport.Measurement]] = {}
+        self._memo_tables: Dict[str, BuildReport.MemoTableStatistics] = {}
+        self._memory_peaks: List[int] = []
+        self._started_tracing = False
+
+    @property
+    def measurements(self) -> Dict[str, Dict[str, BuildReport.Measurement]]:
+        return self._measurements
+
+    @property
+    def memo_tables(self) -> Dict[str, BuildReport.MemoTableStatistics]:
+        return self._memo_tables
+
+    @contextmanager
+    def measure(self, scope: str, name: str) -> Iterator[None]:
+        if len(self._memory_peaks) == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        if len(self._memory_peaks) > 0:
+            # remember the peak of the enclosing measurement before the peak is reset for this one
+            self._memory_peaks[-1] = max(self._memory_peaks[-1], tracemalloc.get_traced_memory()[1])
+
+        self._reset_memory_peak()
+        self._memory_peaks.append(0)
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+            peak_memory = max(self._memory_peaks.pop(), tracemalloc.get_traced_memory()[1])
+
+            if len(self._memory_peaks) > 0:
+                self._memory_peaks[-1] = max(self._memory_peaks[-1], peak_memory)
+            elif self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+            self.record(
+                scope,
+                name,
+                BuildReport.Measurement(wall_time=wall_time, cpu_time=cpu_time, peak_memory=peak_memory)
+            )
+
+    def record(self, scope: str, name: str, measurement: BuildReport.Measurement):
+        scope_measurements = self._measurements.setdefault(scope, {})
+
+        if name in scope_measurements:
+            measurement = scope_measurements[name].combine(measurement)
+
+        scope_measurements[name] = measurement
+
+    def record_memo_table(self, name: str, statistics: BuildReport.MemoTableStatistics):
+        if name in self._memo_tables:
+            statistics = self._memo_tables[name].combine(statistics)
+
+        self._memo_tables[name] = statistics
+
+    def merge(self, report: BuildReport):
+        for scope, scope_measurements in report.measurements.items():
+            for name, measurement in scope_measurements.items():
+                self.record(scope, name, measurement)
+
+        for name, statistics in report.memo_tables.items():
+            self.record_memo_table(name, statistics)
+
+    def get_slowest(self, scope: str, n: int) -> List[Tuple[str, BuildReport.Measurement]]:
+        return sorted(
+            self._measurements.get(scope, {}).items(),
+            key=lambda x: x[1].wall_time,
+            reverse=True
+        )[:n]
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        report = {
+            scope: {
+                name: measurement.to_dict()
+                for name, measurement in scope_measurements.items()
+            }
+            for scope, scope_measurements in self._measurements.items()
+        }
+
+        if len(self._memo_tables) > 0:
+            report[BuildReport.MEMO_TABLES] = {
+                name: statistics.to_dict()
+                for name, statistics in self._memo_tables.items()
+            }
+
+        return report
+
+    def write(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @staticmethod
+    def _reset_memory_peak():
+        if hasattr(tracemalloc, 'reset_peak'):
+            # not available before Python 3.9, peaks are then measured since the start of tracing
+            tracemalloc.reset_peak()
+
+    class Measurement:
+        def __init__(self, wall_time: float, cpu_time: float, peak_memory: int, count: int = 1):
+            self._wall_time = wall_time
+            self._cpu_time = cpu_time
+            self._peak_memory = peak_memory
+            self._count = count
+
+        @property
+        def wall_time(self) -> float:
+            return self._wall_time
+
+        @property
+        def cpu_time(self) -> float:
+            return self._cpu_time
+
+        @property
+        def peak_memory(self) -> int:
+            return self._peak_memory
+
+        @property
+        def count(self) -> int:
+            return self._count
+
+        def combine(self, measurement: BuildReport.Measurement) -> BuildReport.Measurement:
+            return BuildReport.Measurement(
+                wall_time=self._wall_time + measurement.wall_time,
+                cpu_time=self._cpu_time + measurement.cpu_time,
+                peak_memory=max(self._peak_memory, measurement.peak_memory),
+                count=self._count + measurement.count
+            )
+
+        def to_dict(self) -> Dict[str, float]:
+            return {
+                'count': self._count,
+                'wall_time': self._wall_time,
+                'cpu_time': self._cpu_time,
+                'peak_memory': self._peak_memory
+            }
+
+    class MemoTableStatistics:
+        def __init__(self, hits: int, misses: int):
+            self._hits = hits
+            self._misses = misses
+
+        @property
+        def hits(self) -> int:
+            return self._hits
+
+        @property
+        def misses(self) -> int:
+            return self._misses
+
+        @property
+        def hit_rate(self) -> float:
+            lookups = self._hits + self._misses
+
+            return self._hits / lookups if lookups > 0 else 0.0
+
+        def combine(self, statistics: BuildReport.MemoTableStatistics) -> BuildReport.MemoTableStatistics:
+            return BuildReport.MemoTableStatistics(
+                hits=self._hits + statistics.hits,
+                misses=self._misses + statistics.misses
+            )
+
+        def to_dict(self) -> Dict[str, float]:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self.hit_rate
+            }
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Set
+
+
+class Trace:
+    def __init__(self):
+        self._events: List[Dict[str, Any]] = []
+        self._pids: Set[int] = set()
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return self._events
+
+    def add_span(self, name: str, start_time: float, end_time: float, pid: int):
+        self._pids.add(pid)
+        self._events.append({
+            'name': name,
+            'cat': 'task',
+            'ph': 'X',
+            'ts': start_time * 1e6,
+            'dur': (end_time - start_time) * 1e6,
+            'pid': pid,
+            'tid': pid
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        # name the track of each process, so that the compiler process can be told apart from its workers
+        metadata_events = [
+            {
+                'name': 'process_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': pid,
+                'args': {
+                    'name': 'snakepack' if pid == os.getpid() else f'snakepack worker {pid}'
+                }
+            }
+            for pid in sorted(self._pids)
+        ]
+
+        return {
+            'traceEvents': [*metadata_events, *self._events],
+            'displayTimeUnit': 'ms'
+        }
+
+    def write(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
@@ -8,6 +8,7 @@ from snakepack.config.options import ConfigurableComponent
 
 class Transformer(ConfigurableComponent, ABC):
     REQUIRED_ANALYZERS = []
+    INVALIDATED_ANALYZERS = []
 
     @abstractmethod
     def transform(
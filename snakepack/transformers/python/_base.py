@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Mapping, Type, Union
+from typing import Mapping, Type, Union, List, Iterable, Optional, Dict, Tuple, Callable
 
 from libcst import CSTTransformer, CSTNode, FunctionDef, ClassDef, Name, Attribute, Assign, AnnAssign, CSTNodeT, \
     RemovalSentinel, FlattenSentinel
@@ -22,11 +22,18 @@ class PythonModuleTransformer(Transformer):
             subject: Union[PythonModule, AssetGroup[Python]]
     ) -> Union[PythonModule, AssetGroup[Python]]:
         if isinstance(subject, PythonModule):
-            transformer = self._CstTransformer(subject=subject, options=self._options, analyses=analyses, transformer=self)
-            subject.content = PythonModuleCst(cst=subject.content.cst.visit(transformer))
+            transformer = self.create_cst_transformer(subject, analyses)
+            subject.content = PythonModuleCst(cst=subject.content.cst.visit(transformer), copy=False)
 
         return subject
 
+    def create_cst_transformer(
+            self,
+            subject: PythonModule,
+            analyses: Mapping[Type[Analyzer], Analyzer.Analysis]
+    ) -> CSTTransformer:
+        return self._CstTransformer(subject=subject, options=self._options, analyses=analyses, transformer=self)
+
     class _CstTransformer(CSTTransformer):
         def __init__(
                 self,
@@ -46,19 +53,27 @@ class BatchablePythonModuleTransformer(PythonModuleTransformer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def create_cst_transformer(self, subject, options, analyses, transformer) -> CSTTransformer:
-        return self._CstTransformer(
-            subject=subject,
-            options=options,
-            analyses=analyses,
-            transformer=transformer
-        )
-
 
 class BatchPythonModuleTransformer(PythonModuleTransformer):
-    def __init__(self, transformers, *args, **kwargs):
+    def __init__(self, transformers: List[PythonModuleTransformer], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._transformers = transformers
+        self.REQUIRED_ANALYZERS = list(dict.fromkeys(
+            analyzer
+            for transformer in transformers
+            for analyzer in transformer.REQUIRED_ANALYZERS
+        ))
+        self.INVALIDATED_ANALYZERS = list(dict.fromkeys(
+            analyzer
+            for transformer in transformers
+            for analyzer in transformer.INVALIDATED_ANALYZERS
+        ))
+        self._visit_dispatch = self._create_dispatch_table('visit_')
+        self._leave_dispatch = self._create_dispatch_table('leave_')
+
+    @property
+    def transformers(self) -> List[PythonModuleTransformer]:
+        return self._transformers
 
     def transform(
             self,
@@ -67,7 +82,7 @@ class BatchPythonModuleTransformer(PythonModuleTransformer):
     ) -> Union[PythonModule, AssetGroup[Python]]:
         if isinstance(subject, PythonModule):
             cst_transformers = [
-                transformer.create_cst_transformer(subject, self._options, analyses, self)
+                transformer.create_cst_transformer(subject, analyses)
                 for transformer in self._transformers
             ]
             transformer = self._CstTransformer(
@@ -75,42 +90,118 @@ class BatchPythonModuleTransformer(PythonModuleTransformer):
                 options=self._options,
                 analyses=analyses,
                 transformer=self,
-                transformers=cst_transformers
+                transformers=cst_transformers,
+                visit_dispatch=self._visit_dispatch,
+                leave_dispatch=self._leave_dispatch
             )
-            subject.content = PythonModuleCst(cst=subject.content.cst.visit(transformer))
+            subject.content = PythonModuleCst(cst=subject.content.cst.visit(transformer), copy=False)
 
         return subject
 
+    @classmethod
+    def plan_passes(
+            cls,
+            transformers: Iterable[PythonModuleTransformer],
+            global_options: Options
+    ) -> List[BatchPythonModuleTransformer]:
+        passes = []
+        pass_transformers = []
+        invalidated_analyzers = set()
+
+        for transformer in transformers:
+            if any(analyzer in invalidated_analyzers for analyzer in transformer.REQUIRED_ANALYZERS):
+                # transformer needs analyses of the output of a transformer in the current pass, start a new one
+                passes.append(cls(pass_transformers, global_options=global_options))
+                pass_transformers = []
+                invalidated_analyzers = set()
+
+            pass_transformers.append(transformer)
+            invalidated_analyzers.update(transformer.INVALIDATED_ANALYZERS)
+
+        if len(pass_transformers) > 0:
+            passes.append(cls(pass_transformers, global_options=global_options))
+
+        return passes
+
+    def _create_dispatch_table(self, prefix: str) -> Dict[str, List[Tuple[int, str]]]:
+        dispatch_table = {}
+
+        for index, transformer in enumerate(self._transformers):
+            cst_transformer_class = transformer._CstTransformer
+
+            for attr_name in dir(cst_transformer_class):
+                node_type_name = attr_name[len(prefix):]
+
+                if (
+                        not attr_name.startswith(prefix)
+                        or '_' in node_type_name
+                        or getattr(cst_transformer_class, attr_name) is getattr(CSTTransformer, attr_name, None)
+                ):
+                    # not a node handler, an attribute handler or a no-op inherited from libcst
+                    continue
+
+                dispatch_table.setdefault(node_type_name, []).append((index, attr_name))
+
+        return dispatch_table
+
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
-        def __init__(self, transformers, *args, **kwargs):
+        def __init__(
+                self,
+                transformers: List[CSTTransformer],
+                visit_dispatch: Mapping[str, List[Tuple[int, str]]],
+                leave_dispatch: Mapping[str, List[Tuple[int, str]]],
+                *args,
+                **kwargs
+        ):
+            super().__init__(*args, **kwargs)
             self._transformers = transformers
+            self._suppressed: List[Optional[CSTNode]] = [None] * len(transformers)
+            self._num_suppressed = 0
+            self._visit_funcs = self._bind_dispatch_table(visit_dispatch)
+            self._leave_funcs = self._bind_dispatch_table(leave_dispatch)
 
-        def on_visit(self, node: CSTNode) -> bool:
-            return_value = True
-
-            for transformer in self._transformers:
-                visit_func = getattr(transformer, f"visit_{type(node).__name__}", None)
+        def _bind_dispatch_table(
+                self,
+                dispatch_table: Mapping[str, List[Tuple[int, str]]]
+        ) -> Dict[str, List[Tuple[int, Callable]]]:
+            return {
+                node_type_name: [(index, getattr(self._transformers[index], attr_name)) for index, attr_name in handlers]
+                for node_type_name, handlers in dispatch_table.items()
+            }
 
-                if visit_func is not None:
-                    transformer_return_value = visit_func(node)
-                else:
-                    transformer_return_value = True
+        def on_visit(self, node: CSTNode) -> bool:
+            visit_funcs = self._visit_funcs.get(type(node).__name__)
 
-                if not return_value and transformer_return_value:
-                    return_value = True
+            if visit_funcs is not None:
+                for index, visit_func in visit_funcs:
+                    if self._suppressed[index] is None and visit_func(node) is False:
+                        # transformer doesn't visit the children of this node
+                        self._suppressed[index] = node
+                        self._num_suppressed += 1
 
-            return return_value
+            return self._num_suppressed < len(self._transformers)
 
         def on_leave(
                 self, original_node: CSTNodeT, updated_node: CSTNodeT
         ) -> Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]]:
-            for transformer in self._transformers:
-                leave_func = getattr(transformer, f"leave_{type(original_node).__name__}", None)
+            leave_funcs = self._leave_funcs.get(type(original_node).__name__)
 
-                if leave_func is not None:
-                    updated_node = leave_func(original_node, updated_node)
+            if leave_funcs is not None:
+                for index, leave_func in leave_funcs:
+                    if self._suppressed[index] is not None and self._suppressed[index] is not original_node:
+                        # transformer doesn't visit the children of an ancestor of this node
+                        continue
 
-                    if updated_node is RemovalSentinel.REMOVE:
+                    if type(updated_node) is not type(original_node):
+                        # node was removed or replaced by a node of another type, other transformers can't handle it
                         break
 
-            return updated_node
\ No newline at end of file
+                    updated_node = leave_func(original_node, updated_node)
+
+            if self._num_suppressed > 0:
+                for index, suppressed_node in enumerate(self._suppressed):
+                    if suppressed_node is original_node:
+                        self._suppressed[index] = None
+                        self._num_suppressed -= 1
+
+            return updated_node
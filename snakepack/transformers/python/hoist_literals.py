@@ -20,6 +20,10 @@ class HoistLiteralsTransformer(PythonModuleTransformer):
         ScopeAnalyzer,
         LiteralDuplicationAnalyzer
     ]
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
+        ScopeAnalyzer,
+        LiteralDuplicationAnalyzer
+    ]
 
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
         METADATA_DEPENDENCIES = (ParentNodeProvider,)
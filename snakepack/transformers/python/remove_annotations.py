@@ -4,6 +4,7 @@ from libcst import CSTTransformer, Comment, RemovalSentinel, Annotation, Functio
     Param, MaybeSentinel, AnnAssign, BaseSmallStatement, AssignTarget, Assign, Name
 from libcst.metadata import ClassScope
 
+from snakepack.analyzers.python.literals import LiteralDuplicationAnalyzer
 from snakepack.analyzers.python.scope import ScopeAnalyzer
 from snakepack.transformers.python._base import PythonModuleTransformer, BatchablePythonModuleTransformer
 
@@ -12,6 +13,9 @@ class RemoveAnnotationsTransformer(PythonModuleTransformer):
     REQUIRED_ANALYZERS = PythonModuleTransformer.REQUIRED_ANALYZERS + [
         ScopeAnalyzer
     ]
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
+        LiteralDuplicationAnalyzer
+    ]
 
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
         def leave_FunctionDef(
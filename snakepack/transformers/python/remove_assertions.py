@@ -2,10 +2,15 @@ from typing import Optional, Union
 
 from libcst import CSTTransformer, Comment, RemovalSentinel, Assert, FlattenSentinel, BaseSmallStatement
 
+from snakepack.analyzers.python.literals import LiteralDuplicationAnalyzer
 from snakepack.transformers.python._base import PythonModuleTransformer, BatchablePythonModuleTransformer
 
 
 class RemoveAssertionsTransformer(BatchablePythonModuleTransformer):
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
+        LiteralDuplicationAnalyzer
+    ]
+
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
         def leave_Assert(
             self, original_node: Assert, updated_node: Assert
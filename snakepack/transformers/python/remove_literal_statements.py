@@ -9,7 +9,7 @@ from snakepack.transformers.python._base import PythonModuleTransformer, Batchab
 
 
 class RemoveLiteralStatementsTransformer(BatchablePythonModuleTransformer):
-    REQUIRED_ANALYZERS = PythonModuleTransformer.REQUIRED_ANALYZERS + [
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
         LiteralDuplicationAnalyzer
     ]
 
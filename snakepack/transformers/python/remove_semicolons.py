@@ -12,9 +12,9 @@ class RemoveSemicolonsTransformer(BatchablePythonModuleTransformer):
                 self, original_node: SimpleStatementLine, updated_node: SimpleStatementLine
         ) -> Union[BaseStatement, FlattenSentinel[BaseStatement], RemovalSentinel]:
             updated_statements = []
-            num_statements = len(original_node.body)
+            num_statements = len(updated_node.body)
 
-            for index, statement in enumerate(original_node.body):
+            for index, statement in enumerate(updated_node.body):
                 if index == num_statements - 1:  # last statement, semicolon not required
                     updated_statements.append(statement.with_changes(semicolon=MaybeSentinel.DEFAULT))
                 else:
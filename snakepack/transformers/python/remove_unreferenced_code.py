@@ -6,6 +6,7 @@ from libcst import CSTTransformer, Comment, RemovalSentinel, SimpleStatementLine
 from libcst.metadata import FunctionScope, ClassScope, ComprehensionScope, GlobalScope
 
 from snakepack.analyzers.python.imports import ImportGraphAnalyzer
+from snakepack.analyzers.python.literals import LiteralDuplicationAnalyzer
 from snakepack.analyzers.python.scope import ScopeAnalyzer
 from snakepack.transformers.python._base import PythonModuleTransformer
 
@@ -15,6 +16,10 @@ class RemoveUnreferencedCodeTransformer(PythonModuleTransformer):
         ScopeAnalyzer,
         ImportGraphAnalyzer
     ]
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
+        ScopeAnalyzer,
+        LiteralDuplicationAnalyzer
+    ]
 
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
         def leave_FunctionDef(
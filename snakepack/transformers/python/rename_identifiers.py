@@ -19,22 +19,9 @@ class RenameIdentifiersTransformer(PythonModuleTransformer):
         ScopeAnalyzer,
         ImportGraphAnalyzer
     ]
-
-    def transform(
-            self,
-            analyses: Mapping[Type[Analyzer], Analyzer.Analysis],
-            subject: Union[PythonModule, AssetGroup[Python]]
-    ) -> Union[PythonModule, AssetGroup[Python]]:
-        if isinstance(subject, PythonModule):
-            transformer = self._CstTransformer(
-                subject=subject,
-                options=self._options,
-                analyses=analyses,
-                transformer=self
-            )
-            subject.content = PythonModuleCst(cst=subject.content.cst.visit(transformer))
-
-        return subject
+    INVALIDATED_ANALYZERS = PythonModuleTransformer.INVALIDATED_ANALYZERS + [
+        ScopeAnalyzer
+    ]
 
     class _CstTransformer(PythonModuleTransformer._CstTransformer):
         def __init__(self, *args, **kwargs):
@@ -140,6 +127,10 @@ class RenameIdentifiersTransformer(PythonModuleTransformer):
 
                 current_scope = current_scope.parent
 
+            if any(map(lambda x: isinstance(x.node, (Import, ImportFrom)), to_rename)):
+                # don't rename identifiers bound by an import statement (import identifiers aren't renamed)
+                return self._dont_rename(node)
+
             if not self._options.only_rename_locals or not any(map(lambda x: isinstance(x.node, Param), to_rename)):
                 for assignment in to_rename:
                     if assignment.node not in self._no_renames:
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, Set, Dict, Optional, Tuple
+
+
+class FileWatcher(ABC):
+    DEBOUNCE_INTERVAL = 0.1
+
+    @abstractmethod
+    def watch(self, paths: Iterable[Path]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait(self) -> Set[Path]:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class InotifyFileWatcher(FileWatcher):
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _EVENT_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    _EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'Failed to initialize inotify')
+
+        self._watched_dirs: Dict[int, Path] = {}
+        self._paths: Set[Path] = set()
+
+    def watch(self, paths: Iterable[Path]):
+        self._paths = {Path(path).resolve() for path in paths}
+
+        for dir_path in {path.parent for path in self._paths} - set(self._watched_dirs.values()):
+            watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), self._EVENT_MASK)
+
+            if watch_descriptor < 0:
+                raise OSError(ctypes.get_errno(), f"Failed to watch directory '{dir_path}'")
+
+            self._watched_dirs[watch_descriptor] = dir_path
+
+    def wait(self) -> Set[Path]:
+        changed_paths = set()
+
+        while len(changed_paths) == 0:
+            changed_paths.update(self._read_events())
+
+        # editors often write a file in several steps, collect the events that quickly follow
+        while len(select.select([self._fd], [], [], self.DEBOUNCE_INTERVAL)[0]) > 0:
+            changed_paths.update(self._read_events())
+
+        return changed_paths
+
+    def close(self):
+        os.close(self._fd)
+
+    def _read_events(self) -> Set[Path]:
+        data = os.read(self._fd, 64 * 1024)
+        changed_paths = set()
+        offset = 0
+
+        while offset < len(data):
+            watch_descriptor, _, _, name_length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b'\0')
+            offset += name_length
+
+            if watch_descriptor not in self._watched_dirs:
+                continue
+
+            path = self._watched_dirs[watch_descriptor] / os.fsdecode(name)
+
+            if path in self._paths:
+                changed_paths.add(path)
+
+        return changed_paths
+
+
+class PollingFileWatcher(FileWatcher):
+    def __init__(self, interval: float = 0.5):
+        self._interval = interval
+        self._stats: Dict[Path, Optional[Tuple[int, int]]] = {}
+
+    def watch(self, paths: Iterable[Path]):
+        # keep the known stats of paths that are already watched, so changes in between calls aren't missed
+        self._stats = {
+            path: self._stats[path] if path in self._stats else self._stat(path)
+            for path in (Path(path).resolve() for path in paths)
+        }
+
+    def wait(self) -> Set[Path]:
+        while True:
+            time.sleep(self._interval)
+            changed_paths = set()
+
+            for path, stat in self._stats.items():
+                new_stat = self._stat(path)
+
+                if new_stat != stat:
+                    self._stats[path] = new_stat
+                    changed_paths.add(path)
+
+            if len(changed_paths) > 0:
+                return changed_paths
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+
+def create_file_watcher() -> FileWatcher:
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyFileWatcher()
+        except (OSError, AttributeError):
+            # inotify not available, e.g. in some containers
+            pass
+
+    return PollingFileWatcher()
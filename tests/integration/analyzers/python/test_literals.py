@@ -2,7 +2,7 @@ from textwrap import dedent
 
 import pytest
 from libcst import parse_module
-from libcst.metadata import FunctionScope
+from libcst.metadata import FunctionScope, ScopeProvider
 
 from snakepack.analyzers.python.literals import LiteralDuplicationAnalyzer
 from snakepack.analyzers.python.scope import ScopeAnalyzer
@@ -54,3 +54,79 @@ class LiteralDuplicationAnalyzerIntegrationTest:
         assert len(bar_assignments) == 1
         assert 'x' in bar_assignments
         assert len(bar_assignments['x']) == 1
+
+
+class LiteralDuplicationAnalyzerAnalysisIntegrationTest:
+    def test_get_occurrences(self):
+        content = PythonModuleCst.from_string(
+            dedent(
+                """
+                x = 'bar'
+                y('bar', 'bar', 'baz')
+                """
+            )
+        )
+        module = PythonModule(name='a', content=content, source=None)
+
+        analysis = LiteralDuplicationAnalyzer().analyse_subject(module)
+
+        bar_node = content.cst.body[0].body[0].value
+        baz_node = content.cst.body[1].body[0].value.args[2].value
+        bar_occurrences = analysis.get_occurrences(bar_node)
+
+        assert len(bar_occurrences) == 3
+        assert bar_node in bar_occurrences
+        assert all(occurrence.value == "'bar'" for occurrence in bar_occurrences)
+        assert analysis.get_occurrences(baz_node) == [baz_node]
+
+    def test_get_occurrences_shares_occurrences_of_same_value(self):
+        content = PythonModuleCst.from_string('\n'.join(f"x{i} = 'foo'" for i in range(1000)))
+        module = PythonModule(name='a', content=content, source=None)
+
+        analysis = LiteralDuplicationAnalyzer().analyse_subject(module)
+
+        occurrences = [analysis.get_occurrences(stmt.body[0].value) for stmt in content.cst.body]
+
+        assert len(occurrences[0]) == 1000
+        assert all(occurrence is occurrences[0] for occurrence in occurrences)
+
+    def test_get_preceding_assignments(self):
+        content = PythonModuleCst.from_string(
+            dedent(
+                """
+                a = 'foo'
+                b: str = 'foo'
+                b += 'invalidate'
+                e = 'foo'
+                e = 'not anymore'
+                x = 'bar'
+                y('bar', 'foo')
+                """
+            )
+        )
+        module = PythonModule(name='a', content=content, source=None)
+        scope = content.metadata_wrapper.resolve(ScopeProvider)[content.cst]
+
+        analysis = LiteralDuplicationAnalyzer().analyse_subject(module)
+
+        foo_node = content.cst.body[6].body[0].value.args[1].value
+        foo_assignments = analysis.get_preceding_assignments(literal_node=foo_node, scope=scope)
+
+        assert foo_assignments.keys() == {'a'}
+        assert foo_assignments['a'] == [content.cst.body[0].body[0]]
+
+        bar_node = content.cst.body[6].body[0].value.args[0].value
+        bar_assignments = analysis.get_preceding_assignments(literal_node=bar_node, scope=scope)
+
+        assert bar_assignments.keys() == {'x'}
+
+    def test_get_preceding_assignments_returns_none_without_assignments(self):
+        content = PythonModuleCst.from_string("y('foo')")
+        module = PythonModule(name='a', content=content, source=None)
+        scope = content.metadata_wrapper.resolve(ScopeProvider)[content.cst]
+
+        analysis = LiteralDuplicationAnalyzer().analyse_subject(module)
+
+        foo_node = content.cst.body[0].body[0].value.args[0].value
+
+        assert analysis.get_preceding_assignments(literal_node=foo_node, scope=scope) is None
@@ -40,3 +40,49 @@ class ScopeAnalyzerIntegrationTest:
 
         assert isinstance(analysis[ScopeProvider][g_var], FunctionScope)
         assert analysis[ScopeProvider][g_var]
+
+    def test_scope_table(self):
+        content = PythonModuleCst.from_string(
+            dedent(
+                """
+                a = True
+
+                def b(c):
+                    d = c
+                    return locals()
+
+                class E:
+                    global a
+                """
+            )
+        )
+        module = PythonModule(
+            name='a',
+            content=content,
+            source=None
+        )
+
+        analyzer = ScopeAnalyzer()
+        analysis = analyzer.analyse_subject(module)
+
+        function_def = content.cst.body[1]
+        c_param = function_def.params.params[0].name
+        d_var = function_def.body.body[0].body[0].targets[0].target
+        c_var = function_def.body.body[0].body[0].value
+        function_facts = analysis.get_scope_facts_for_node(d_var)
+        class_facts = analysis.get_scope_facts_for_node(content.cst.body[2].body.body[0])
+
+        assert analysis.get_scope_for_node(d_var) is analysis[ScopeProvider][c_var]
+        assert isinstance(function_facts.scope, FunctionScope)
+        assert function_facts.is_local
+        assert function_facts.parameter_names == {'c'}
+        assert function_facts.uses_locals_builtin
+        assert not class_facts.is_local
+        assert class_facts.uses_global_stmt
+        assert analysis.is_in_local_scope(d_var)
+        assert not analysis.is_in_local_scope(c_var)
+        assert not analysis.is_in_local_scope(c_param)
+        assert analysis.uses_locals_builtin(content.cst)
+        assert analysis.uses_global_stmt(content.cst)
+        assert not analysis.uses_globals_builtin(content.cst)
+        assert len(analysis.get_all_scopes()) == 3
@@ -1,3 +1,208 @@
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+from snakepack.analyzers.python.imports import ImportGraph
+from snakepack.assets.python import PythonModule, PythonModuleCst
+from snakepack.config.model import GlobalOptions
+from snakepack.loaders.python import ImportGraphLoader, PackageLoader
+
+
 class ImportGraphLoaderIntegrationTest:
-    def test_load(self):
-        pass
\ No newline at end of file
+    def test_load(self, tmp_path):
+        (tmp_path / 'pkg' / 'sub').mkdir(parents=True)
+        (tmp_path / 'main.py').write_text('import os\nfrom pkg import a\n')
+        (tmp_path / 'pkg' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'a.py').write_text('from .sub.b import y\nfrom . import missing\n')
+        (tmp_path / 'pkg' / 'sub' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'b.py').write_text('from ..a import x\n')
+        (tmp_path / 'pkg' / 'included.py').write_text('')
+        (tmp_path / 'pkg' / 'unused.py').write_text('')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = ImportGraphLoader.Options(entry_point=Path('main.py'), includes=['pkg.included'])
+        loader = ImportGraphLoader(global_options=global_options, options=options)
+
+        application = loader.load()
+
+        modules = {module.name: module for module in application.deep_assets if module.name.startswith(('main', 'pkg'))}
+        analysis = loader.analysis
+
+        assert set(modules) == {'main', 'pkg.__init__', 'pkg.a', 'pkg.sub.__init__', 'pkg.sub.b', 'pkg.included'}
+        assert application.entry_point is modules['main']
+        assert all(module.origin is PythonModule.Origin.APPLICATION for module in modules.values())
+        assert not any(module.name.startswith('os') for module in application.deep_assets)
+        assert analysis.import_graph_known
+        assert set(analysis.get_importing_modules(modules['pkg.a'])) == {modules['main'], modules['pkg.sub.b']}
+        assert analysis.get_importing_modules(modules['pkg.sub.b'], 'y') == [modules['pkg.a']]
+        assert analysis.get_importing_modules(modules['pkg.sub.b'], 'x') == []
+        assert analysis.get_importing_modules(modules['pkg.included']) == []
+        assert set(analysis.get_imported_modules(modules['pkg.sub.b'])) == {modules['pkg.__init__'], modules['pkg.a']}
+
+    def test_load_data_files(self, tmp_path):
+        (tmp_path / 'pkg' / 'sub' / 'templates').mkdir(parents=True)
+        (tmp_path / 'pkg' / 'unused' / '__pycache__').mkdir(parents=True)
+        (tmp_path / 'main.py').write_text('import pkg.sub\n')
+        (tmp_path / 'pkg' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'data.json').write_text('{}')
+        (tmp_path / 'pkg' / 'sub' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'templates' / 'index.html').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'templates' / 'index.html.bak').write_text('')
+        (tmp_path / 'pkg' / 'unused' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'unused' / 'data.txt').write_text('')
+        (tmp_path / 'pkg' / 'unused' / '__pycache__' / '__init__.cpython-39.pyc').write_text('')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = ImportGraphLoader.Options(entry_point=Path('main.py'), data_file_excludes=['*.bak'])
+        loader = ImportGraphLoader(global_options=global_options, options=options)
+
+        application = loader.load()
+
+        packages = {package.full_name: package for package in application.subgroups}
+        pkg = packages['pkg']
+        sub = next(iter(pkg.subgroups))
+
+        assert {str(asset.target_path) for asset in pkg.deep_assets if asset not in sub.deep_assets} == {
+            'pkg/__init__.py', 'pkg/data.json', 'pkg/unused/data.txt'
+        }
+        assert {str(asset.target_path) for asset in sub.deep_assets} == {
+            'pkg/sub/__init__.py', 'pkg/sub/templates/index.html'
+        }
+
+    def test_load_pass_through(self, tmp_path, mocker):
+        (tmp_path / 'vendor').mkdir()
+        (tmp_path / 'main.py').write_text('import vendor\n')
+        (tmp_path / 'vendor' / '__init__.py').write_text('from .a import x as y\n')
+        (tmp_path / 'vendor' / 'a.py').write_text('def f():\n    import json, vendor.b\nx = 5\n')
+        (tmp_path / 'vendor' / 'b.py').write_text('')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = ImportGraphLoader.Options(entry_point=Path('main.py'))
+        loader = ImportGraphLoader(global_options=global_options, options=options)
+        from_string = mocker.spy(PythonModuleCst, 'from_string')
+
+        application = loader.load(pass_through=lambda module: module.name.startswith('vendor'))
+
+        modules = {module.name: module for module in application.deep_assets}
+        analysis = loader.analysis
+
+        assert set(modules) == {'main', 'vendor.__init__', 'vendor.a', 'vendor.b'}
+        assert not modules['main'].pass_through
+        assert all(modules[name].pass_through for name in ('vendor.__init__', 'vendor.a', 'vendor.b'))
+        assert from_string.call_count == 1
+        assert bytes(modules['vendor.a'].content) == b'def f():\n    import json, vendor.b\nx = 5\n'
+        assert analysis.get_importing_modules(modules['vendor.b']) == [modules['vendor.a']]
+        assert analysis.get_importing_modules(modules['vendor.a'], 'x') == [modules['vendor.__init__']]
+
+    def test_load_stdlib(self, tmp_path):
+        (tmp_path / 'main.py').write_text('import this\n')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = ImportGraphLoader.Options(entry_point=Path('main.py'), exclude_stdlib=False)
+        loader = ImportGraphLoader(global_options=global_options, options=options)
+
+        application = loader.load()
+
+        modules = {module.name: module for module in application.deep_assets}
+
+        assert modules['main'].origin is PythonModule.Origin.APPLICATION
+        assert modules['this'].origin is PythonModule.Origin.STDLIB
+
+    def test_load_cached_import_graph(self, tmp_path, mocker):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'main.py').write_text('from pkg import a\n')
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'a.py').write_text('x = 5\n')
+        (source_path / 'pkg' / 'b.py').write_text('y = 6\n')
+        global_options = GlobalOptions(source_base_path=source_path, cache_path=tmp_path / 'cache')
+        options = ImportGraphLoader.Options(entry_point=Path('main.py'))
+
+        ImportGraphLoader(global_options=global_options, options=options).load()
+
+        find_spec = mocker.spy(PathFinder, 'find_spec')
+        application = ImportGraphLoader(global_options=global_options, options=options).load()
+
+        assert find_spec.call_count == 0
+        assert {module.name for module in application.deep_assets if module.name.startswith(('main', 'pkg'))} == {
+            'main', 'pkg.__init__', 'pkg.a'
+        }
+
+        (source_path / 'pkg' / 'a.py').write_text('from . import b\nx = 5\n')
+        application = ImportGraphLoader(global_options=global_options, options=options).load()
+
+        assert [call.args[0] for call in find_spec.call_args_list] == ['pkg.b']
+        assert {module.name for module in application.deep_assets if module.name.startswith(('main', 'pkg'))} == {
+            'main', 'pkg.__init__', 'pkg.a', 'pkg.b'
+        }
+
+
+    def test_load_cached_import_graph_added_submodule(self, tmp_path):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'app.py').write_text('from pkg import sub\n')
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        global_options = GlobalOptions(source_base_path=source_path, cache_path=tmp_path / 'cache')
+        options = ImportGraphLoader.Options(entry_point=Path('app.py'))
+
+        application = ImportGraphLoader(global_options=global_options, options=options).load()
+
+        assert {module.name for module in application.deep_assets if module.name.startswith(('app', 'pkg'))} == {
+            'app', 'pkg.__init__'
+        }
+
+        (source_path / 'pkg' / 'sub.py').write_text('x = 5\n')
+        application = ImportGraphLoader(global_options=global_options, options=options).load()
+
+        assert {module.name for module in application.deep_assets if module.name.startswith(('app', 'pkg'))} == {
+            'app', 'pkg.__init__', 'pkg.sub'
+        }
+
+class PackageLoaderIntegrationTest:
+    def test_load(self, tmp_path):
+        (tmp_path / 'pkg' / 'sub' / '__pycache__').mkdir(parents=True)
+        (tmp_path / 'pkg' / 'locale' / 'nl' / 'LC_MESSAGES').mkdir(parents=True)
+        (tmp_path / 'pkg' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'a.py').write_text('')
+        (tmp_path / 'pkg' / 'README.md').write_text('')
+        (tmp_path / 'pkg' / 'locale' / 'nl' / 'LC_MESSAGES' / 'django.po').write_text('')
+        (tmp_path / 'pkg' / 'locale' / 'nl' / 'LC_MESSAGES' / 'django.mo').write_text('')
+        (tmp_path / 'pkg' / 'sub' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'b.py').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'b.so').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'data.txt').write_text('')
+        (tmp_path / 'pkg' / 'sub' / '__pycache__' / 'b.cpython-39.pyc').write_text('')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = PackageLoader.Options(pkg_name='pkg', data_file_includes=['*.mo', '*.txt'])
+        loader = PackageLoader(global_options=global_options, options=options)
+
+        package = loader.load()
+
+        sub = next(iter(package.subgroups))
+
+        assert package.full_name == 'pkg'
+        assert {module.name for module in package.assets} == {'pkg.__init__', 'pkg.a'}
+        assert sub.full_name == 'pkg.sub'
+        assert {module.name for module in sub.assets} == {'pkg.sub.__init__', 'pkg.sub.b'}
+        assert {str(asset.target_path) for asset in package.deep_assets} == {
+            'pkg/__init__.py',
+            'pkg/a.py',
+            'pkg/locale/nl/LC_MESSAGES/django.mo',
+            'pkg/sub/__init__.py',
+            'pkg/sub/b.py',
+            'pkg/sub/data.txt'
+        }
+        assert all(module.origin is PythonModule.Origin.APPLICATION for module in package.assets)
+
+    def test_load_pass_through(self, tmp_path, mocker):
+        (tmp_path / 'pkg').mkdir()
+        (tmp_path / 'pkg' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'a.py').write_text('x = 5\n')
+        global_options = GlobalOptions(source_base_path=tmp_path)
+        options = PackageLoader.Options(pkg_name='pkg')
+        loader = PackageLoader(global_options=global_options, options=options)
+        from_string = mocker.spy(PythonModuleCst, 'from_string')
+
+        package = loader.load(pass_through=lambda module: module.name == 'pkg.a')
+
+        modules = {module.name: module for module in package.assets}
+
+        assert not modules['pkg.__init__'].pass_through
+        assert modules['pkg.a'].pass_through
+        assert from_string.call_count == 1
+        assert loader.analysis.get_imported_module_names(modules['pkg.a']) is None
@@ -0,0 +1,317 @@
+from logging import getLogger
+from textwrap import dedent
+
+import pytest
+
+from snakepack.assets import AssetContentCache
+from snakepack.assets.python import PythonModuleCst
+from snakepack.compiler import Compiler, SynchronousExecutor, ConcurrentExecutor
+from snakepack.config.formats import parse_yaml_config
+
+
+class CompilerIntegrationTest:
+    def test_recompile_changed_modules(self, tmp_path):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 5\n')
+        (source_path / 'pkg' / 'b.py').write_text('# comment\ny = 6\n')
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+        compiler.run()
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 5\n'
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'b.py').read_text() == '\ny = 6\n'
+
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 7\n')
+        (tmp_path / 'dist' / 'pkg' / 'pkg' / 'b.py').unlink()
+
+        compiler.recompile([source_path / 'pkg' / 'a.py'])
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 7\n'
+        assert not (tmp_path / 'dist' / 'pkg' / 'pkg' / 'b.py').exists()
+
+    def test_pass_through_excluded_modules(self, tmp_path, mocker):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg' / 'vendor').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 5\n')
+        (source_path / 'pkg' / 'vendor' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'vendor' / 'b.py').write_bytes(b'# comment\r\ny = 6\r\n')
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+                        options:
+                          excludes:
+                            - 'pkg.vendor'
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+        from_string = mocker.spy(PythonModuleCst, 'from_string')
+
+        compiler.run()
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 5\n'
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'vendor' / 'b.py').read_bytes() == b'# comment\r\ny = 6\r\n'
+        assert from_string.call_count == 2
+
+    def test_max_memory(self, tmp_path, mocker, monkeypatch):
+        monkeypatch.setattr(AssetContentCache, 'budget', None)
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+
+        for index in range(5):
+            (source_path / 'pkg' / f'module{index}.py').write_text('# comment\n' + 'x = 5\n' * 2000)
+
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            max_memory: 2
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+        evict = mocker.spy(AssetContentCache, 'evict')
+
+        compiler.run()
+
+        assert evict.call_count > 0
+        assert AssetContentCache.budget.memory <= 2 * 1024 * 1024
+
+        for index in range(5):
+            assert (tmp_path / 'dist' / 'pkg' / 'pkg' / f'module{index}.py').read_text() == '\n' + 'x = 5\n' * 2000
+
+    def test_max_memory_thread_backend(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(AssetContentCache, 'budget', None)
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        module_source = 'def function(argument):\n' + '    variable = argument\n' * 1000 + '    return variable\n'
+
+        for index in range(16):
+            (source_path / 'pkg' / f'module{index}.py').write_text(module_source)
+
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            max_memory: 4
+            ignore_errors: false
+            executor:
+              transform:
+                backend: thread
+                workers: 4
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: rename_identifiers
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+
+        compiler.run()
+
+        for index in range(16):
+            assert (tmp_path / 'dist' / 'pkg' / 'pkg' / f'module{index}.py').read_text() == (
+                'def function(argument):\n' + '    b = argument\n' * 1000 + '    return b\n'
+            )
+
+    def test_stream(self, tmp_path, mocker):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg' / 'vendor').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 5\n')
+        (source_path / 'pkg' / 'data.txt').write_text('# data\n')
+        (source_path / 'pkg' / 'vendor' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'vendor' / 'b.py').write_text('# comment\ny = 6\n')
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            stream: true
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+                        options:
+                          excludes:
+                            - 'pkg.vendor'
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+        package_assets = mocker.spy(Compiler, '_package_assets')
+
+        compiler.run()
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 5\n'
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'data.txt').read_text() == '# data\n'
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'vendor' / 'b.py').read_text() == '# comment\ny = 6\n'
+        package_assets.assert_not_called()
+
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 7\n')
+        compiler.recompile([source_path / 'pkg' / 'a.py'])
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 7\n'
+
+    @pytest.mark.parametrize('backend', ['thread', 'fork', 'loky'])
+    def test_executor_backends(self, tmp_path, backend):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+
+        for index in range(10):
+            (source_path / 'pkg' / f'module{index}.py').write_text(f'# comment\nx = {index}\n')
+
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            executor:
+              load:
+                backend: thread
+              transform:
+                backend: {backend}
+                workers: 2
+              package:
+                backend: thread
+                workers: 2
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+
+        compiler.run()
+
+        for index in range(10):
+            assert (tmp_path / 'dist' / 'pkg' / 'pkg' / f'module{index}.py').read_text() == f'\nx = {index}\n'
+
+    def test_fork_workers_inherit_assets(self, tmp_path, mocker):
+        source_path = tmp_path / 'src'
+        (source_path / 'pkg').mkdir(parents=True)
+        (source_path / 'pkg' / '__init__.py').write_text('')
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 5\n')
+        (source_path / 'pkg' / 'b.py').write_text('# comment\ny = 6\n')
+        config = parse_yaml_config(dedent(
+            f"""
+            source_base_path: '{source_path}'
+            target_base_path: '{tmp_path / 'dist'}'
+            executor:
+              transform:
+                backend: fork
+                workers: 2
+            packages:
+              pkg:
+                packager:
+                  name: directory
+                bundles:
+                  pkg:
+                    bundler:
+                      name: file
+                    loader:
+                      name: package
+                      options:
+                        pkg_name: 'pkg'
+                    transformers:
+                      - name: remove_comments
+            """
+        ))
+        compiler = Compiler(config=config, executor=SynchronousExecutor(logger=getLogger('snakepack')))
+        execute = mocker.spy(ConcurrentExecutor, 'execute')
+
+        compiler.run()
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 5\n'
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'b.py').read_text() == '\ny = 6\n'
+        tasks = execute.call_args.args[1]
+        assert [task._callable.keywords for task in tasks] == [
+            {'index': index, 'reported': False}
+            for index in range(len(tasks))
+        ]
+        assert Compiler._forked_assets is None
+
+        (source_path / 'pkg' / 'a.py').write_text('# comment\nx = 7\n')
+        compiler.recompile([source_path / 'pkg' / 'a.py'])
+
+        assert (tmp_path / 'dist' / 'pkg' / 'pkg' / 'a.py').read_text() == '\nx = 7\n'
@@ -5,7 +5,7 @@ from libcst import parse_module
 from snakepack.assets.python import PythonModuleCst
 from snakepack.config.model import GlobalOptions
 from snakepack.transformers.python import RemoveAnnotationsTransformer, RemoveAssertionsTransformer, \
-    RemoveCommentsTransformer
+    RemoveCommentsTransformer, RemoveSemicolonsTransformer
 from snakepack.transformers.python._base import BatchPythonModuleTransformer, PythonModuleTransformer
 from tests.integration.transformers.python._base import PythonModuleCstTransformerIntegrationTestBase
 
@@ -53,4 +53,28 @@ class BatchPythonModuleTransformerIntegrationTest(PythonModuleCstTransformerInte
         ]
         batch_transformer = BatchPythonModuleTransformer(transformers=transformers, global_options=global_options)
 
-        return batch_transformer
\ No newline at end of file
+        return batch_transformer
+
+    def test_transform_removes_semicolons_after_removed_statements(self):
+        input_content = dedent(
+            """
+            x=5; assert True, 'bad'; y=6;
+            """
+        )
+
+        expected_output_content = dedent(
+            """
+            x=5; y=6
+            """
+        )
+
+        global_options = GlobalOptions()
+        transformer = BatchPythonModuleTransformer(
+            transformers=[
+                RemoveAssertionsTransformer(global_options=global_options),
+                RemoveSemicolonsTransformer(global_options=global_options)
+            ],
+            global_options=global_options
+        )
+
+        self._test_transformation(input=input_content, expected_output=expected_output_content, transformer=transformer)
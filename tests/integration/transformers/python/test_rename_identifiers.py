@@ -194,6 +194,45 @@ class RenameIdentifiersTransformerIntegrationTest(PythonModuleCstTransformerInte
 
         self._test_transformation(input=input_content, expected_output=expected_output_content)
 
+    def test_transform_only_rename_in_local_scope_global_names(self):
+        input_content = dedent(
+            """
+            _pickler_name = None
+
+            def set_pickler(pickler=None):
+                global _pickler_name
+                if pickler == _pickler_name:
+                    return
+                _pickler_name = pickler
+
+            def outer():
+                global counter
+                def inner():
+                    counter = 5
+                counter = 1
+            """
+        )
+
+        expected_output_content = dedent(
+            """
+            _pickler_name = None
+
+            def set_pickler(pickler=None):
+                global _pickler_name
+                if pickler == _pickler_name:
+                    return
+                _pickler_name = pickler
+
+            def outer():
+                global counter
+                def a():
+                    b = 5
+                counter = 1
+            """
+        )
+
+        self._test_transformation(input=input_content, expected_output=expected_output_content)
+
     def _create_analyzers(self) -> Iterable[Analyzer]:
         def _get_importing_modules(module, identifier):
             if identifier == 'imported':
@@ -1,18 +1,20 @@
+import ast
+import pickle
 from unittest.mock import MagicMock
 
 import pytest
-from libcst import Import, ImportAlias, Name, Attribute, Module
-from modulegraph.modulegraph import ModuleGraph, Node
+from libcst import Import, ImportAlias, Name, Attribute, Module, MetadataWrapper, parse_module
 
 from snakepack.assets import AssetContent
-from snakepack.analyzers.python.imports import ImportGraphAnalyzer
-from snakepack.assets.python import PythonApplication, PythonModule
+from snakepack.analyzers.python.imports import ImportGraphAnalyzer, ImportGraph, _get_imported_module_names, \
+    _scan_imported_module_names, _get_exported_names, _get_import_stmts, _find_import_stmts
+from snakepack.assets.python import PythonApplication, PythonModule, PythonModuleCst
 
 
 class ImportGraphAnalyzerAnalysisTest:
-    def test_modulegraph_returns_no_referers(self):
-        module_graph = MagicMock(spec=ModuleGraph)
-        module_graph.getReferers.return_value = []
+    def test_import_graph_returns_no_referrers(self):
+        module_graph = MagicMock(spec=ImportGraph)
+        module_graph.get_referrers.return_value = []
         node_map = MagicMock()
         import_metadata = MagicMock()
 
@@ -29,11 +31,11 @@ class ImportGraphAnalyzerAnalysisTest:
         assert imported_modules == []
 
     def test_without_identifier(self):
-        module_graph = MagicMock(spec=ModuleGraph)
-        node1 = MagicMock(spec=Node)
-        node2 = MagicMock(spec=Node)
-        node3 = MagicMock(spec=Node)
-        module_graph.getReferers.return_value = [
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        node3 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.return_value = [
             node1,
             node2
         ]
@@ -70,11 +72,11 @@ class ImportGraphAnalyzerAnalysisTest:
 
     @pytest.mark.skip
     def test_import_stmts(self):
-        module_graph = MagicMock(spec=ModuleGraph)
-        node1 = MagicMock(spec=Node)
-        node2 = MagicMock(spec=Node)
-        node3 = MagicMock(spec=Node)
-        module_graph.getReferers.return_value = [
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        node3 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.return_value = [
             node1,
             node2
         ]
@@ -173,3 +175,279 @@ class ImportGraphAnalyzerAnalysisTest:
 
     def test_importfrom_stmts(self):
         pass
+
+    def test_relative_importfrom_stmts(self):
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        node3 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.return_value = (node for node in [node1, node2])
+
+        module1 = MagicMock(spec=PythonModule)
+        module1.name = 'pkg.module1'
+        module2 = MagicMock(spec=PythonModule)
+        module2.name = 'pkg.sub.module2'
+        test_imported_module = MagicMock(spec=PythonModule)
+        test_imported_module.name = 'pkg.testmodule'
+
+        node_map = {
+            module1: node1,
+            module2: node2,
+            test_imported_module: node3
+        }
+        import_metadata = {
+            module1: MetadataWrapper(parse_module('from .testmodule import test')).resolve_many(
+                ImportGraphAnalyzer.CST_PROVIDERS
+            ),
+            module2: MetadataWrapper(parse_module('from ..testmodule import other')).resolve_many(
+                ImportGraphAnalyzer.CST_PROVIDERS
+            ),
+            test_imported_module: MetadataWrapper(parse_module('x = 5')).resolve_many(
+                ImportGraphAnalyzer.CST_PROVIDERS
+            )
+        }
+
+        analysis = ImportGraphAnalyzer.Analysis(
+            module_graph=module_graph,
+            node_map=node_map,
+            import_metadata=import_metadata
+        )
+
+        imported_modules = analysis.get_importing_modules(test_imported_module, 'test')
+
+        assert imported_modules == [module1]
+        assert not analysis.identifier_imported_in_module('test', test_imported_module)
+
+    def test_snapshot(self):
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.side_effect = lambda node: iter([node1] if node is node2 else [])
+
+        module1 = MagicMock(spec=PythonModule)
+        module1.name = 'module1'
+        test_imported_module = MagicMock(spec=PythonModule)
+        test_imported_module.name = 'testmodule'
+
+        node_map = {
+            module1: node1,
+            test_imported_module: node2
+        }
+        import_metadata = {
+            module1: MetadataWrapper(parse_module('import testmodule\nfrom os import path')).resolve_many(
+                ImportGraphAnalyzer.CST_PROVIDERS
+            ),
+            test_imported_module: MetadataWrapper(parse_module('x = 5')).resolve_many(
+                ImportGraphAnalyzer.CST_PROVIDERS
+            )
+        }
+
+        analysis = ImportGraphAnalyzer.Analysis(
+            module_graph=module_graph,
+            node_map=node_map,
+            import_metadata=import_metadata
+        )
+
+        snapshot = pickle.loads(pickle.dumps(analysis.snapshot()))
+
+        assert snapshot.import_graph_known
+        assert snapshot.get_importing_modules(test_imported_module) == ['module1']
+        assert snapshot.get_importing_modules(test_imported_module, 'x') == ['module1']
+        assert snapshot.get_importing_modules(module1) == []
+        assert snapshot.identifier_imported_in_module('path', module1)
+        assert not snapshot.identifier_imported_in_module('x', module1)
+        assert not snapshot.identifier_imported_in_module('x', test_imported_module)
+
+    def test_update_module(self):
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.side_effect = lambda node: iter([node1] if node is node2 else [])
+
+        module1 = PythonModule.from_string(name='pkg.module1', content='from .testmodule import x')
+        module1.content = PythonModuleCst.from_string('from .testmodule import x')
+        test_imported_module = MagicMock(spec=PythonModule)
+        test_imported_module.name = 'pkg.testmodule'
+
+        analysis = ImportGraphAnalyzer.Analysis(
+            module_graph=module_graph,
+            node_map={
+                module1: node1,
+                test_imported_module: node2
+            },
+            import_metadata={
+                module1: module1.content.metadata_wrapper.resolve_many(ImportGraphAnalyzer.CST_PROVIDERS),
+                test_imported_module: MetadataWrapper(parse_module('x = 5')).resolve_many(
+                    ImportGraphAnalyzer.CST_PROVIDERS
+                )
+            }
+        )
+
+        assert analysis.get_imported_module_names(module1) == {'pkg.testmodule', 'pkg.testmodule.x'}
+        assert analysis.get_imported_modules(module1) == [test_imported_module]
+        assert analysis.get_importing_modules(test_imported_module, 'y') == []
+
+        module1.content = PythonModuleCst.from_string('from .testmodule import y')
+        analysis.update_module(module1)
+
+        assert analysis.get_imported_module_names(module1) == {'pkg.testmodule', 'pkg.testmodule.y'}
+        assert analysis.get_importing_modules(test_imported_module, 'y') == [module1]
+
+    def test_star_import_expansion(self):
+        modules = {
+            name: PythonModule.from_string(name=name, content=source)
+            for name, source in [
+                ('pkg.module1', 'from .module2 import *\nfrom .unknown import *'),
+                ('pkg.module2', 'from .module3 import *\nx = 5\n_y = 6'),
+                ('pkg.module3', '__all__ = ["z"]\nz = w = 7'),
+                ('pkg.module4', 'from .module2 import *'),
+            ]
+        }
+
+        for module in modules.values():
+            module.content = PythonModuleCst.from_string(str(module.content))
+
+        analysis = ImportGraphAnalyzer.Analysis(
+            import_metadata={
+                module: module.content.metadata_wrapper.resolve_many(ImportGraphAnalyzer.CST_PROVIDERS)
+                for module in modules.values()
+            },
+            exported_names={
+                module: _get_exported_names(module.content.ast)
+                for module in modules.values()
+            }
+        )
+
+        assert analysis.identifier_imported_in_module('w', modules['pkg.module1'])
+        assert analysis.identifier_imported_in_module('x', modules['pkg.module4'])
+        assert analysis.identifier_imported_in_module('z', modules['pkg.module4'])
+        assert not analysis.identifier_imported_in_module('w', modules['pkg.module4'])
+        assert not analysis.identifier_imported_in_module('_y', modules['pkg.module4'])
+        assert not analysis.identifier_imported_in_module('x', modules['pkg.module2'])
+
+    def test_get_importing_modules_is_indexed(self):
+        module_graph = MagicMock(spec=ImportGraph)
+        node1 = MagicMock(spec=ImportGraph.Node)
+        node2 = MagicMock(spec=ImportGraph.Node)
+        module_graph.get_referrers.side_effect = lambda node: iter([node1] if node is node2 else [])
+
+        module1 = MagicMock(spec=PythonModule)
+        module1.name = 'module1'
+        test_imported_module = MagicMock(spec=PythonModule)
+        test_imported_module.name = 'pkg.testmodule'
+
+        analysis = ImportGraphAnalyzer.Analysis(
+            module_graph=module_graph,
+            node_map={
+                module1: node1,
+                test_imported_module: node2
+            },
+            import_metadata={
+                module1: MetadataWrapper(parse_module('import pkg\nfrom pkg.testmodule import x')).resolve_many(
+                    ImportGraphAnalyzer.CST_PROVIDERS
+                ),
+                test_imported_module: MetadataWrapper(parse_module('x = 5')).resolve_many(
+                    ImportGraphAnalyzer.CST_PROVIDERS
+                )
+            }
+        )
+
+        assert analysis.get_identifiers_imported_from(module1, test_imported_module) == {'x'}
+        assert analysis.get_importing_modules(test_imported_module, 'x') == [module1]
+        assert analysis.get_importing_modules(test_imported_module, 'y') == []
+        assert analysis.get_importing_modules(test_imported_module, 'x') == [module1]
+        assert module_graph.get_referrers.call_count == 1
+        assert analysis.get_imported_modules(module1) == [test_imported_module]
+        assert analysis.get_imported_modules(test_imported_module) == []
+        assert module_graph.get_referrers.call_count == 2
+
+
+class GetExportedNamesTest:
+    def test_public_names(self):
+        module = ast.parse('import os\nfrom x import y as z\nclass A: pass\ndef f(arg): b = 1\n_c = 2')
+
+        assert _get_exported_names(module) == {'os', 'z', 'y', 'x', 'A', 'f', 'arg', 'b'}
+
+    def test_all(self):
+        module = ast.parse('__all__ = ("a", \'b\')\na = b = c = 1')
+
+        assert _get_exported_names(module) == {'a', 'b'}
+
+    @pytest.mark.parametrize('source', [
+        '__all__ = ["a"]\n__all__ += ["b"]',
+        '__all__ = names',
+        '__all__ = [name for name in names]',
+        'globals()["a"] = 1',
+    ])
+    def test_unknown(self, source):
+        assert _get_exported_names(ast.parse(source)) is None
+
+
+class ImportGraphTest:
+    def test_add_edge(self):
+        import_graph = ImportGraph()
+        node1 = import_graph.add_node(ImportGraph.SourceModule(identifier='module1', filename='module1.py'))
+        node2 = import_graph.add_node(ImportGraph.SourceModule(identifier='module2', filename='module2.py'))
+
+        import_graph.add_edge(node1, node2)
+        import_graph.add_edge(node1, node2)
+        import_graph.add_edge(node1, node1)
+
+        assert import_graph.get_node('module1') is node1
+        assert import_graph.get_imported_nodes(node1) == [node2]
+        assert import_graph.get_referrers(node2) == [node1]
+        assert import_graph.get_referrers(node1) == []
+
+
+class ScanImportedModuleNamesTest:
+    def test_scan_imported_module_names(self):
+        source = (
+            'import a, b.c as d\n'
+            'from e import f, g as h\n'
+            'from . import i\n'
+            'from ..j import *\n'
+            'def k():\n'
+            '    from .l import m\n'
+        )
+        import_metadata = MetadataWrapper(parse_module(source)).resolve_many(ImportGraphAnalyzer.CST_PROVIDERS)
+
+        scanned_names = _scan_imported_module_names('pkg.sub.module', source.encode('utf-8'))
+
+        assert list(scanned_names) == list(
+            _get_imported_module_names('pkg.sub.module', _get_import_stmts(import_metadata))
+        )
+
+
+class FindImportStmtsTest:
+    def test_find_import_stmts(self):
+        module = ast.parse(
+            'import a\n'
+            'def b():\n'
+            '    import c\n'
+            'try:\n'
+            '    import d\n'
+            'except ImportError:\n'
+            '    from . import e\n'
+            'x = [f for f in g]\n'
+            'from h import *\n'
+        )
+
+        import_stmts = _find_import_stmts(module)
+
+        assert [ast.unparse(import_stmt) for import_stmt in import_stmts] == [
+            'import a',
+            'import c',
+            'import d',
+            'from . import e',
+            'from h import *'
+        ]
+
+    def test_get_import_stmts_from_cst(self):
+        source = 'if x:\n    from .a import (\n        b,\n        c as d,\n    ); import e\n'
+        import_metadata = MetadataWrapper(parse_module(source)).resolve_many(ImportGraphAnalyzer.CST_PROVIDERS)
+
+        import_stmts = _get_import_stmts(import_metadata)
+
+        assert [ast.dump(import_stmt) for import_stmt in import_stmts] == [
+            ast.dump(import_stmt) for import_stmt in _find_import_stmts(ast.parse(source))
+        ]
@@ -0,0 +1,102 @@
+import gc
+import weakref
+
+from snakepack.analyzers import Analyzer
+from snakepack.analyzers._base import MemoTable, memoize
+
+
+class TestAnalysis(Analyzer.Analysis):
+    def __init__(self):
+        self.calls = 0
+
+    @memoize
+    def double(self, value: int) -> int:
+        self.calls += 1
+        return value * 2
+
+    @memoize(maxsize=1)
+    def triple(self, value: int) -> int:
+        self.calls += 1
+        return value * 3
+
+
+class MemoTableTest:
+    def test_get_or_compute(self):
+        memo_table = MemoTable()
+
+        assert memo_table.get_or_compute('a', lambda: 1) == 1
+        assert memo_table.get_or_compute('a', lambda: 2) == 1
+        assert memo_table.hits == 1
+        assert memo_table.misses == 1
+        assert len(memo_table) == 1
+
+    def test_maxsize(self):
+        memo_table = MemoTable(maxsize=2)
+        memo_table.get_or_compute('a', lambda: 1)
+        memo_table.get_or_compute('b', lambda: 2)
+        memo_table.get_or_compute('a', lambda: 1)
+        memo_table.get_or_compute('c', lambda: 3)
+
+        assert len(memo_table) == 2
+        assert memo_table.get_or_compute('a', lambda: 4) == 1
+        assert memo_table.get_or_compute('b', lambda: 5) == 5
+
+    def test_clear(self):
+        memo_table = MemoTable()
+        memo_table.get_or_compute('a', lambda: 1)
+
+        memo_table.clear()
+
+        assert len(memo_table) == 0
+        assert memo_table.get_or_compute('a', lambda: 2) == 2
+
+
+class MemoizeTest:
+    def test_memoize(self):
+        analysis = TestAnalysis()
+
+        assert analysis.double(2) == 4
+        assert analysis.double(2) == 4
+        assert analysis.double(value=2) == 4
+        assert analysis.calls == 2
+        assert analysis.memo_tables['double'].hits == 1
+        assert analysis.memo_tables['double'].misses == 2
+
+    def test_memoize_per_analysis(self):
+        analysis1 = TestAnalysis()
+        analysis2 = TestAnalysis()
+
+        analysis1.double(2)
+        analysis2.double(2)
+
+        assert analysis1.calls == 1
+        assert analysis2.calls == 1
+
+    def test_memoize_maxsize(self):
+        analysis = TestAnalysis()
+
+        analysis.triple(1)
+        analysis.triple(2)
+        analysis.triple(1)
+
+        assert analysis.calls == 3
+        assert analysis.memo_tables['triple'].maxsize == 1
+
+    def test_memo_tables_released_with_analysis(self):
+        analysis = TestAnalysis()
+        analysis.double(2)
+        analysis_ref = weakref.ref(analysis)
+
+        del analysis
+        gc.collect()
+
+        assert analysis_ref() is None
+
+    def test_clear_memo_tables(self):
+        analysis = TestAnalysis()
+        analysis.double(2)
+
+        analysis.clear_memo_tables()
+        analysis.double(2)
+
+        assert analysis.calls == 2
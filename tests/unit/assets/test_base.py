@@ -7,7 +7,8 @@ from snakepack.assets import (
     AssetContent,
     StringAssetContent, AssetGroup, AssetContentSource, FileContentSource, AssetContentCache
 )
-from snakepack.assets._base import T
+from snakepack.assets._base import T, ContentMemoryBudget
+from snakepack.assets.python import PythonModuleCst
 
 
 class AssetTypeTest:
@@ -39,6 +40,20 @@ class AssetTest:
 
         assert asset.content is new_content
 
+    def test_content_setter_with_budget(self, monkeypatch):
+        budget = ContentMemoryBudget(max_memory=1000)
+        monkeypatch.setattr(AssetContentCache, 'budget', budget)
+        orig_content = AssetContentCache(content_or_source=PythonModuleCst.from_string('x=5'))
+        asset = self.TestAsset(name='test', target_path=Path('./test.py'), content=orig_content, source=None)
+
+        new_content = PythonModuleCst.from_string('x=6')
+        asset.content = new_content
+
+        assert isinstance(asset.content, AssetContentCache)
+        assert asset.content.content is new_content
+        assert asset.content.source_size == 3
+        assert budget.memory == 3 * ContentMemoryBudget.BYTES_PER_SOURCE_BYTE
+
     def test_from_string(self, mocker):
         asset = self.TestAsset.from_string(name='test', target_path=Path('./test.py'), content='test')
 
@@ -196,3 +211,69 @@ class AssetContentCacheTest:
 
         assert casted_cache == cache
         assert str(casted_cache) == 'B'
+
+    def test_evict(self):
+        cache = AssetContentCache(content_or_source=PythonModuleCst.from_string('x = 5'))
+
+        cache.evict()
+
+        assert cache.evicted
+        assert str(cache) == 'x = 5'
+        assert cache.evicted
+        assert cache.cst.code == 'x = 5'
+        assert not cache.evicted
+
+    def test_budget_evicts_least_recently_used(self, monkeypatch):
+        budget = ContentMemoryBudget(max_memory=12 * ContentMemoryBudget.BYTES_PER_SOURCE_BYTE)
+        monkeypatch.setattr(AssetContentCache, 'budget', budget)
+        cache1 = AssetContentCache(content_or_source=PythonModuleCst.from_string('x = 5'))
+        cache2 = AssetContentCache(content_or_source=PythonModuleCst.from_string('y = 6'))
+        string_cache = AssetContentCache(content_or_source=StringAssetContent('z = 7'))
+
+        assert not cache1.evicted
+        assert budget.memory == 10 * ContentMemoryBudget.BYTES_PER_SOURCE_BYTE
+
+        cache1.cst
+        cache3 = AssetContentCache(content_or_source=PythonModuleCst.from_string('w = 8'))
+
+        assert cache2.evicted
+        assert not cache1.evicted
+        assert not cache3.evicted
+        assert not string_cache.evicted
+        assert budget.memory == 10 * ContentMemoryBudget.BYTES_PER_SOURCE_BYTE
+
+        cache2.cst
+
+        assert not cache2.evicted
+        assert cache1.evicted
+
+
+class ContentMemoryBudgetTest:
+    def test_touch(self, mocker):
+        budget = ContentMemoryBudget(max_memory=2 * ContentMemoryBudget.BYTES_PER_SOURCE_BYTE)
+        cache1 = mocker.MagicMock(spec=AssetContentCache)
+        cache2 = mocker.MagicMock(spec=AssetContentCache)
+
+        budget.touch(cache1, 2)
+        budget.touch(cache2, 1)
+
+        cache1.evict.assert_called_once_with()
+        cache2.evict.assert_not_called()
+        assert budget.memory == ContentMemoryBudget.BYTES_PER_SOURCE_BYTE
+
+    def test_touch_over_budget(self, mocker):
+        budget = ContentMemoryBudget(max_memory=1)
+        cache = mocker.MagicMock(spec=AssetContentCache)
+
+        budget.touch(cache, 2)
+
+        cache.evict.assert_not_called()
+
+    def test_release(self, mocker):
+        budget = ContentMemoryBudget(max_memory=1000)
+        cache = mocker.MagicMock(spec=AssetContentCache)
+        budget.touch(cache, 2)
+
+        budget.release(cache)
+
+        assert budget.memory == 0
@@ -1,3 +1,6 @@
+import ast
+import pickle
+
 import pytest
 from libcst import Module
 
@@ -18,6 +21,18 @@ class PythonModuleTest:
 
         assert module.name == 'some.test.module'
         assert module.content is content
+        assert module.origin is None
+
+    def test_init_origin(self, mocker):
+        content = mocker.MagicMock(spec=AssetContent)
+        module = PythonModule(
+            name='some.test.module',
+            content=content,
+            source=None,
+            origin=PythonModule.Origin.THIRD_PARTY
+        )
+
+        assert module.origin is PythonModule.Origin.THIRD_PARTY
 
     def test_matches_returns_true_when_selector_is_full_module_name(self, mocker):
         content = mocker.MagicMock(spec=AssetContent)
@@ -47,6 +62,23 @@ class PythonModuleTest:
 
         assert module.matches(selector)
 
+    def test_matches_returns_false_when_selector_is_module_name_prefix(self, mocker):
+        content = mocker.MagicMock(spec=AssetContent)
+        module = PythonModule(name='some.test.module2', content=content, source=None)
+        selector = mocker.MagicMock(spec=FullyQualifiedPythonName)
+        selector.has_module_path = True
+        selector.has_ident_path = False
+        selector.module_path = ['some', 'test', 'module']
+
+        assert not module.matches(selector)
+
+    def test_matches_returns_true_when_selector_is_glob(self, mocker):
+        content = mocker.MagicMock(spec=AssetContent)
+        module = PythonModule(name='some.test.module', content=content, source=None)
+        selector = FullyQualifiedPythonName('some.*.module')
+
+        assert module.matches(selector)
+
     def test_matches_returns_false_when_selector_is_other_module(self, mocker):
         content = mocker.MagicMock(spec=AssetContent)
         module = PythonModule(name='some.test.module', content=content, source=None)
@@ -69,22 +101,56 @@ class PythonModuleTest:
 
 
 class PythonModuleCstTest:
-    @pytest.mark.skip
     def test_init(self, mocker):
         cst = mocker.MagicMock(spec=Module)
         cst.code = 'x=5'
-        content = PythonModuleCst(cst=cst)
+        content = PythonModuleCst(cst=cst, copy=False)
 
         assert content.cst is cst
         assert str(content) == 'x=5'
+        cst.deep_clone.assert_not_called()
+
+    def test_init_copy(self, mocker):
+        cst = mocker.MagicMock(spec=Module)
+        content = PythonModuleCst(cst=cst)
+
+        assert content.cst is cst.deep_clone.return_value
 
-    @pytest.mark.skip
     def test_from_string(self, mocker):
-        parse_module_mock = mocker.patch('libcst.parse_module')
+        parse_module_mock = mocker.patch('snakepack.assets.python.parse_module')
         cst = parse_module_mock.return_value
         content = PythonModuleCst.from_string('x=5')
 
+        assert str(content) == 'x=5'
+        parse_module_mock.assert_not_called()
+        assert content.cst is cst
         assert content.cst is cst
+        parse_module_mock.assert_called_once_with('x=5')
+        cst.deep_clone.assert_not_called()
+
+    def test_ast(self, mocker):
+        parse_module_mock = mocker.patch('snakepack.assets.python.parse_module')
+        content = PythonModuleCst.from_string('x=5')
+
+        assert isinstance(content.ast, ast.Module)
+        assert content.ast is content.ast
+        assert content.ast.body[0].targets[0].id == 'x'
+        parse_module_mock.assert_not_called()
+
+    def test_pickle_drops_ast(self):
+        content = PythonModuleCst.from_string('x=5')
+        content.ast
+
+        unpickled_content = pickle.loads(pickle.dumps(content))
+
+        assert unpickled_content._ast is None
+        assert unpickled_content.ast.body[0].targets[0].id == 'x'
+
+    def test_metadata_wrapper(self):
+        content = PythonModuleCst.from_string('x=5')
+
+        assert content.metadata_wrapper is content.metadata_wrapper
+        assert content.metadata_wrapper.module is content.cst
 
 
 class PythonPackageTest:
@@ -1,7 +1,9 @@
-from snakepack.assets import Asset
+from snakepack.assets import Asset, AssetContent
+from snakepack.assets.python import PythonModule
 from snakepack.bundlers import Bundle
 from snakepack.bundlers._base import Bundler
 from snakepack.config.model import GlobalOptions
+from snakepack.config.types import FullyQualifiedPythonName
 from snakepack.loaders import Loader
 from snakepack.transformers import Transformer
 
@@ -33,6 +35,58 @@ class BundleTest:
 
         bundler.bundle.assert_called_once_with(bundle)
 
+    def test_load(self, mocker):
+        bundler = mocker.MagicMock(spec=Bundler)
+        loader = mocker.MagicMock(spec=Loader)
+
+        bundle = Bundle(name='bundle1', bundler=bundler, loader=loader, transformers=[])
+        bundle.load()
+
+        loader.load.assert_called_once_with(pass_through=bundle.passes_through)
+        assert bundle.asset_group is loader.load.return_value
+
+    def test_get_transformers(self, mocker):
+        bundler = mocker.MagicMock(spec=Bundler)
+        loader = mocker.MagicMock(spec=Loader)
+        transformer1 = mocker.MagicMock(spec=Transformer)
+        transformer1.options.excludes = [FullyQualifiedPythonName('pkg.vendor')]
+        transformer2 = mocker.MagicMock(spec=Transformer)
+        transformer2.options.excludes = [FullyQualifiedPythonName('pkg.*.tests')]
+        transformer3 = mocker.MagicMock(spec=Transformer)
+        transformer3.options.excludes = []
+        content = mocker.MagicMock(spec=AssetContent)
+
+        bundle = Bundle(
+            name='bundle1',
+            bundler=bundler,
+            loader=loader,
+            transformers=[transformer1, transformer2, transformer3]
+        )
+
+        assert bundle.get_transformers(PythonModule(name='pkg.module', content=content, source=None)) == [
+            transformer1, transformer2, transformer3
+        ]
+        assert bundle.get_transformers(PythonModule(name='pkg.vendor.module', content=content, source=None)) == [
+            transformer2, transformer3
+        ]
+        assert bundle.get_transformers(PythonModule(name='pkg.vendor.tests.test', content=content, source=None)) == [
+            transformer3
+        ]
+
+    def test_passes_through(self, mocker):
+        bundler = mocker.MagicMock(spec=Bundler)
+        loader = mocker.MagicMock(spec=Loader)
+        transformer1 = mocker.MagicMock(spec=Transformer)
+        transformer1.options.excludes = [FullyQualifiedPythonName('pkg.vendor')]
+        transformer2 = mocker.MagicMock(spec=Transformer)
+        transformer2.options.excludes = [FullyQualifiedPythonName('pkg.vendor'), FullyQualifiedPythonName('pkg.a')]
+        content = mocker.MagicMock(spec=AssetContent)
+
+        bundle = Bundle(name='bundle1', bundler=bundler, loader=loader, transformers=[transformer1, transformer2])
+
+        assert bundle.passes_through(PythonModule(name='pkg.vendor.module', content=content, source=None))
+        assert not bundle.passes_through(PythonModule(name='pkg.a', content=content, source=None))
+
 
 class BundlerTest:
     class TestBundler(Bundler):
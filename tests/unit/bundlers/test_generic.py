@@ -62,3 +62,34 @@ class FileBundlerTest:
 
         with open('dist/package1/somepackage/asset2.py') as f:
             assert f.read() == 'test=False'
+
+    def test_bundle_assets(self, mocker, fs):
+        fs.create_dir('dist/')
+        package = mocker.MagicMock(spec=Package)
+        package.target_path = Path('dist/package1')
+        global_options = mocker.MagicMock(spec=GlobalOptions)
+        bundler = FileBundler(global_options=global_options)
+
+        asset1 = mocker.MagicMock(spec=Asset)
+        content1 = mocker.MagicMock(spec=AssetContent)
+        content1.__str__.return_value = 'test=True'
+        asset1.content = content1
+        asset1.target_path = Path('asset1.py')
+
+        asset2 = mocker.MagicMock(spec=Asset)
+        content2 = mocker.MagicMock(spec=AssetContent)
+        content2.__str__.return_value = 'test=False'
+        asset2.content = content2
+        asset2.target_path = Path('asset2.py')
+
+        asset_group = mocker.MagicMock(spec=AssetGroup)
+        asset_group.deep_assets = [asset1, asset2]
+        bundle = mocker.MagicMock(spec=Bundle)
+        bundle.asset_group = asset_group
+
+        bundler.bundle(bundle, package=package, assets={asset2})
+
+        assert not os.path.exists('dist/package1/asset1.py')
+
+        with open('dist/package1/asset2.py') as f:
+            assert f.read() == 'test=False'
@@ -1,8 +1,12 @@
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from snakepack.bundlers import Bundler
 from snakepack.config.options import ComponentConfig
-from snakepack.config.model import SnakepackConfig, BundleConfig, PackageConfig
+from snakepack.config.model import SnakepackConfig, BundleConfig, PackageConfig, ExecutorConfig, ExecutorOptions
+from snakepack.config.types import ExecutorBackend
 from snakepack.loaders import Loader
 from snakepack.packagers import Packager
 from snakepack.transformers import Transformer
@@ -65,4 +69,17 @@ class SnakepackConfigTest:
 
         assert config.source_base_path == Path('./')
         assert config.target_base_path == Path('dist/')
-        assert config.packages == {}
\ No newline at end of file
+        assert config.packages == {}
+
+class ExecutorConfigTest:
+    def test_init(self):
+        config = ExecutorConfig(transform={'backend': 'fork', 'workers': 4}, package={'backend': 'thread'})
+
+        assert config.load is None
+        assert config.transform == ExecutorOptions(backend=ExecutorBackend.FORK, workers=4)
+        assert config.package.backend is ExecutorBackend.THREAD
+
+    @pytest.mark.parametrize('phase', ['load', 'package'])
+    def test_process_backend_not_supported(self, phase):
+        with pytest.raises(ValidationError):
+            ExecutorConfig(**{phase: {'backend': 'loky'}})
@@ -3,7 +3,7 @@ import sys
 
 import pytest
 
-from snakepack.config.types import PythonVersion, FullyQualifiedPythonName
+from snakepack.config.types import PythonVersion, FullyQualifiedPythonName, SelectorIndex
 
 
 class PythonVersionTest:
@@ -92,3 +92,39 @@ class FullyQualifiedPythonNameTest:
     def test_validate_separator_only(self):
         with pytest.raises(ValueError):
             fqn = FullyQualifiedPythonName(':')
+
+    def test_glob(self):
+        fqn = FullyQualifiedPythonName('pkg.*.tests')
+
+        assert fqn.module_path == ['pkg', '*', 'tests']
+        assert not fqn.has_ident_path
+
+    def test_match_module_path(self):
+        assert FullyQualifiedPythonName.match_module_path(['pkg'], ['pkg', 'module'])
+        assert FullyQualifiedPythonName.match_module_path(['pkg', 'module'], ['pkg', 'module'])
+        assert FullyQualifiedPythonName.match_module_path(['pkg', '*', 'tests'], ['pkg', 'sub', 'tests', 'test_a'])
+        assert FullyQualifiedPythonName.match_module_path(['pkg', 'test_*'], ['pkg', 'test_a'])
+        assert not FullyQualifiedPythonName.match_module_path(['pkg', 'module'], ['pkg', 'module2'])
+        assert not FullyQualifiedPythonName.match_module_path(['pkg', 'module'], ['pkg'])
+        assert not FullyQualifiedPythonName.match_module_path(['pkg', '*', 'tests'], ['pkg', 'tests'])
+
+
+class SelectorIndexTest:
+    def test_match(self):
+        index = SelectorIndex()
+        index.add(FullyQualifiedPythonName('pkg'), 1)
+        index.add(FullyQualifiedPythonName('pkg.module'), 2)
+        index.add(FullyQualifiedPythonName('pkg.*.tests'), 3)
+        index.add(FullyQualifiedPythonName('pkg.sub*'), 4)
+        index.add(FullyQualifiedPythonName('other'), 5)
+        index.add(FullyQualifiedPythonName('other.module:func'), 6)
+
+        assert index.match('pkg') == {1, 6}
+        assert index.match('pkg.module') == {1, 2, 6}
+        assert index.match('pkg.module2') == {1, 6}
+        assert index.match('pkg.module.tests.test_a') == {1, 2, 3, 6}
+        assert index.match('pkg.sub.tests') == {1, 3, 4, 6}
+        assert index.match('another') == {6}
+
+    def test_match_empty(self):
+        assert SelectorIndex().match('pkg.module') == set()
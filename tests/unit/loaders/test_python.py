@@ -1,5 +1,9 @@
+import json.decoder
+import os
+
+import snakepack
 from snakepack.config.model import GlobalOptions
-from snakepack.loaders.python import ImportGraphLoader
+from snakepack.loaders.python import ImportGraphLoader, _PathTrie, _StdlibIndex, _DirectoryScanner
 
 
 class ImportGraphLoaderTest:
@@ -17,3 +21,54 @@ class ImportGraphLoaderTest:
         loader = ImportGraphLoader(global_options=global_options, options=options)
 
         assert loader.options.exclude_stdlib is True
+
+
+class PathTrieTest:
+    def test_contains(self):
+        trie = _PathTrie([os.path.join(os.sep, 'usr', 'lib', 'python3.9'), os.path.join(os.sep, 'opt', 'lib')])
+
+        assert trie.contains(os.path.join(os.sep, 'usr', 'lib', 'python3.9', 'os.py'))
+        assert trie.contains(os.path.join(os.sep, 'usr', 'lib', 'python3.9', 'json', '__init__.py'))
+        assert trie.contains(os.path.join(os.sep, 'opt', 'lib', 'module.py'))
+        assert not trie.contains(os.path.join(os.sep, 'usr', 'lib', 'python3.9'))
+        assert not trie.contains(os.path.join(os.sep, 'usr', 'lib', 'module.py'))
+        assert not trie.contains(os.path.join(os.sep, 'opt', 'library', 'module.py'))
+        assert not trie.contains(os.path.join(os.sep, 'home', 'module.py'))
+
+
+class StdlibIndexTest:
+    def test_for_version(self):
+        assert _StdlibIndex.for_version('3.9') is _StdlibIndex.for_version('3.9')
+        assert _StdlibIndex.for_version('3.9') is not _StdlibIndex.for_version('3.8')
+
+    def test_is_stdlib(self):
+        index = _StdlibIndex.for_version('3.9')
+
+        assert index.is_stdlib('json', json.__file__)
+        assert index.is_stdlib('json.decoder', json.decoder.__file__)
+        assert not index.is_stdlib('snakepack', snakepack.__file__)
+        assert not index.is_stdlib('json', os.path.join(os.sep, 'nonexistent', 'json', '__init__.py'))
+
+
+class DirectoryScannerTest:
+    def test_scan(self, tmp_path):
+        (tmp_path / 'pkg' / 'sub' / 'deeper').mkdir(parents=True)
+        (tmp_path / 'pkg' / '__pycache__').mkdir()
+        (tmp_path / 'pkg' / '__init__.py').write_text('')
+        (tmp_path / 'pkg' / 'data.txt').write_text('')
+        (tmp_path / 'pkg' / 'sub' / 'deeper' / 'data.txt').write_text('')
+
+        with _DirectoryScanner(max_workers=2) as scanner:
+            directory = scanner.scan(tmp_path / 'pkg')
+            subdirectory = scanner.get_subdirectories(directory)[0]
+
+            assert directory.path == str(tmp_path / 'pkg')
+            assert directory.name == 'pkg'
+            assert directory.files == ['__init__.py', 'data.txt']
+            assert directory.subdirectory_paths == [str(tmp_path / 'pkg' / 'sub')]
+            assert directory.is_package
+            assert subdirectory.name == 'sub'
+            assert subdirectory.files == []
+            assert not subdirectory.is_package
+            assert scanner.scan(tmp_path / 'pkg' / 'sub') is subdirectory
+            assert scanner.get_subdirectories(subdirectory)[0].files == ['data.txt']
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from snakepack.cache import BuildCache
+
+
+class BuildCacheTest:
+    def test_init(self):
+        cache = BuildCache(path=Path('cache/'))
+
+        assert cache.path == Path('cache/')
+
+    def test_create_key(self):
+        key = BuildCache.create_key('0.1.0', '3.9', b'x=5')
+
+        assert key == BuildCache.create_key('0.1.0', '3.9', b'x=5')
+        assert key != BuildCache.create_key('0.1.0', '3.9', b'x=6')
+        assert key != BuildCache.create_key('0.1.0', '3.10', b'x=5')
+
+    def test_create_key_part_boundaries(self):
+        assert BuildCache.create_key('ab', 'c') != BuildCache.create_key('a', 'bc')
+
+    def test_store_and_load(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+        key = BuildCache.create_key('test')
+
+        cache.store(key, 'x=5')
+
+        assert cache.load(key) == 'x=5'
+
+    def test_load_cache_miss(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+
+        assert cache.load(BuildCache.create_key('test')) is None
+
+    def test_store_and_load_import_graph(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+        key = BuildCache.create_key('test')
+
+        cache.store_import_graph(key, {'resolved_names': {'pkg': None}})
+
+        assert cache.load_import_graph(key) == {'resolved_names': {'pkg': None}}
+
+    def test_load_import_graph_cache_miss(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+
+        assert cache.load_import_graph(BuildCache.create_key('test')) is None
+
+    def test_store_and_load_task_costs(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+
+        cache.store_task_costs({'pkg.module': 0.5})
+
+        assert cache.load_task_costs() == {'pkg.module': 0.5}
+
+    def test_load_task_costs_cache_miss(self, fs):
+        cache = BuildCache(path=Path('cache/'))
+
+        assert cache.load_task_costs() == {}
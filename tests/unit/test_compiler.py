@@ -0,0 +1,185 @@
+import os
+from functools import partial
+from logging import getLogger
+
+import pytest
+
+from snakepack.compiler import Compiler, Task, SynchronousExecutor, ConcurrentExecutor, _AssetWriter
+from snakepack.analyzers.python.imports import ImportGraphAnalyzer
+from snakepack.assets.python import PythonModule, PythonModuleCst
+from snakepack.config.model import GlobalOptions
+from snakepack.report import BuildReport
+from snakepack.trace import Trace
+from snakepack.transformers.python import RemoveCommentsTransformer, RenameIdentifiersTransformer
+from snakepack.transformers.python._base import BatchPythonModuleTransformer
+
+
+class CompilerTest:
+    def test_transform_source(self):
+        global_options = GlobalOptions()
+        transformer = BatchPythonModuleTransformer(
+            [RemoveCommentsTransformer(global_options=global_options)],
+            global_options=global_options
+        )
+
+        output = Compiler._transform_source(name='test', source='# comment\nx=5\n', transformers=[transformer])
+
+        assert output == '\nx=5\n'
+
+    def test_transform_source_reported(self):
+        global_options = GlobalOptions()
+        transformer = BatchPythonModuleTransformer(
+            [RemoveCommentsTransformer(global_options=global_options)],
+            global_options=global_options
+        )
+
+        output, report = Compiler._transform_source_reported(
+            name='test',
+            source='# comment\nx=5\n',
+            transformers=[transformer]
+        )
+
+        assert output == '\nx=5\n'
+        assert set(report.measurements[BuildReport.MODULES]) == {'test'}
+        assert set(report.measurements[BuildReport.TRANSFORMERS]) == {'remove_comments'}
+
+    def test_transform_source_reported_memo_tables(self):
+        global_options = GlobalOptions()
+        transformer = BatchPythonModuleTransformer(
+            [RenameIdentifiersTransformer(global_options=global_options)],
+            global_options=global_options
+        )
+
+        output, report = Compiler._transform_source_reported(
+            name='test',
+            source='def f(argument):\n    variable = argument\n    return variable\n',
+            transformers=[transformer],
+            import_analysis=ImportGraphAnalyzer.SnapshotAnalysis(
+                import_graph_known=False,
+                importers={},
+                imported_identifiers={'test': frozenset()}
+            )
+        )
+
+        assert 'ScopeAnalyzer.is_attribute' in report.memo_tables
+        assert report.memo_tables['ScopeAnalyzer.is_attribute'].misses > 0
+
+    def test_transform_forked_asset(self, monkeypatch):
+        global_options = GlobalOptions()
+        transformer = BatchPythonModuleTransformer(
+            [RemoveCommentsTransformer(global_options=global_options)],
+            global_options=global_options
+        )
+        asset = PythonModule(name='test', content=PythonModuleCst.from_string('# comment\nx=5\n'), source=None)
+        monkeypatch.setattr(Compiler, '_forked_assets', [(asset, [transformer], None)])
+
+        output, report = Compiler._transform_forked_asset(index=0, reported=True)
+
+        assert output == '\nx=5\n'
+        assert set(report.measurements[BuildReport.MODULES]) == {'test'}
+
+
+class AssetWriterTest:
+    def test_write(self, mocker):
+        package = mocker.MagicMock()
+        bundle = mocker.MagicMock()
+        assets = [mocker.MagicMock(), mocker.MagicMock()]
+
+        with _AssetWriter(max_pending=1) as writer:
+            for asset in assets:
+                writer.write(package, bundle, asset)
+
+        assert bundle.bundle.call_args_list == [
+            mocker.call(package=package, assets=[asset])
+            for asset in assets
+        ]
+
+    def test_write_raises_error(self, mocker):
+        bundle = mocker.MagicMock()
+        bundle.bundle.side_effect = OSError('disk full')
+
+        with pytest.raises(OSError):
+            with _AssetWriter(max_pending=1) as writer:
+                writer.write(mocker.MagicMock(), bundle, mocker.MagicMock())
+
+
+class ConcurrentExecutorTest:
+    def test_execute_parallel_returns_results(self):
+        logger = getLogger('snakepack')
+        executor = ConcurrentExecutor(logger=logger)
+        tasks = [
+            Task(start_msg='', complete_msg='', fail_msg='', callable=partial(pow, 2, exponent))
+            for exponent in range(3)
+        ]
+
+        results = list(executor.execute(tasks, parallel=True))
+
+        assert [result.result for result in results] == [1, 2, 4]
+
+    def test_execute_parallel_ignores_errors(self):
+        logger = getLogger('snakepack')
+        executor = ConcurrentExecutor(logger=logger)
+        tasks = [
+            Task(start_msg='', complete_msg='', fail_msg='', callable=partial(divmod, 1, 0))
+        ]
+
+        results = list(executor.execute(tasks, parallel=True, ignore_errors=True))
+
+        assert results == [None]
+
+    def test_execute_parallel_chunks(self):
+        logger = getLogger('snakepack')
+        executor = ConcurrentExecutor(logger=logger)
+        tasks = [
+            Task(start_msg='', complete_msg='', fail_msg='', callable=partial(divmod, 1, divisor))
+            for divisor in range(100)
+        ]
+
+        results = list(executor.execute(tasks, parallel=True, ignore_errors=True))
+
+        assert results[0] is None
+        assert [result.result for result in results[1:]] == [divmod(1, divisor) for divisor in range(1, 100)]
+
+    def test_plan_chunks(self):
+        tasks = [
+            Task(start_msg='', complete_msg='', fail_msg='', cost=cost)
+            for cost in [1, 10, 1, 1, 5, 2]
+        ]
+
+        chunks = ConcurrentExecutor._plan_chunks(tasks, num_chunks=4)
+
+        assert chunks == [[1], [4], [5, 0, 2, 3]]
+
+
+class ExecutorTraceTest:
+    def test_synchronous_executor_traces_tasks(self):
+        trace = Trace()
+        executor = SynchronousExecutor(logger=getLogger('snakepack'), trace=trace)
+        tasks = [
+            Task(
+                start_msg='# Nested',
+                complete_msg='',
+                fail_msg='',
+                nested_tasks=[Task(start_msg='... Task', complete_msg='', fail_msg='', callable=partial(pow, 2, 2))]
+            )
+        ]
+
+        list(executor.execute(tasks))
+
+        assert [event['name'] for event in trace.events] == ['Task', 'Nested']
+        assert all(event['pid'] == os.getpid() for event in trace.events)
+
+    def test_concurrent_executor_traces_worker_processes(self):
+        logger = getLogger('snakepack')
+        trace = Trace()
+        executor = ConcurrentExecutor(logger=logger, trace=trace)
+        tasks = [
+            Task(start_msg='... Task', complete_msg='', fail_msg='', callable=partial(pow, 2, exponent))
+            for exponent in range(3)
+        ]
+
+        list(executor.execute(tasks, parallel=True))
+
+        assert len(trace.events) == 3
+        assert all(event['pid'] != os.getpid() for event in trace.events)
+        assert all(event['dur'] >= 0 for event in trace.events)
@@ -0,0 +1,91 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+from snakepack.report import BuildReport
+
+
+class BuildReportTest:
+    def test_measure(self):
+        report = BuildReport()
+
+        with report.measure(BuildReport.MODULES, 'test'):
+            data = [0] * 100000
+
+        measurement = report.measurements[BuildReport.MODULES]['test']
+
+        assert measurement.count == 1
+        assert measurement.wall_time > 0
+        assert measurement.cpu_time >= 0
+        assert measurement.peak_memory >= 100000 * 8
+        assert not tracemalloc.is_tracing()
+
+    def test_measure_nested(self):
+        report = BuildReport()
+
+        with report.measure(BuildReport.PHASES, 'outer'):
+            with report.measure(BuildReport.MODULES, 'inner'):
+                data = [0] * 100000
+
+            del data
+
+        outer_measurement = report.measurements[BuildReport.PHASES]['outer']
+        inner_measurement = report.measurements[BuildReport.MODULES]['inner']
+
+        assert outer_measurement.wall_time >= inner_measurement.wall_time
+        assert outer_measurement.peak_memory >= inner_measurement.peak_memory
+
+    def test_record_combines_measurements(self):
+        report = BuildReport()
+
+        report.record(BuildReport.TRANSFORMERS, 'test', BuildReport.Measurement(wall_time=1.0, cpu_time=0.5, peak_memory=10))
+        report.record(BuildReport.TRANSFORMERS, 'test', BuildReport.Measurement(wall_time=2.0, cpu_time=1.5, peak_memory=5))
+
+        assert report.to_dict() == {
+            BuildReport.TRANSFORMERS: {
+                'test': {'count': 2, 'wall_time': 3.0, 'cpu_time': 2.0, 'peak_memory': 10}
+            }
+        }
+
+    def test_merge(self):
+        report = BuildReport()
+        worker_report = BuildReport()
+
+        report.record(BuildReport.MODULES, 'a', BuildReport.Measurement(wall_time=1.0, cpu_time=1.0, peak_memory=1))
+        worker_report.record(BuildReport.MODULES, 'b', BuildReport.Measurement(wall_time=2.0, cpu_time=2.0, peak_memory=2))
+
+        report.merge(worker_report)
+
+        assert set(report.measurements[BuildReport.MODULES]) == {'a', 'b'}
+
+    def test_record_memo_table(self):
+        report = BuildReport()
+        worker_report = BuildReport()
+
+        report.record_memo_table('ScopeAnalyzer.is_attribute', BuildReport.MemoTableStatistics(hits=1, misses=2))
+        worker_report.record_memo_table('ScopeAnalyzer.is_attribute', BuildReport.MemoTableStatistics(hits=5, misses=0))
+        report.merge(worker_report)
+
+        assert report.to_dict() == {
+            BuildReport.MEMO_TABLES: {
+                'ScopeAnalyzer.is_attribute': {'hits': 6, 'misses': 2, 'hit_rate': 0.75}
+            }
+        }
+
+    def test_get_slowest(self):
+        report = BuildReport()
+
+        for name, wall_time in [('a', 1.0), ('b', 3.0), ('c', 2.0)]:
+            report.record(BuildReport.MODULES, name, BuildReport.Measurement(wall_time=wall_time, cpu_time=0.0, peak_memory=0))
+
+        assert [name for name, _ in report.get_slowest(BuildReport.MODULES, 2)] == ['b', 'c']
+        assert report.get_slowest(BuildReport.ANALYZERS, 2) == []
+
+    def test_write(self, fs):
+        report = BuildReport()
+        report.record(BuildReport.PHASES, 'load_assets', BuildReport.Measurement(wall_time=1.0, cpu_time=1.0, peak_memory=1))
+
+        report.write(Path('report.json'))
+
+        with open('report.json') as f:
+            assert json.load(f) == report.to_dict()
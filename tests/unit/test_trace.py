@@ -0,0 +1,42 @@
+import json
+import os
+from pathlib import Path
+
+from snakepack.trace import Trace
+
+
+class TraceTest:
+    def test_add_span(self):
+        trace = Trace()
+
+        trace.add_span(name='test', start_time=1.0, end_time=1.5, pid=123)
+
+        assert trace.events == [
+            {'name': 'test', 'cat': 'task', 'ph': 'X', 'ts': 1e6, 'dur': 0.5e6, 'pid': 123, 'tid': 123}
+        ]
+
+    def test_to_dict_names_process_tracks(self):
+        trace = Trace()
+
+        trace.add_span(name='test', start_time=1.0, end_time=2.0, pid=os.getpid())
+        trace.add_span(name='test', start_time=1.0, end_time=2.0, pid=os.getpid() + 1)
+
+        process_names = {
+            event['pid']: event['args']['name']
+            for event in trace.to_dict()['traceEvents']
+            if event['ph'] == 'M'
+        }
+
+        assert process_names == {
+            os.getpid(): 'snakepack',
+            os.getpid() + 1: f'snakepack worker {os.getpid() + 1}'
+        }
+
+    def test_write(self, fs):
+        trace = Trace()
+        trace.add_span(name='test', start_time=1.0, end_time=2.0, pid=123)
+
+        trace.write(Path('trace.json'))
+
+        with open('trace.json') as f:
+            assert json.load(f) == trace.to_dict()
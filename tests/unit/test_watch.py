@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+from snakepack.watch import PollingFileWatcher, InotifyFileWatcher, create_file_watcher, FileWatcher
+
+
+class PollingFileWatcherTest:
+    def test_wait(self, tmp_path):
+        watched_file = tmp_path / 'a.py'
+        watched_file.write_text('x = 5')
+        other_file = tmp_path / 'b.py'
+        watcher = PollingFileWatcher(interval=0.01)
+
+        watcher.watch([watched_file])
+        other_file.write_text('y = 6')
+        watched_file.write_text('x = 10')
+
+        assert watcher.wait() == {watched_file.resolve()}
+
+    def test_wait_deleted_file(self, tmp_path):
+        watched_file = tmp_path / 'a.py'
+        watched_file.write_text('x = 5')
+        watcher = PollingFileWatcher(interval=0.01)
+
+        watcher.watch([watched_file])
+        watched_file.unlink()
+
+        assert watcher.wait() == {watched_file.resolve()}
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='inotify is only available on Linux')
+class InotifyFileWatcherTest:
+    def test_wait(self, tmp_path):
+        watched_file = tmp_path / 'a.py'
+        watched_file.write_text('x = 5')
+        other_file = tmp_path / 'b.py'
+        watcher = InotifyFileWatcher()
+
+        try:
+            watcher.watch([watched_file])
+            other_file.write_text('y = 6')
+            watched_file.write_text('x = 10')
+
+            assert watcher.wait() == {watched_file.resolve()}
+        finally:
+            watcher.close()
+
+
+class CreateFileWatcherTest:
+    def test_create_file_watcher(self):
+        watcher = create_file_watcher()
+
+        try:
+            assert isinstance(watcher, FileWatcher)
+        finally:
+            watcher.close()
@@ -0,0 +1,144 @@
+import inspect
+import timeit
+
+from libcst import Name, parse_module
+
+from snakepack.analyzers.python.literals import LiteralDuplicationAnalyzer
+from snakepack.analyzers.python.scope import ScopeAnalyzer
+from snakepack.assets.python import PythonModule, PythonModuleCst
+from snakepack.config.model import GlobalOptions
+import snakepack.compiler
+from snakepack.transformers.python import RemoveCommentsTransformer, RemoveAssertionsTransformer, \
+    HoistLiteralsTransformer, RenameIdentifiersTransformer, RemoveAnnotationsTransformer, RemoveWhitespaceTransformer, \
+    RemoveSemicolonsTransformer, RemovePassTransformer, RemoveObjectBaseTransformer, \
+    RemoveParameterSeparatorsTransformer
+from snakepack.transformers.python._base import BatchPythonModuleTransformer, PythonModuleTransformer
+
+
+class BatchPythonModuleTransformerTest:
+    def test_plan_passes(self):
+        global_options = GlobalOptions()
+        remove_annotations = RemoveAnnotationsTransformer(global_options=global_options)
+        hoist_literals = HoistLiteralsTransformer(global_options=global_options)
+        rename_identifiers = RenameIdentifiersTransformer(global_options=global_options)
+        remove_comments = RemoveCommentsTransformer(global_options=global_options)
+        remove_assertions = RemoveAssertionsTransformer(global_options=global_options)
+
+        passes = BatchPythonModuleTransformer.plan_passes(
+            [remove_annotations, hoist_literals, rename_identifiers, remove_comments, remove_assertions],
+            global_options=global_options
+        )
+
+        assert [batch.transformers for batch in passes] == [
+            [remove_annotations],
+            [hoist_literals],
+            [rename_identifiers, remove_comments, remove_assertions]
+        ]
+        assert passes[1].REQUIRED_ANALYZERS == [ScopeAnalyzer, LiteralDuplicationAnalyzer]
+        assert passes[2].INVALIDATED_ANALYZERS == [ScopeAnalyzer, LiteralDuplicationAnalyzer]
+
+    def test_plan_passes_without_transformers(self):
+        assert BatchPythonModuleTransformer.plan_passes([], global_options=GlobalOptions()) == []
+
+    def test_transform_suppresses_children_per_transformer(self):
+        visited_names = []
+
+        class _SkipCallsTransformer(PythonModuleTransformer):
+            class _CstTransformer(PythonModuleTransformer._CstTransformer):
+                def visit_Call(self, node):
+                    return False
+
+                def visit_Name(self, node):
+                    visited_names.append(node.value)
+
+        class _RenameTransformer(PythonModuleTransformer):
+            class _CstTransformer(PythonModuleTransformer._CstTransformer):
+                def leave_Name(self, original_node, updated_node):
+                    return updated_node.with_changes(value=updated_node.value.upper())
+
+        global_options = GlobalOptions()
+        batch_transformer = BatchPythonModuleTransformer(
+            [_SkipCallsTransformer(global_options=global_options), _RenameTransformer(global_options=global_options)],
+            global_options=global_options
+        )
+        subject = PythonModule(name='test', content=PythonModuleCst(cst=parse_module('x = foo(y)\n')), source=None)
+
+        batch_transformer.transform(analyses={}, subject=subject)
+
+        assert visited_names == ['x']
+        assert str(subject.content) == 'X = FOO(Y)\n'
+
+    def test_dispatch_table_skips_unhandled_node_types(self):
+        global_options = GlobalOptions()
+        batch_transformer = BatchPythonModuleTransformer(
+            [
+                RemoveAssertionsTransformer(global_options=global_options),
+                RemoveSemicolonsTransformer(global_options=global_options)
+            ],
+            global_options=global_options
+        )
+
+        assert batch_transformer._visit_dispatch == {}
+        assert batch_transformer._leave_dispatch == {
+            'Assert': [(0, 'leave_Assert')],
+            'SimpleStatementLine': [(1, 'leave_SimpleStatementLine')]
+        }
+
+    def test_dispatch_table_speedup(self):
+        class _GetattrDispatchCstTransformer(BatchPythonModuleTransformer._CstTransformer):
+            def on_visit(self, node):
+                for transformer in self._transformers:
+                    visit_func = getattr(transformer, f"visit_{type(node).__name__}", None)
+
+                    if visit_func is not None:
+                        visit_func(node)
+
+                return True
+
+            def on_leave(self, original_node, updated_node):
+                for transformer in self._transformers:
+                    leave_func = getattr(transformer, f"leave_{type(original_node).__name__}", None)
+
+                    if leave_func is not None and type(updated_node) is type(original_node):
+                        updated_node = leave_func(original_node, updated_node)
+
+                return updated_node
+
+        global_options = GlobalOptions()
+        batch_transformer = BatchPythonModuleTransformer(
+            [
+                RemoveCommentsTransformer(global_options=global_options),
+                RemoveAssertionsTransformer(global_options=global_options),
+                RemoveWhitespaceTransformer(global_options=global_options),
+                RemoveSemicolonsTransformer(global_options=global_options),
+                RemovePassTransformer(global_options=global_options),
+                RemoveObjectBaseTransformer(global_options=global_options),
+                RemoveParameterSeparatorsTransformer(global_options=global_options)
+            ],
+            global_options=global_options
+        )
+        subject = PythonModule(
+            name='test',
+            content=PythonModuleCst(cst=parse_module(inspect.getsource(snakepack.compiler))),
+            source=None
+        )
+
+        def visit(cst_transformer_class):
+            cst_transformer = cst_transformer_class(
+                subject=subject,
+                options=batch_transformer.options,
+                analyses={},
+                transformer=batch_transformer,
+                transformers=[
+                    transformer.create_cst_transformer(subject, {})
+                    for transformer in batch_transformer.transformers
+                ],
+                visit_dispatch=batch_transformer._visit_dispatch,
+                leave_dispatch=batch_transformer._leave_dispatch
+            )
+            subject.content.cst.visit(cst_transformer)
+
+        getattr_time = min(timeit.repeat(lambda: visit(_GetattrDispatchCstTransformer), number=1, repeat=5))
+        dispatch_table_time = min(timeit.repeat(lambda: visit(BatchPythonModuleTransformer._CstTransformer), number=1, repeat=5))
+
+        assert dispatch_table_time < getattr_time